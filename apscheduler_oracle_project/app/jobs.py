@@ -4,6 +4,8 @@ Provides functions to execute Bash scripts and Python modules dynamically.
 """
 
 import importlib.util
+import os
+import signal
 import subprocess
 import sys
 from pathlib import Path
@@ -13,6 +15,39 @@ from app.logger import get_logger
 
 logger = get_logger("jobs")
 
+# Maximum wall-clock time for a Bash job, in seconds
+BASH_JOB_TIMEOUT = 300
+
+
+def _run_process_group(cmd: List[str], timeout: int) -> subprocess.CompletedProcess:
+    """
+    Run a command in its own process group, killing the whole group on timeout.
+
+    subprocess.run() only kills the direct child when the timeout expires, so
+    any background processes started by the script keep running and can hold
+    the output pipes open. Starting a new session lets us signal them all.
+
+    Args:
+        cmd: Command and arguments to execute
+        timeout: Timeout in seconds
+
+    Returns:
+        CompletedProcess with decoded stdout/stderr
+
+    Raises:
+        subprocess.TimeoutExpired: If the command did not finish in time
+    """
+    with subprocess.Popen(
+        cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, start_new_session=True
+    ) as process:
+        try:
+            stdout, stderr = process.communicate(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            os.killpg(process.pid, signal.SIGKILL)
+            process.communicate()
+            raise
+    return subprocess.CompletedProcess(cmd, process.returncode, stdout, stderr)
+
 
 def execute_bash_job(script_path: str, args: List[str] = None) -> Dict[str, Any]:
     """
@@ -53,9 +88,7 @@ def execute_bash_job(script_path: str, args: List[str] = None) -> Dict[str, Any]
     logger.info(f"Executing Bash script: {script_path} with args: {args}")
 
     try:
-        result = subprocess.run(
-            cmd, capture_output=True, text=True, timeout=300  # 5 minutes timeout
-        )
+        result = _run_process_group(cmd, timeout=BASH_JOB_TIMEOUT)
 
         success = result.returncode == 0
 
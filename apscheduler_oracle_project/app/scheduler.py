@@ -3,21 +3,63 @@ Scheduler setup and job management with Oracle database backend.
 Handles APScheduler configuration, job store, and job lifecycle management.
 """
 
+import concurrent.futures
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
 from app.config import Config
 from app.jobs import execute_job
 from app.logger import get_logger
-from apscheduler.executors.pool import ThreadPoolExecutor
+from apscheduler.executors.pool import BasePoolExecutor
 from apscheduler.jobstores.sqlalchemy import SQLAlchemyJobStore
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.date import DateTrigger
 from pytz import timezone as pytz_timezone
+from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import StaticPool
 
 logger = get_logger("scheduler")
 
 
+def _create_engine(db_uri: str) -> Engine:
+    """
+    Create the SQLAlchemy engine for one SchedulerManager's job store.
+
+    Each manager owns its engine: the job store disposes it on shutdown, so
+    an engine shared between managers would be torn down under the others.
+
+    Args:
+        db_uri: Database connection URI
+
+    Returns:
+        SQLAlchemy engine for the URI
+    """
+    if db_uri.startswith("sqlite") and ":memory:" in db_uri:
+        # A single shared connection so every thread sees the same in-memory database
+        return create_engine(
+            db_uri, poolclass=StaticPool, connect_args={"check_same_thread": False}
+        )
+    return create_engine(db_uri)
+
+
+class _CancellingThreadPoolExecutor(BasePoolExecutor):
+    """
+    Thread pool executor whose non-waiting shutdown also cancels queued jobs.
+
+    APScheduler's ThreadPoolExecutor leaves queued jobs to run after
+    shutdown(wait=False), keeping worker threads alive; repeated start/shutdown
+    cycles in the same process then accumulate threads. Jobs already running
+    are not waited for.
+    """
+
+    def __init__(self, max_workers: int = 10):
+        super().__init__(concurrent.futures.ThreadPoolExecutor(int(max_workers)))
+
+    def shutdown(self, wait: bool = True):
+        self._pool.shutdown(wait, cancel_futures=not wait)
+
+
 class SchedulerManager:
     """
     Manages the APScheduler instance with Oracle database backend.
@@ -41,10 +83,10 @@ class SchedulerManager:
         """Initialize APScheduler with Oracle job store."""
         try:
             # Configure job store
-            jobstores = {"default": SQLAlchemyJobStore(url=self.db_uri)}
+            jobstores = {"default": SQLAlchemyJobStore(engine=_create_engine(self.db_uri))}
 
             # Configure executors
-            executors = {"default": ThreadPoolExecutor(max_workers=10)}
+            executors = {"default": _CancellingThreadPoolExecutor(max_workers=10)}
 
             # Create scheduler
             self.scheduler = BackgroundScheduler(
@@ -73,7 +115,8 @@ class SchedulerManager:
         Shutdown the scheduler.
 
         Args:
-            wait: If True, wait for all jobs to complete before shutting down
+            wait: If True, wait for all jobs to complete before shutting down;
+                if False, return immediately and cancel jobs not yet started
         """
         if self.scheduler.running:
             self.scheduler.shutdown(wait=wait)
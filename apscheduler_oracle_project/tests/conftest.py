@@ -0,0 +1,12 @@
+"""
+Pytest configuration file.
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root to Python path once for all test modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+# Warm the import cache before test collection
+from app import jobs, scheduler  # noqa: E402,F401
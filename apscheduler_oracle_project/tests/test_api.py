@@ -3,18 +3,13 @@ Unit tests for REST API endpoints.
 """
 
 import json
-import sys
 from datetime import datetime, timedelta
-from pathlib import Path
 
 import pytest
 from pytz import UTC
 
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
-from app.api import app, init_app  # noqa: E402
-from app.scheduler import SchedulerManager  # noqa: E402
+from app.api import app, init_app
+from app.scheduler import SchedulerManager
 
 
 @pytest.fixture
@@ -2,46 +2,51 @@
 Unit tests for job execution (Bash and Python scripts).
 """
 
+import signal
 import subprocess
-import sys
-from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
-from app.jobs import execute_bash_job, execute_job, execute_python_job  # noqa: E402
+from app.jobs import (
+    BASH_JOB_TIMEOUT,
+    execute_bash_job,
+    execute_job,
+    execute_python_job,
+)
 
 
 class TestBashJobExecution:
     """Tests for Bash script execution."""
 
-    @pytest.fixture
-    def temp_bash_script(self, tmp_path):
-        """Create a temporary Bash script for testing."""
+    @pytest.fixture(
+        params=[
+            ("#!/bin/bash\necho 'Hello from Bash'\nexit 0", 0, "Hello from Bash", ""),
+            ("#!/bin/bash\necho 'Error' >&2\nexit 1", 1, "", "Error"),
+        ],
+        ids=["ok", "fail"],
+    )
+    def bash_script_case(self, request, tmp_path):
+        """Create a temporary Bash script and return it with its expected results."""
+        content, expected_rc, expected_out, expected_err = request.param
         script = tmp_path / "test_script.sh"
-        script.write_text("#!/bin/bash\necho 'Hello from Bash'\nexit 0")
+        script.write_text(content)
         script.chmod(0o755)
-        return script
+        return script, expected_rc, expected_out, expected_err
 
-    @pytest.fixture
-    def temp_failing_bash_script(self, tmp_path):
-        """Create a temporary failing Bash script for testing."""
-        script = tmp_path / "test_failing_script.sh"
-        script.write_text("#!/bin/bash\necho 'Error' >&2\nexit 1")
-        script.chmod(0o755)
-        return script
+    def test_execute_bash_job_result(self, bash_script_case):
+        """Test Bash script execution for successful and failing scripts."""
+        script, expected_rc, expected_out, expected_err = bash_script_case
 
-    def test_execute_bash_job_success(self, temp_bash_script):
-        """Test successful Bash script execution."""
-        result = execute_bash_job(str(temp_bash_script))
+        result = execute_bash_job(str(script))
 
-        assert result["success"] is True
-        assert result["returncode"] == 0
-        assert "Hello from Bash" in result["stdout"]
-        assert result["stderr"] == ""
+        assert result["success"] is (expected_rc == 0)
+        assert result["returncode"] == expected_rc
+        assert expected_out in result["stdout"]
+        if expected_err:
+            assert expected_err in result["stderr"]
+        else:
+            assert result["stderr"] == ""
 
     def test_execute_bash_job_with_args(self, tmp_path):
         """Test Bash script execution with arguments."""
@@ -54,14 +59,6 @@ class TestBashJobExecution:
         assert result["success"] is True
         assert "arg1 arg2" in result["stdout"]
 
-    def test_execute_bash_job_failure(self, temp_failing_bash_script):
-        """Test Bash script execution that fails."""
-        result = execute_bash_job(str(temp_failing_bash_script))
-
-        assert result["success"] is False
-        assert result["returncode"] == 1
-        assert "Error" in result["stderr"]
-
     def test_execute_bash_job_file_not_found(self):
         """Test Bash script execution with non-existent file."""
         with pytest.raises(FileNotFoundError):
@@ -73,10 +70,20 @@ class TestBashJobExecution:
         script.write_text("#!/bin/bash\nsleep 10")
         script.chmod(0o755)
 
-        with patch("app.jobs.subprocess.run") as mock_run:
-            mock_run.side_effect = subprocess.TimeoutExpired("bash", 300)
+        with patch("app.jobs.subprocess.Popen") as mock_popen, patch(
+            "app.jobs.os.killpg"
+        ) as mock_killpg:
+            process = mock_popen.return_value.__enter__.return_value
+            process.pid = 4242
+            process.communicate.side_effect = [
+                subprocess.TimeoutExpired("bash", BASH_JOB_TIMEOUT),
+                ("", ""),
+            ]
             result = execute_bash_job(str(script))
 
+            assert mock_popen.call_args.kwargs["start_new_session"] is True
+            assert process.communicate.call_args_list[0].kwargs["timeout"] == BASH_JOB_TIMEOUT
+            mock_killpg.assert_called_once_with(4242, signal.SIGKILL)
             assert result["success"] is False
             assert result["returncode"] == -1
             assert "error" in result
@@ -191,22 +198,28 @@ class TestExecuteJob:
         script.write_text("def main():\n    return 'test'")
         return script
 
-    def test_execute_job_bash(self, temp_bash_script):
+    @patch("app.jobs.execute_bash_job", return_value={"success": True})
+    def test_execute_job_bash(self, mock_bash, temp_bash_script):
         """Test execute_job with bash type."""
         result = execute_job("bash", str(temp_bash_script))
         assert result["success"] is True
+        mock_bash.assert_called_once_with(str(temp_bash_script), None)
 
-    def test_execute_job_python(self, temp_python_script):
+    @patch("app.jobs.execute_python_job", return_value={"success": True})
+    def test_execute_job_python(self, mock_python, temp_python_script):
         """Test execute_job with python type."""
         result = execute_job("python", str(temp_python_script))
         assert result["success"] is True
+        mock_python.assert_called_once_with(str(temp_python_script), None)
 
     def test_execute_job_invalid_type(self, temp_bash_script):
         """Test execute_job with invalid job type."""
         with pytest.raises(ValueError, match="Unsupported job type"):
             execute_job("invalid", str(temp_bash_script))
 
-    def test_execute_job_case_insensitive(self, temp_bash_script):
+    @patch("app.jobs.execute_bash_job", return_value={"success": True})
+    def test_execute_job_case_insensitive(self, mock_bash, temp_bash_script):
         """Test execute_job with case-insensitive job type."""
         result = execute_job("BASH", str(temp_bash_script))
         assert result["success"] is True
+        mock_bash.assert_called_once_with(str(temp_bash_script), None)
@@ -2,17 +2,25 @@
 Unit tests for scheduler logic with mocked Oracle database.
 """
 
-import sys
+import threading
+import time
 from datetime import datetime, timedelta
-from pathlib import Path
 
 import pytest
 from pytz import UTC
 
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+from app.scheduler import SchedulerManager
 
-from app.scheduler import SchedulerManager  # noqa: E402
+
+# Jobs are stored by reference, so the blocking job's state lives at module level
+_job_threads = []
+_release_job = threading.Event()
+
+
+def _block_until_released():
+    """Job that records its worker thread and blocks until released."""
+    _job_threads.append(threading.current_thread())
+    _release_job.wait(timeout=10)
 
 
 @pytest.fixture
@@ -41,6 +49,26 @@ class TestSchedulerInitialization:
         assert manager.scheduler is not None
         assert manager.db_uri == mock_db_uri
 
+    def test_scheduler_survives_other_manager_shutdown(self, mock_db_uri):
+        """Test shutting down one manager leaves another on the same URI working."""
+        run_date = datetime.now(UTC) + timedelta(hours=1)
+        first = SchedulerManager(db_uri=mock_db_uri)
+        second = SchedulerManager(db_uri=mock_db_uri)
+        first.start()
+        second.start()
+        try:
+            first.add_job(
+                job_id="first_job", job_type="bash", script_path="/a.sh", run_date=run_date
+            )
+            first.shutdown(wait=False)
+
+            second.add_job(
+                job_id="second_job", job_type="bash", script_path="/b.sh", run_date=run_date
+            )
+            assert [job.id for job in second.scheduler.get_jobs()] == ["second_job"]
+        finally:
+            second.shutdown(wait=False)
+
     def test_scheduler_start(self, scheduler_manager):
         """Test scheduler start."""
         assert scheduler_manager.scheduler.running is True
@@ -53,6 +81,29 @@ class TestSchedulerInitialization:
 
         assert manager.scheduler.running is False
 
+    def test_scheduler_shutdown_releases_worker_threads(self, mock_db_uri):
+        """Test shutdown without waiting returns at once and its worker threads then exit."""
+        _job_threads.clear()
+        _release_job.clear()
+        manager = SchedulerManager(db_uri=mock_db_uri)
+        manager.start()
+        manager.scheduler.add_job(_block_until_released, id="blocking_job")
+
+        deadline = time.monotonic() + 5
+        while not _job_threads and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert _job_threads, "blocking job never started"
+        worker = _job_threads[0]
+
+        started = time.monotonic()
+        manager.shutdown(wait=False)
+        assert time.monotonic() - started < 1
+        assert worker.is_alive()
+
+        _release_job.set()
+        worker.join(timeout=5)
+        assert not worker.is_alive()
+
 
 class TestJobManagement:
     """Tests for job management operations."""
@@ -0,0 +1,979 @@
+"""
+Query catalog data for TPC-C benchmark.
+One row per query, consumed by benchmarks.query_definitions at import.
+"""
+
+from typing import Any, Dict, Optional, Tuple
+
+# (query_id, name, query_type, complexity, description, method_name,
+#  default params, partition key fields, CQL)
+QueryRow = Tuple[str, str, str, str, str, str, Dict[str, Any], Tuple[str, ...], Optional[str]]
+
+# Key prefixes shared by most TPC-C parameter sets (order matters: it is the bind order)
+_DISTRICT_KEY: Dict[str, Any] = {"warehouse_id": 1, "district_id": 1}
+_CUSTOMER_KEY: Dict[str, Any] = {**_DISTRICT_KEY, "customer_id": 100}
+_ORDER_KEY: Dict[str, Any] = {**_DISTRICT_KEY, "order_id": 1000}
+
+QUERY_ROWS: Tuple[QueryRow, ...] = (
+    # ========== SELECT QUERIES ==========
+    # Simple SELECT queries
+    (
+        "S1",
+        "Select Warehouse by ID",
+        "select",
+        "simple",
+        "Get warehouse by ID - single partition lookup",
+        "select_warehouse_by_id",
+        {"warehouse_id": 1},
+        ("warehouse_id",),
+        "SELECT * FROM warehouse WHERE w_id = ?",
+    ),
+    (
+        "S2",
+        "Select Customer by ID",
+        "select",
+        "simple",
+        "Get customer by ID - single partition lookup",
+        "select_customer_by_id",
+        {**_CUSTOMER_KEY},
+        ("warehouse_id", "district_id"),
+        "SELECT * FROM customer WHERE c_w_id = ? AND c_d_id = ? AND c_id = ?",
+    ),
+    (
+        "S3",
+        "Select Item by ID",
+        "select",
+        "simple",
+        "Get item by ID - single partition lookup",
+        "select_item_by_id",
+        {"item_id": 1000},
+        ("item_id",),
+        "SELECT * FROM item WHERE i_id = ?",
+    ),
+    (
+        "S4",
+        "Select District by ID",
+        "select",
+        "simple",
+        "Get district by ID - single partition lookup",
+        "select_district_by_id",
+        {**_DISTRICT_KEY},
+        ("warehouse_id",),
+        "SELECT * FROM district WHERE d_w_id = ? AND d_id = ?",
+    ),
+    # Medium SELECT queries
+    (
+        "M1",
+        "Select Customers by District",
+        "select",
+        "medium",
+        "Get customers in a district - multi-row partition query",
+        "select_customers_by_district",
+        {**_DISTRICT_KEY, "limit": 100},
+        ("warehouse_id", "district_id"),
+        "SELECT * FROM customer WHERE c_w_id = ? AND c_d_id = ? LIMIT ?",
+    ),
+    (
+        "M2",
+        "Select Stock Level",
+        "select",
+        "medium",
+        "Get stock level for item - business logic query",
+        "select_stock_level",
+        {"warehouse_id": 1, "item_id": 1000},
+        ("warehouse_id", "item_id"),
+        "SELECT * FROM stock WHERE s_w_id = ? AND s_i_id = ?",
+    ),
+    (
+        "M3",
+        "Select Orders by Customer",
+        "select",
+        "medium",
+        "Get recent orders for customer - ordered multi-row query",
+        "select_orders_by_customer",
+        {"customer_id": 100, "warehouse_id": 1, "district_id": 1, "limit": 20},
+        ("customer_id", "warehouse_id", "district_id"),
+        "SELECT * FROM orders_by_customer WHERE o_c_id = ? AND o_w_id = ? AND o_d_id = ? LIMIT ?",
+    ),
+    (
+        "M4",
+        "Select Order Lines",
+        "select",
+        "medium",
+        "Get all order lines for order - multi-row partition query",
+        "select_order_lines",
+        {**_ORDER_KEY},
+        ("warehouse_id", "district_id", "order_id"),
+        "SELECT * FROM order_line WHERE ol_w_id = ? AND ol_d_id = ? AND ol_o_id = ?",
+    ),
+    # Complex SELECT queries
+    (
+        "C1",
+        "Select Customers by Name",
+        "select",
+        "complex",
+        "Get customers by last name - denormalized table query",
+        "select_customers_by_name",
+        {**_DISTRICT_KEY, "last_name": "SMITH"},
+        ("warehouse_id", "district_id", "last_name"),
+        "SELECT * FROM customer_by_name WHERE c_w_id = ? AND c_d_id = ? AND c_last = ?",
+    ),
+    (
+        "C2",
+        "Select New Orders",
+        "select",
+        "complex",
+        "Get new orders for district - multi-row query",
+        "select_new_orders",
+        {**_DISTRICT_KEY, "limit": 20},
+        ("warehouse_id", "district_id"),
+        "SELECT * FROM new_order WHERE no_w_id = ? AND no_d_id = ? LIMIT ?",
+    ),
+    (
+        "C3",
+        "Select History by Date Range",
+        "select",
+        "complex",
+        "Get history in date range - time-series range query",
+        "select_history_by_date_range",
+        {
+            **_DISTRICT_KEY,
+            "date_bucket": "2024-01-01",
+            "start_date": "2024-01-01 00:00:00",
+            "end_date": "2024-01-01 23:59:59",
+        },
+        ("warehouse_id", "district_id", "date_bucket"),
+        (
+            "SELECT * FROM history WHERE h_w_id = ? AND h_d_id = ? AND date_bucket = ? "
+            "AND h_date >= ? AND h_date <= ?"
+        ),
+    ),
+    # ========== INSERT QUERIES ==========
+    # Note: Insert/Update/Delete queries will use mock data generators
+    # The actual implementations would need proper data generation
+    (
+        "I1",
+        "Insert Customer",
+        "insert",
+        "simple",
+        "Insert new customer - basic insert",
+        "insert_customer",
+        {"data": {}},
+        (),
+        None,
+    ),
+    (
+        "I2",
+        "Insert Order",
+        "insert",
+        "simple",
+        "Insert new order - basic insert with denormalization",
+        "insert_order",
+        {"data": {}},
+        (),
+        None,
+    ),
+    (
+        "I3",
+        "Insert History",
+        "insert",
+        "simple",
+        "Insert history record - time-series insert",
+        "insert_history",
+        {"data": {}},
+        (),
+        None,
+    ),
+    (
+        "I4",
+        "Batch Insert Order Lines",
+        "insert",
+        "medium",
+        "Batch insert order lines",
+        "insert_order_lines_batch",
+        {"order_lines": []},
+        (),
+        None,
+    ),
+    (
+        "I5",
+        "Insert History with TTL",
+        "insert",
+        "medium",
+        "Insert history with TTL",
+        "insert_history_with_ttl",
+        {"data": {}, "ttl_seconds": 86400},
+        (),
+        None,
+    ),
+    (
+        "I6",
+        "Insert New Order (LWT)",
+        "insert",
+        "complex",
+        "Insert new order with LWT",
+        "insert_new_order_lwt",
+        {**_DISTRICT_KEY, "order_id": 9999},
+        ("warehouse_id", "district_id"),
+        None,
+    ),
+    (
+        "I7",
+        "Insert Customer with Denormalization",
+        "insert",
+        "complex",
+        "Insert with denormalization",
+        "insert_customer_with_denormalization",
+        {"data": {}},
+        (),
+        None,
+    ),
+    # ========== UPDATE QUERIES ==========
+    (
+        "U1",
+        "Update Customer Balance",
+        "update",
+        "simple",
+        "Update customer balance - basic update",
+        "update_customer_balance",
+        {**_CUSTOMER_KEY, "balance": 1000.0, "ytd_payment": 500.0, "payment_cnt": 5},
+        ("warehouse_id", "district_id"),
+        None,
+    ),
+    (
+        "U2",
+        "Update Stock Quantity",
+        "update",
+        "simple",
+        "Update stock quantity - basic update",
+        "update_stock_quantity",
+        {"warehouse_id": 1, "item_id": 1000, "quantity": 50, "ytd": 1000, "order_cnt": 100},
+        ("warehouse_id", "item_id"),
+        None,
+    ),
+    (
+        "U3",
+        "Update District Next Order",
+        "update",
+        "simple",
+        "Update district next order ID",
+        "update_district_next_order",
+        {**_DISTRICT_KEY, "next_order_id": 3001},
+        ("warehouse_id",),
+        None,
+    ),
+    (
+        "U4",
+        "Update Order Carrier (Conditional)",
+        "update",
+        "medium",
+        "Update order carrier conditionally",
+        "update_order_carrier_conditional",
+        {**_ORDER_KEY, "carrier_id": 5},
+        ("warehouse_id", "district_id"),
+        None,
+    ),
+    (
+        "U5",
+        "Update Stock with LWT",
+        "update",
+        "complex",
+        "Update stock with LWT validation",
+        "update_stock_with_lwt",
+        {
+            "warehouse_id": 1,
+            "item_id": 1000,
+            "new_quantity": 40,
+            "ytd": 1100,
+            "order_cnt": 101,
+            "remote_cnt": 10,
+            "min_quantity": 10,
+        },
+        ("warehouse_id", "item_id"),
+        None,
+    ),
+    (
+        "U6",
+        "Update Stocks Batch",
+        "update",
+        "medium",
+        "Batch update stocks",
+        "update_stocks_batch",
+        {"updates": []},
+        (),
+        None,
+    ),
+    (
+        "U7",
+        "Update Customer Credit Conditional",
+        "update",
+        "medium",
+        "Conditional credit update",
+        "update_customer_credit_conditional",
+        {**_CUSTOMER_KEY, "new_credit": "BC", "credit_data": "Updated", "expected_credit": "GC"},
+        ("warehouse_id", "district_id"),
+        None,
+    ),
+    (
+        "U8",
+        "Update Order and Customer Batch",
+        "update",
+        "complex",
+        "Multi-table batch update",
+        "update_order_and_customer_batch",
+        {"order_update": {}, "customer_update": {}},
+        (),
+        None,
+    ),
+    # ========== DELETE QUERIES ==========
+    (
+        "D1",
+        "Delete Order Line",
+        "delete",
+        "simple",
+        "Delete specific order line",
+        "delete_order_line",
+        {**_ORDER_KEY, "line_number": 1},
+        ("warehouse_id", "district_id", "order_id"),
+        None,
+    ),
+    (
+        "D2",
+        "Delete New Order",
+        "delete",
+        "simple",
+        "Delete new order record",
+        "delete_new_order",
+        {**_DISTRICT_KEY, "order_id": 9999},
+        ("warehouse_id", "district_id"),
+        None,
+    ),
+    (
+        "D3",
+        "Delete New Order (Conditional)",
+        "delete",
+        "medium",
+        "Delete new order with IF EXISTS",
+        "delete_new_order_conditional",
+        {**_DISTRICT_KEY, "order_id": 9999},
+        ("warehouse_id", "district_id"),
+        None,
+    ),
+    (
+        "D4",
+        "Delete All Order Lines",
+        "delete",
+        "complex",
+        "Delete all order lines for an order",
+        "delete_all_order_lines",
+        {**_ORDER_KEY},
+        ("warehouse_id", "district_id", "order_id"),
+        None,
+    ),
+    (
+        "D5",
+        "Delete Old History Records",
+        "delete",
+        "medium",
+        "Delete old history records",
+        "delete_old_history_records",
+        {**_DISTRICT_KEY, "date_bucket": "2024-01-01", "cutoff_date": "2024-01-15"},
+        ("warehouse_id", "district_id", "date_bucket"),
+        None,
+    ),
+    (
+        "D6",
+        "Delete Order with Lines Batch",
+        "delete",
+        "complex",
+        "Multi-table batch delete",
+        "delete_order_with_lines_batch",
+        {**_ORDER_KEY, "customer_id": 100},
+        ("warehouse_id", "district_id"),
+        None,
+    ),
+    (
+        "D7",
+        "Delete Multiple New Orders Batch",
+        "delete",
+        "complex",
+        "Batch delete operation",
+        "delete_multiple_new_orders_batch",
+        {"orders": []},
+        (),
+        None,
+    ),
+    # ========== ADDITIONAL SELECT QUERIES (S5-S13) ==========
+    (
+        "S5",
+        "Select Orders Range",
+        "select",
+        "simple",
+        "Range query on clustering keys",
+        "select_orders_range",
+        {**_DISTRICT_KEY, "start_order_id": 1000, "end_order_id": 2000},
+        ("warehouse_id", "district_id"),
+        None,
+    ),
+    (
+        "S6",
+        "Select Warehouses IN",
+        "select",
+        "simple",
+        "IN clause on partition key",
+        "select_warehouses_in",
+        {"warehouse_ids": [1, 2, 3]},
+        (),
+        None,
+    ),
+    (
+        "S7",
+        "Select Customer with Token",
+        "select",
+        "medium",
+        "Token-based pagination",
+        "select_customer_with_token",
+        {**_DISTRICT_KEY, "token_value": None, "limit": 100},
+        ("warehouse_id", "district_id"),
+        None,
+    ),
+    (
+        "S8",
+        "Select Items with Filter",
+        "select",
+        "complex",
+        "ALLOW FILTERING query",
+        "select_items_with_filter",
+        {"min_price": 10.0, "max_price": 100.0},
+        (),
+        None,
+    ),
+    (
+        "S9",
+        "Select Order Count",
+        "select",
+        "simple",
+        "COUNT aggregation",
+        "select_order_count",
+        {**_DISTRICT_KEY},
+        ("warehouse_id", "district_id"),
+        None,
+    ),
+    (
+        "S10",
+        "Select Customer Projection",
+        "select",
+        "simple",
+        "Column projection query",
+        "select_customer_projection",
+        {**_CUSTOMER_KEY},
+        ("warehouse_id", "district_id"),
+        None,
+    ),
+    (
+        "S11",
+        "Select Order Lines Range",
+        "select",
+        "medium",
+        "Clustering key range query",
+        "select_order_lines_range",
+        {**_ORDER_KEY, "start_line": 1, "end_line": 5},
+        ("warehouse_id", "district_id", "order_id"),
+        None,
+    ),
+    (
+        "S12",
+        "Select Orders by Carrier Index",
+        "select",
+        "complex",
+        "Secondary index query",
+        "select_orders_by_carrier_index",
+        {"carrier_id": 5, "limit": 100},
+        (),
+        None,
+    ),
+    (
+        "S13",
+        "Select Districts Multi Warehouse",
+        "select",
+        "medium",
+        "Multi-partition IN query",
+        "select_districts_multi_warehouse",
+        {"warehouse_ids": [1, 2, 3], "district_id": 1},
+        (),
+        None,
+    ),
+    # ========== ADDITIONAL INSERT QUERIES (I8-I20) ==========
+    (
+        "I8",
+        "Insert Customer with Collections",
+        "insert",
+        "medium",
+        "Insert with set, list, map collections",
+        "insert_customer_with_collections",
+        {
+            **_DISTRICT_KEY,
+            "customer_id": 1000,
+            "name": "Test Customer",
+            "phones": {"555-1234", "555-5678"},
+            "emails": ["test@example.com"],
+            "prefs": {"lang": "en"},
+        },
+        ("warehouse_id", "district_id"),
+        None,
+    ),
+    (
+        "I9",
+        "Insert Warehouse Metric Counter",
+        "insert",
+        "simple",
+        "Counter column update",
+        "insert_warehouse_metric_counter",
+        {"warehouse_id": 1, "metric_name": "orders_count", "increment": 1},
+        ("warehouse_id",),
+        None,
+    ),
+    (
+        "I10",
+        "Insert Customer with UDT",
+        "insert",
+        "medium",
+        "Insert with User Defined Type",
+        "insert_customer_with_udt",
+        {
+            **_DISTRICT_KEY,
+            "customer_id": 1001,
+            "name": "UDT Customer",
+            "address_data": {
+                "street_1": "123 Main St",
+                "street_2": "Apt 4",
+                "city": "New York",
+                "state": "NY",
+                "zip": "10001",
+            },
+        },
+        ("warehouse_id", "district_id"),
+        None,
+    ),
+    (
+        "I11",
+        "Insert Product with Static",
+        "insert",
+        "medium",
+        "Insert with static column",
+        "insert_product_with_static",
+        {
+            "category_id": 1,
+            "category_name": "Electronics",
+            "product_id": 100,
+            "product_name": "Laptop",
+            "tags": {"computer", "tech"},
+        },
+        ("category_id",),
+        None,
+    ),
+    (
+        "I12",
+        "Insert Inventory Log with TTL",
+        "insert",
+        "medium",
+        "Insert with TTL",
+        "insert_inventory_log_with_ttl",
+        {
+            "warehouse_id": 1,
+            "item_id": 1000,
+            "log_type": "restock",
+            "message": "Inventory restocked",
+            "ttl_seconds": 86400,
+        },
+        ("warehouse_id", "item_id"),
+        None,
+    ),
+    (
+        "I13",
+        "Insert Orders Batch Logged",
+        "insert",
+        "medium",
+        "LOGGED batch insert",
+        "insert_orders_batch_logged",
+        {"orders": []},
+        (),
+        None,
+    ),
+    (
+        "I14",
+        "Insert Order Tracking Batch Unlogged",
+        "insert",
+        "medium",
+        "UNLOGGED batch insert",
+        "insert_order_tracking_batch_unlogged",
+        {"tracking_records": []},
+        (),
+        None,
+    ),
+    (
+        "I15",
+        "Insert Order with Timestamp",
+        "insert",
+        "medium",
+        "Insert with custom timestamp",
+        "insert_order_with_timestamp",
+        {"data": {}, "timestamp_micros": 1234567890},
+        (),
+        None,
+    ),
+    (
+        "I16",
+        "Insert Item All Types",
+        "insert",
+        "complex",
+        "Insert with all collection types",
+        "insert_item_all_types",
+        {
+            "item_id": 2000,
+            "name": "Multi-type Item",
+            "price": 99.99,
+            "tags": {"popular", "new"},
+            "specs": {"color": "blue"},
+            "reviews": ["Good product"],
+        },
+        ("item_id",),
+        None,
+    ),
+    (
+        "I17",
+        "Insert into Multiple Tables",
+        "insert",
+        "complex",
+        "Multi-table denormalization",
+        "insert_into_multiple_tables",
+        {"order_data": {}},
+        (),
+        None,
+    ),
+    (
+        "I18",
+        "Insert with LWT Condition",
+        "insert",
+        "complex",
+        "LWT with IF condition",
+        "insert_with_lwt_condition",
+        {**_DISTRICT_KEY, "order_id": 9998, "customer_id": 100, "expected_value": None},
+        ("warehouse_id", "district_id"),
+        None,
+    ),
+    (
+        "I19",
+        "Insert Customer Activity JSON",
+        "insert",
+        "medium",
+        "JSON insert",
+        "insert_customer_activity_json",
+        {"customer_id": 100, "activity_json": "{}"},
+        ("customer_id",),
+        None,
+    ),
+    (
+        "I20",
+        "Increment Warehouse Counter",
+        "insert",
+        "simple",
+        "Counter increment",
+        "increment_warehouse_counter",
+        {
+            "warehouse_id": 1,
+            "stat_date": "2024-01-01",
+            "orders_increment": 1,
+            "revenue_increment": 100,
+        },
+        ("warehouse_id",),
+        None,
+    ),
+    # ========== ADDITIONAL UPDATE QUERIES (U9-U20) ==========
+    (
+        "U9",
+        "Update Customer Add Phone",
+        "update",
+        "medium",
+        "Set collection add",
+        "update_customer_add_phone",
+        {**_CUSTOMER_KEY, "new_phone": "555-9999"},
+        ("warehouse_id", "district_id"),
+        None,
+    ),
+    (
+        "U10",
+        "Update Customer Preferences Map",
+        "update",
+        "medium",
+        "Map collection update",
+        "update_customer_preferences_map",
+        {**_CUSTOMER_KEY, "prefs_update": {"theme": "dark"}},
+        ("warehouse_id", "district_id"),
+        None,
+    ),
+    (
+        "U11",
+        "Update Customer Append Email",
+        "update",
+        "medium",
+        "List collection append",
+        "update_customer_append_email",
+        {**_CUSTOMER_KEY, "new_email": "new@example.com"},
+        ("warehouse_id", "district_id"),
+        None,
+    ),
+    (
+        "U12",
+        "Update Customer Remove Phone",
+        "update",
+        "medium",
+        "Set collection remove",
+        "update_customer_remove_phone",
+        {**_CUSTOMER_KEY, "phone_to_remove": "555-1234"},
+        ("warehouse_id", "district_id"),
+        None,
+    ),
+    (
+        "U13",
+        "Update Order with TTL",
+        "update",
+        "medium",
+        "Update with TTL",
+        "update_order_with_ttl",
+        {**_ORDER_KEY, "carrier_id": 5, "ttl_seconds": 3600},
+        ("warehouse_id", "district_id"),
+        None,
+    ),
+    (
+        "U14",
+        "Update Customer with Timestamp",
+        "update",
+        "medium",
+        "Update with custom timestamp",
+        "update_customer_with_timestamp",
+        {**_CUSTOMER_KEY, "balance": 1000.0, "timestamp_micros": 1234567890},
+        ("warehouse_id", "district_id"),
+        None,
+    ),
+    (
+        "U15",
+        "Update Warehouse Metrics Counter",
+        "update",
+        "simple",
+        "Counter update",
+        "update_warehouse_metrics_counter",
+        {"warehouse_id": 1, "metric_name": "total_sales", "increment": 1},
+        ("warehouse_id",),
+        None,
+    ),
+    (
+        "U16",
+        "Update Multiple Customer Fields",
+        "update",
+        "medium",
+        "Multi-column update",
+        "update_multiple_customer_fields",
+        {**_CUSTOMER_KEY, "updates": {"c_balance": 500.0, "c_payment_cnt": 10}},
+        ("warehouse_id", "district_id"),
+        None,
+    ),
+    (
+        "U17",
+        "Update Customer with Collection and TTL",
+        "update",
+        "complex",
+        "Collection + TTL",
+        "update_customer_with_collection_and_ttl",
+        {**_CUSTOMER_KEY, "tag": "vip", "ttl_seconds": 86400},
+        ("warehouse_id", "district_id"),
+        None,
+    ),
+    (
+        "U18",
+        "Update Static Column",
+        "update",
+        "medium",
+        "Static column update",
+        "update_static_column",
+        {"category_id": 1, "new_description": "Updated category"},
+        ("category_id",),
+        None,
+    ),
+    (
+        "U19",
+        "Update with LWT Multiple Conditions",
+        "update",
+        "complex",
+        "LWT with multiple IF conditions",
+        "update_with_lwt_multiple_conditions",
+        {
+            **_CUSTOMER_KEY,
+            "new_balance": 2000.0,
+            "expected_balance": 1000.0,
+            "expected_credit": "GC",
+        },
+        ("warehouse_id", "district_id"),
+        None,
+    ),
+    (
+        "U20",
+        "Update Batch Unlogged",
+        "update",
+        "complex",
+        "UNLOGGED batch update",
+        "update_batch_unlogged",
+        {"updates": []},
+        (),
+        None,
+    ),
+    # ========== ADDITIONAL DELETE QUERIES (D8-D20) ==========
+    (
+        "D8",
+        "Delete Specific Column",
+        "delete",
+        "simple",
+        "Column-level delete",
+        "delete_specific_column",
+        {**_CUSTOMER_KEY, "column_name": "c_phone"},
+        ("warehouse_id", "district_id"),
+        None,
+    ),
+    (
+        "D9",
+        "Delete from Set Collection",
+        "delete",
+        "medium",
+        "Set element removal",
+        "delete_from_set_collection",
+        {**_CUSTOMER_KEY, "phone_to_remove": "555-1234"},
+        ("warehouse_id", "district_id"),
+        None,
+    ),
+    (
+        "D10",
+        "Delete from Map by Key",
+        "delete",
+        "medium",
+        "Map key removal",
+        "delete_from_map_by_key",
+        {**_CUSTOMER_KEY, "pref_key": "theme"},
+        ("warehouse_id", "district_id"),
+        None,
+    ),
+    (
+        "D11",
+        "Delete from List by Index",
+        "delete",
+        "medium",
+        "List index removal",
+        "delete_from_list_by_index",
+        {**_CUSTOMER_KEY, "index": 0},
+        ("warehouse_id", "district_id"),
+        None,
+    ),
+    (
+        "D12",
+        "Delete with Timestamp",
+        "delete",
+        "medium",
+        "Delete with custom timestamp",
+        "delete_with_timestamp",
+        {**_ORDER_KEY, "timestamp_micros": 1234567890},
+        ("warehouse_id", "district_id"),
+        None,
+    ),
+    (
+        "D13",
+        "Delete Static Column",
+        "delete",
+        "medium",
+        "Static column deletion",
+        "delete_static_column",
+        {"category_id": 1},
+        ("category_id",),
+        None,
+    ),
+    (
+        "D14",
+        "Delete Clustering Range",
+        "delete",
+        "complex",
+        "Range delete on clustering keys",
+        "delete_clustering_range",
+        {
+            "warehouse_id": 1,
+            "item_id": 1000,
+            "start_timestamp": "2024-01-01",
+            "end_timestamp": "2024-01-31",
+        },
+        ("warehouse_id", "item_id"),
+        None,
+    ),
+    (
+        "D15",
+        "Delete with IN Clause",
+        "delete",
+        "complex",
+        "DELETE with IN on clustering key",
+        "delete_with_in_clause",
+        {**_DISTRICT_KEY, "order_ids": [1000, 1001, 1002]},
+        ("warehouse_id", "district_id"),
+        None,
+    ),
+    (
+        "D16",
+        "Delete with LWT Condition",
+        "delete",
+        "complex",
+        "LWT conditional delete",
+        "delete_with_lwt_condition",
+        {**_ORDER_KEY, "expected_carrier": 5},
+        ("warehouse_id", "district_id"),
+        None,
+    ),
+    (
+        "D17",
+        "Delete Expired Records TTL",
+        "delete",
+        "medium",
+        "Time-based deletion",
+        "delete_expired_records_ttl",
+        {"warehouse_id": 1, "item_id": 1000},
+        ("warehouse_id", "item_id"),
+        None,
+    ),
+    (
+        "D18",
+        "Delete Batch Logged",
+        "delete",
+        "complex",
+        "LOGGED batch delete",
+        "delete_batch_logged",
+        {"deletes": []},
+        (),
+        None,
+    ),
+    (
+        "D19",
+        "Delete Batch Unlogged",
+        "delete",
+        "complex",
+        "UNLOGGED batch delete",
+        "delete_batch_unlogged",
+        {"tracking_deletes": []},
+        (),
+        None,
+    ),
+    (
+        "D20",
+        "Delete Partition",
+        "delete",
+        "complex",
+        "Full partition delete",
+        "delete_partition",
+        {**_DISTRICT_KEY},
+        ("warehouse_id", "district_id"),
+        None,
+    ),
+)
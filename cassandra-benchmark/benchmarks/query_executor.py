@@ -4,11 +4,12 @@ Handles query execution with metrics collection.
 """
 
 import logging
+import threading
 import time
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
 
-from benchmarks.query_definitions import QueryDefinition, QueryType
+from benchmarks.query_definitions import QueryDefinition, QueryDefinitions, QueryType
 from cassandra.cluster import Session
 from queries.delete_queries import DeleteQueries
 from queries.insert_queries import InsertQueries
@@ -33,8 +34,15 @@ class QueryExecutor:
         self.insert_queries = InsertQueries(session)
         self.update_queries = UpdateQueries(session)
         self.delete_queries = DeleteQueries(session)
+        self._handlers = {
+            QueryType.SELECT: self.select_queries,
+            QueryType.INSERT: self.insert_queries,
+            QueryType.UPDATE: self.update_queries,
+            QueryType.DELETE: self.delete_queries,
+        }
 
-        # Metrics
+        # Metrics, updated from run_query's worker threads under _metrics_lock
+        self._metrics_lock = threading.Lock()
         self.execution_count = 0
         self.success_count = 0
         self.error_count = 0
@@ -48,13 +56,13 @@ class QueryExecutor:
 
         Args:
             query_def: Query definition
-            params: Query parameters (if None, use default from definition)
+            params: Query parameters (if None, use the definition's read-only template)
 
         Returns:
             Dict containing execution results and metrics
         """
         if params is None:
-            params = query_def.params_generator()
+            params = query_def.params_template
 
         start_time = time.time()
         success = False
@@ -81,18 +89,19 @@ class QueryExecutor:
         latency = (end_time - start_time) * 1000  # Convert to milliseconds
 
         # Update metrics
-        self.execution_count += 1
-        if success:
-            self.success_count += 1
-        else:
-            self.error_count += 1
-        self.total_latency += latency
+        with self._metrics_lock:
+            self.execution_count += 1
+            if success:
+                self.success_count += 1
+            else:
+                self.error_count += 1
+            self.total_latency += latency
 
         return {
             "query_id": query_def.query_id,
             "query_name": query_def.name,
-            "query_type": query_def.query_type.value,
-            "complexity": query_def.complexity.value,
+            "query_type": query_def.query_type.label,
+            "complexity": query_def.complexity.label,
             "success": success,
             "latency_ms": latency,
             "timestamp": datetime.now().isoformat(),
@@ -110,13 +119,21 @@ class QueryExecutor:
         Returns:
             Query handler instance
         """
-        handlers = {
-            QueryType.SELECT: self.select_queries,
-            QueryType.INSERT: self.insert_queries,
-            QueryType.UPDATE: self.update_queries,
-            QueryType.DELETE: self.delete_queries,
-        }
-        return handlers[query_type]
+        return self._handlers[query_type]
+
+    def bind(
+        self, query_defs: QueryDefinitions
+    ) -> Tuple[Tuple[str, Callable[..., Any], Mapping[str, Any]], ...]:
+        """
+        Pre-resolve every registered query to a bound handler method.
+
+        Args:
+            query_defs: Query registry
+
+        Returns:
+            Tuple of (query_id, bound_method, params_template); call as fn(**params)
+        """
+        return query_defs.bind(self._handlers)
 
     def execute_queries_batch(
         self, query_defs: List[QueryDefinition], iterations: int = 1
@@ -150,25 +167,30 @@ class QueryExecutor:
         Returns:
             Dict containing metrics summary
         """
-        avg_latency = self.total_latency / self.execution_count if self.execution_count > 0 else 0
+        with self._metrics_lock:
+            execution_count = self.execution_count
+            success_count = self.success_count
+            error_count = self.error_count
+            total_latency = self.total_latency
 
-        success_rate = (
-            (self.success_count / self.execution_count * 100) if self.execution_count > 0 else 0
-        )
+        avg_latency = total_latency / execution_count if execution_count > 0 else 0
+
+        success_rate = (success_count / execution_count * 100) if execution_count > 0 else 0
 
         return {
-            "total_executions": self.execution_count,
-            "successful_executions": self.success_count,
-            "failed_executions": self.error_count,
+            "total_executions": execution_count,
+            "successful_executions": success_count,
+            "failed_executions": error_count,
             "success_rate_percent": round(success_rate, 2),
             "average_latency_ms": round(avg_latency, 2),
-            "total_latency_ms": round(self.total_latency, 2),
+            "total_latency_ms": round(total_latency, 2),
         }
 
     def reset_metrics(self) -> None:
         """Reset all metrics counters."""
-        self.execution_count = 0
-        self.success_count = 0
-        self.error_count = 0
-        self.total_latency = 0.0
+        with self._metrics_lock:
+            self.execution_count = 0
+            self.success_count = 0
+            self.error_count = 0
+            self.total_latency = 0.0
         logger.info("Metrics reset")
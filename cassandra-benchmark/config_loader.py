@@ -0,0 +1,43 @@
+"""
+YAML configuration loading for the TPC-C benchmark.
+Config files are parsed with libyaml when PyYAML was built against it, and cached while unchanged.
+"""
+
+import copy
+import os
+from collections import OrderedDict
+
+import yaml
+
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
+# True when PyYAML has no libyaml binding and configs go through the pure-Python loader
+USING_PURE_PYTHON_YAML = YamlLoader is yaml.SafeLoader
+
+# Parsed YAML files keyed by (absolute path, mtime_ns, size, inode), oldest first
+_YAML_CACHE: "OrderedDict[tuple, dict]" = OrderedDict()
+_YAML_CACHE_SIZE = 32
+
+
+def load_yaml(config_path: str) -> dict:
+    """
+    Load a YAML file, reusing the parsed result while the file is unchanged.
+
+    A deep copy is returned so callers can modify the config freely.
+    """
+    path = os.path.abspath(config_path)
+    st = os.stat(path)
+    key = (path, st.st_mtime_ns, st.st_size, st.st_ino)
+    if key in _YAML_CACHE:
+        _YAML_CACHE.move_to_end(key)
+        return copy.deepcopy(_YAML_CACHE[key])
+
+    with open(path, "r") as f:
+        data = yaml.load(f, Loader=YamlLoader)
+    _YAML_CACHE[key] = data
+    if len(_YAML_CACHE) > _YAML_CACHE_SIZE:
+        _YAML_CACHE.popitem(last=False)
+    return copy.deepcopy(data)
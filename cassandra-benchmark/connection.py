@@ -0,0 +1,138 @@
+"""
+Shared Cassandra connections for the TPC-C benchmark CLI.
+Sessions are cached per connection target, so commands run in one process reuse a warm pool.
+"""
+
+import atexit
+import functools
+import logging
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+from cassandra.auth import PlainTextAuthProvider
+from cassandra.cluster import Session
+from data_generator.data_loader import DataLoader
+
+logger = logging.getLogger(__name__)
+
+# Connected sessions keyed by connection target; every cluster is shut down at exit
+_sessions: Dict[tuple, Session] = {}
+_sessions_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=None)
+def driver_connection_class() -> Any:
+    """
+    Check the cassandra-driver C extensions and pick the libev reactor if it was built.
+
+    Without them the driver silently falls back to pure-Python protocol decoding,
+    Murmur3 hashing and event loop, which is several times slower; each missing piece
+    is logged once as a warning.
+
+    Returns:
+        LibevConnection, or None to keep the driver's default connection class
+    """
+    try:
+        from cassandra.cython_deps import HAVE_CYTHON
+    except ImportError:
+        HAVE_CYTHON = False
+    if not HAVE_CYTHON:
+        logger.warning(
+            "cassandra-driver Cython extensions are not loaded; expect much lower throughput "
+            "(reinstall with: pip install --no-binary cassandra-driver cassandra-driver)"
+        )
+
+    try:
+        import cassandra.cmurmur3  # noqa: F401
+    except ImportError:
+        logger.warning("cassandra-driver C Murmur3 hasher is missing; token routing is slower")
+
+    try:
+        from cassandra.io.libevreactor import LibevConnection
+    except ImportError:
+        logger.warning(
+            "libev reactor is unavailable; install libev and reinstall cassandra-driver to use it"
+        )
+        return None
+    return LibevConnection
+
+
+def _connect(
+    contact_points: Tuple[str, ...],
+    port: int,
+    keyspace: Optional[str],
+    username: Optional[str],
+    password: str,
+    protocol_version: int,
+    compression,
+    local_dc: Optional[str],
+    request_timeout: float,
+    core_connections_per_host: int,
+    max_requests_per_connection: int,
+) -> Session:
+    """Connect a new cluster and session for one connection target."""
+    auth_provider = None
+    if username:
+        auth_provider = PlainTextAuthProvider(username=username, password=password)
+
+    return DataLoader.build_session(
+        contact_points=list(contact_points),
+        port=port,
+        keyspace=keyspace,
+        auth_provider=auth_provider,
+        protocol_version=protocol_version,
+        compression=compression,
+        local_dc=local_dc,
+        request_timeout=request_timeout,
+        core_connections_per_host=core_connections_per_host,
+        max_requests_per_connection=max_requests_per_connection,
+        connection_class=driver_connection_class(),
+    )
+
+
+@atexit.register
+def _shutdown_sessions() -> None:
+    """Shut down the cluster of every session handed out by get_session."""
+    with _sessions_lock:
+        sessions = list(_sessions.values())
+        _sessions.clear()
+    for session in sessions:
+        try:
+            session.cluster.shutdown()
+        except Exception as e:
+            logger.warning(f"Error shutting down Cassandra cluster: {e}")
+
+
+def get_session(cass_config: dict) -> Session:
+    """
+    Get a connected session for a Cassandra configuration.
+
+    Configurations naming the same target share one cluster and session for the life
+    of the process. The cluster is shut down at exit, so callers must not shut it down.
+
+    Args:
+        cass_config: Cassandra configuration dict (same structure as cassandra_config.yaml)
+
+    Returns:
+        Connected session using the configured keyspace
+    """
+    cassandra_config = cass_config["cassandra"]
+    pool_config = cass_config.get("connection_pool", {})
+    key = (
+        tuple(cassandra_config["contact_points"]),
+        cassandra_config["port"],
+        cassandra_config.get("keyspace"),
+        cassandra_config.get("username"),
+        cassandra_config.get("password", ""),
+        cassandra_config.get("protocol_version", 4),
+        cassandra_config.get("compression", "lz4"),
+        cassandra_config.get("local_dc"),
+        cass_config.get("timeouts", {}).get("request_timeout", 30),
+        pool_config.get("core_connections_per_host", 8),
+        pool_config.get("max_requests_per_connection", 32768),
+    )
+    with _sessions_lock:
+        session = _sessions.get(key)
+        if session is None:
+            session = _sessions[key] = _connect(*key)
+    return session
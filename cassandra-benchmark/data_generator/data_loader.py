@@ -3,129 +3,385 @@ Data loader for TPC-C benchmark.
 Handles bulk loading of generated data into Cassandra.
 """
 
+import importlib.util
 import logging
-
-from cassandra.cluster import Session
-from cassandra.concurrent import execute_concurrent_with_args
+import multiprocessing
+import os
+import queue
+import threading
+import time
+import weakref
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from functools import partial
+from itertools import chain
+from operator import itemgetter
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, TypeVar, Union
+
+from cassandra.cluster import EXEC_PROFILE_DEFAULT, Cluster, ExecutionProfile, Session
+from cassandra.concurrent import execute_concurrent, execute_concurrent_with_args
+from cassandra.policies import DCAwareRoundRobinPolicy, HostDistance, TokenAwarePolicy
+from cassandra.query import BatchStatement, BatchType, PreparedStatement
 from data_generator.tpcc_data_generator import TPCCDataGenerator
 
 logger = logging.getLogger(__name__)
 
-
-class DataLoader:
-    """Loads TPC-C data into Cassandra."""
-
-    def __init__(self, session: Session, data_generator: TPCCDataGenerator):
-        """
-        Initialize data loader.
-
-        Args:
-            session: Active Cassandra session
-            data_generator: TPC-C data generator instance
-        """
-        self.session = session
-        self.generator = data_generator
-        self._prepare_statements()
-
-    def _prepare_statements(self) -> None:
-        """Prepare all insert statements."""
-        # Warehouse
-        self.insert_warehouse = self.session.prepare(
-            """
+T = TypeVar("T")
+
+# Warehouse and district dicts projected into their insert bind order
+_WAREHOUSE_ROW = itemgetter(
+    "w_id", "w_name", "w_street_1", "w_street_2", "w_city", "w_state", "w_zip", "w_tax", "w_ytd"
+)
+_DISTRICT_ROW = itemgetter(
+    "d_w_id",
+    "d_id",
+    "d_name",
+    "d_street_1",
+    "d_street_2",
+    "d_city",
+    "d_state",
+    "d_zip",
+    "d_tax",
+    "d_ytd",
+    "d_next_o_id",
+)
+
+
+# Insert statements by DataLoader attribute name
+_INSERT_CQL = {
+    # Warehouse
+    "insert_warehouse": """
             INSERT INTO warehouse (w_id, w_name, w_street_1, w_street_2, w_city,
                                   w_state, w_zip, w_tax, w_ytd)
             VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """
-        )
-
-        # District
-        self.insert_district = self.session.prepare(
-            """
+            """,
+    # District
+    "insert_district": """
             INSERT INTO district (d_w_id, d_id, d_name, d_street_1, d_street_2,
                                  d_city, d_state, d_zip, d_tax, d_ytd, d_next_o_id)
             VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """
-        )
-
-        # Customer
-        self.insert_customer = self.session.prepare(
-            """
+            """,
+    # Customer
+    "insert_customer": """
             INSERT INTO customer (c_w_id, c_d_id, c_id, c_first, c_middle, c_last,
                                  c_street_1, c_street_2, c_city, c_state, c_zip,
                                  c_phone, c_since, c_credit, c_credit_lim, c_discount,
                                  c_balance, c_ytd_payment, c_payment_cnt, c_delivery_cnt, c_data)
             VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """
-        )
-
-        # Customer by name
-        self.insert_customer_by_name = self.session.prepare(
-            """
+            """,
+    # Customer by name
+    "insert_customer_by_name": """
             INSERT INTO customer_by_name (c_w_id, c_d_id, c_last, c_first, c_id,
                                          c_middle, c_street_1, c_street_2, c_city,
                                          c_state, c_zip, c_phone, c_since, c_credit,
                                          c_credit_lim, c_discount, c_balance,
                                          c_ytd_payment, c_payment_cnt, c_delivery_cnt, c_data)
             VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """
-        )
-
-        # Item
-        self.insert_item = self.session.prepare(
-            """
+            """,
+    # Item
+    "insert_item": """
             INSERT INTO item (i_id, i_im_id, i_name, i_price, i_data)
             VALUES (?, ?, ?, ?, ?)
-            """
-        )
-
-        # Stock
-        self.insert_stock = self.session.prepare(
-            """
+            """,
+    # Stock
+    "insert_stock": """
             INSERT INTO stock (s_w_id, s_i_id, s_quantity, s_dist_01, s_dist_02,
                               s_dist_03, s_dist_04, s_dist_05, s_dist_06, s_dist_07,
                               s_dist_08, s_dist_09, s_dist_10, s_ytd, s_order_cnt,
                               s_remote_cnt, s_data)
             VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """
+            """,
+}
+
+# Prepared inserts per cluster, keyed by (keyspace, cql), kept for the cluster's lifetime
+_PREPARED: "weakref.WeakKeyDictionary[Any, Dict[Tuple[Any, str], PreparedStatement]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+class _Progress:
+    """Progress logger that emits at most one INFO message per interval."""
+
+    __slots__ = ("label", "total", "interval", "_next")
+
+    def __init__(self, label: str, total: int, interval: float = 1.0):
+        """
+        Initialize progress reporting.
+
+        Args:
+            label: What is being counted, e.g. "Submitted customers"
+            total: Expected final count
+            interval: Minimum seconds between messages
+        """
+        self.label = label
+        self.total = total
+        self.interval = interval
+        self._next = time.monotonic() + interval
+
+    def update(self, count: int) -> None:
+        """Log count/total if the interval has elapsed and INFO is enabled."""
+        now = time.monotonic()
+        if now >= self._next and logger.isEnabledFor(logging.INFO):
+            self._next = now + self.interval
+            logger.info(f"{self.label}: {count}/{self.total}")
+
+
+def _prefetch(items: Iterable[T], maxsize: int = 4, name: str = "prefetch") -> Iterator[T]:
+    """
+    Produce items on a background thread and hand them over through a bounded queue.
+
+    Lets CPU-bound generation run ahead of a consumer that mostly waits on I/O,
+    while maxsize caps how far ahead it gets. Producer errors are re-raised in the
+    consumer; closing the iterator early stops the producer.
+
+    Args:
+        items: Source iterable, consumed on the producer thread
+        maxsize: Maximum number of items produced but not yet consumed
+        name: Producer thread name
+
+    Yields:
+        Items of the source iterable, in order
+    """
+    handoff: "queue.Queue[Tuple[bool, Any]]" = queue.Queue(maxsize=maxsize)
+    stop = threading.Event()
+
+    def put(entry: Tuple[bool, Any]) -> bool:
+        while not stop.is_set():
+            try:
+                handoff.put(entry, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce() -> None:
+        try:
+            for item in items:
+                if not put((False, item)):
+                    return
+        except BaseException as e:
+            put((True, e))
+        else:
+            put((True, None))
+
+    producer = threading.Thread(target=produce, name=name, daemon=True)
+    producer.start()
+    try:
+        while True:
+            finished, item = handoff.get()
+            if finished:
+                if item is not None:
+                    raise item
+                return
+            yield item
+    finally:
+        stop.set()
+        producer.join()
+
+
+def _generate_warehouse_rows(
+    w_id: int, scale: Tuple[int, int, int, int]
+) -> Tuple[Tuple[Any, ...], List[Tuple[Any, ...]], List[Tuple[Any, ...]]]:
+    """
+    Generate one warehouse's warehouse, district and customer rows.
+
+    Runs in a worker process. Like the serial loaders it is unseeded, so both paths
+    produce equally random data for the same configuration.
+
+    Args:
+        w_id: Warehouse ID
+        scale: (num_warehouses, num_districts_per_warehouse, num_customers_per_district,
+            num_items) of the parent generator
+
+    Returns:
+        Tuple of (warehouse row, district rows, customer rows) in insert bind order
+    """
+    generator = TPCCDataGenerator(*scale)
+    districts = range(1, generator.num_districts_per_warehouse + 1)
+    now = datetime.now()
+    return (
+        _WAREHOUSE_ROW(generator.generate_warehouse(w_id)),
+        [_DISTRICT_ROW(generator.generate_district(d_id, w_id)) for d_id in districts],
+        [
+            row
+            for d_id in districts
+            for row in generator.generate_district_customer_rows(d_id, w_id, now)
+        ],
+    )
+
+
+class DataLoader:
+    """Loads TPC-C data into Cassandra."""
+
+    def __init__(self, session: Session, data_generator: TPCCDataGenerator):
+        """
+        Initialize data loader.
+
+        Args:
+            session: Active Cassandra session
+            data_generator: TPC-C data generator instance
+        """
+        self.session = session
+        self.generator = data_generator
+        self._prepare_statements()
+
+    @classmethod
+    def build_session(
+        cls,
+        contact_points: List[str],
+        port: int = 9042,
+        keyspace: Optional[str] = None,
+        auth_provider: Any = None,
+        protocol_version: int = 5,
+        compression: Union[bool, str] = "lz4",
+        local_dc: Optional[str] = None,
+        request_timeout: float = 30,
+        core_connections_per_host: int = 8,
+        max_requests_per_connection: int = 32768,
+        connection_class: Any = None,
+    ) -> Session:
+        """
+        Build a session tuned for bulk loading.
+
+        Writes are routed token-aware, so each prepared insert goes straight to a replica
+        instead of through an extra coordinator hop. The per-host pool sizing only applies
+        to protocol v1/v2; v3 and later multiplex up to 32768 streams over each connection
+        and the driver rejects those settings.
+
+        LZ4 frame compression shrinks the highly redundant insert payloads on the wire.
+        It needs the optional lz4 package; without it the driver's default is used.
+
+        Args:
+            contact_points: Cassandra contact points
+            port: Native transport port
+            keyspace: Keyspace to use, if any
+            auth_provider: Driver auth provider, if any
+            protocol_version: Native protocol version
+            compression: Driver compression setting ("lz4", "snappy", True or False)
+            local_dc: Local datacenter name (None lets the driver infer it)
+            request_timeout: Default request timeout in seconds
+            core_connections_per_host: Core connections per local host (protocol v1/v2)
+            max_requests_per_connection: Max in-flight requests per connection (protocol v1/v2)
+            connection_class: Driver connection (reactor) class; None keeps the driver default
+
+        Returns:
+            Connected session; shut it down via session.cluster.shutdown()
+        """
+        profile = ExecutionProfile(
+            load_balancing_policy=TokenAwarePolicy(DCAwareRoundRobinPolicy(local_dc=local_dc)),
+            request_timeout=request_timeout,
+        )
+        if compression == "lz4" and importlib.util.find_spec("lz4") is None:
+            logger.warning("lz4 is not installed; using the driver's default compression")
+            compression = True
+
+        options = {} if connection_class is None else {"connection_class": connection_class}
+        cluster = Cluster(
+            contact_points=contact_points,
+            port=port,
+            auth_provider=auth_provider,
+            protocol_version=protocol_version,
+            compression=compression,
+            execution_profiles={EXEC_PROFILE_DEFAULT: profile},
+            **options,
+        )
+        if protocol_version < 3:
+            cluster.set_core_connections_per_host(HostDistance.LOCAL, core_connections_per_host)
+            cluster.set_max_requests_per_connection(HostDistance.LOCAL, max_requests_per_connection)
+
+        session = cluster.connect(keyspace)
+        logger.info(
+            f"Connected to Cassandra cluster at {contact_points} "
+            f"(token-aware, protocol v{cluster.protocol_version}, compression={compression})"
         )
+        return session
 
-    def load_warehouses(self) -> int:
+    def _prepare_statements(self) -> None:
+        """
+        Prepare all insert statements, with their round trips in flight together.
+
+        Statements already prepared on this cluster and keyspace by an earlier loader
+        are reused, so only the first DataLoader per cluster pays the round trips.
         """
-        Load warehouse data.
+        cache = _PREPARED.setdefault(self.session.cluster, {})
+        keyspace = self.session.keyspace
+        missing = [cql for cql in _INSERT_CQL.values() if (keyspace, cql) not in cache]
+        if missing:
+            with ThreadPoolExecutor(max_workers=len(missing)) as pool:
+                for cql, statement in zip(missing, pool.map(self.session.prepare, missing)):
+                    # Plain inserts can be safely retried or sent speculatively to another replica
+                    statement.is_idempotent = True
+                    cache[keyspace, cql] = statement
+
+        for name, cql in _INSERT_CQL.items():
+            setattr(self, name, cache[keyspace, cql])
+
+    def _flush(self, statement: PreparedStatement, params: List[Any], concurrency: int) -> None:
+        """
+        Submit a slab of parameters concurrently and wait for every write.
+
+        The in-flight cap stays fixed at concurrency whatever the slab size, and
+        draining the results generator surfaces the first failed write.
+
+        Args:
+            statement: Prepared insert
+            params: Bind values for each row
+            concurrency: Maximum concurrent executions
+        """
+        deque(
+            execute_concurrent_with_args(
+                self.session, statement, params, concurrency=concurrency, results_generator=True
+            ),
+            maxlen=0,
+        )
+
+    def load_warehouses(self, batch_size: int = 100) -> int:
+        """
+        Load warehouse data using concurrent execution.
+
+        Args:
+            batch_size: Number of concurrent executions
 
         Returns:
             Number of warehouses loaded
         """
         logger.info(f"Loading {self.generator.num_warehouses} warehouses...")
 
-        count = 0
+        # One slab is allocated up front and refilled in place; _flush awaits every
+        # write before it is reused
+        warehouse_params: List[Any] = [None] * batch_size
+        generate, statement, flush = (
+            self.generator.generate_warehouse,
+            self.insert_warehouse,
+            self._flush,
+        )
+        progress = _Progress("Loaded warehouses", self.generator.num_warehouses)
+        count = k = 0
+
         for w_id in range(1, self.generator.num_warehouses + 1):
-            warehouse = self.generator.generate_warehouse(w_id)
-            self.session.execute(
-                self.insert_warehouse,
-                [
-                    warehouse["w_id"],
-                    warehouse["w_name"],
-                    warehouse["w_street_1"],
-                    warehouse["w_street_2"],
-                    warehouse["w_city"],
-                    warehouse["w_state"],
-                    warehouse["w_zip"],
-                    warehouse["w_tax"],
-                    warehouse["w_ytd"],
-                ],
-            )
+            warehouse_params[k] = _WAREHOUSE_ROW(generate(w_id))
+            k += 1
             count += 1
 
-            if count % 10 == 0:
-                logger.info(f"Loaded {count} warehouses")
+            # Execute in batches
+            if k == batch_size:
+                flush(statement, warehouse_params, batch_size)
+                progress.update(count)
+                k = 0
+
+        if k:
+            flush(statement, warehouse_params[:k], batch_size)
 
         logger.info(f"Loaded {count} warehouses successfully")
         return count
 
-    def load_districts(self) -> int:
+    def load_districts(self, batch_size: int = 100) -> int:
         """
-        Load district data.
+        Load district data using concurrent execution.
+
+        Args:
+            batch_size: Number of concurrent executions
 
         Returns:
             Number of districts loaded
@@ -133,38 +389,108 @@ class DataLoader:
         total = self.generator.num_warehouses * self.generator.num_districts_per_warehouse
         logger.info(f"Loading {total} districts...")
 
-        count = 0
+        district_params: List[Any] = [None] * batch_size
+        generate, statement, flush = (
+            self.generator.generate_district,
+            self.insert_district,
+            self._flush,
+        )
+        progress = _Progress("Loaded districts", total)
+        count = k = 0
+
         for w_id in range(1, self.generator.num_warehouses + 1):
             for d_id in range(1, self.generator.num_districts_per_warehouse + 1):
-                district = self.generator.generate_district(d_id, w_id)
-                self.session.execute(
-                    self.insert_district,
-                    [
-                        district["d_w_id"],
-                        district["d_id"],
-                        district["d_name"],
-                        district["d_street_1"],
-                        district["d_street_2"],
-                        district["d_city"],
-                        district["d_state"],
-                        district["d_zip"],
-                        district["d_tax"],
-                        district["d_ytd"],
-                        district["d_next_o_id"],
-                    ],
-                )
+                district_params[k] = _DISTRICT_ROW(generate(d_id, w_id))
+                k += 1
                 count += 1
 
-                if count % 100 == 0:
-                    logger.info(f"Loaded {count}/{total} districts")
+                # Execute in batches
+                if k == batch_size:
+                    flush(statement, district_params, batch_size)
+                    progress.update(count)
+                    k = 0
+
+        if k:
+            flush(statement, district_params[:k], batch_size)
 
         logger.info(f"Loaded {count} districts successfully")
         return count
 
+    def _customer_tables_share_partition(self) -> bool:
+        """
+        Check whether customer and customer_by_name share a partition key.
+
+        Only then do a customer's two rows land in the same partition, so they can be
+        written as one single-partition batch. Missing schema metadata counts as a mismatch.
+
+        Returns:
+            True if both tables are partitioned by the same columns
+        """
+        try:
+            tables = self.session.cluster.metadata.keyspaces[self.session.keyspace].tables
+            customer_key = [column.name for column in tables["customer"].partition_key]
+            by_name_key = [column.name for column in tables["customer_by_name"].partition_key]
+        except (AttributeError, KeyError, TypeError):
+            return False
+        return bool(customer_key) and customer_key == by_name_key
+
+    def _customer_pairs(
+        self, rows: Iterable[Tuple[Any, ...]], fuse: bool = False
+    ) -> Iterator[Tuple[Any, Tuple[Any, ...]]]:
+        """
+        Turn customer rows into (statement, params) pairs for both customer tables.
+
+        Each customer row yields its customer insert followed by its customer_by_name
+        insert. With fuse set, both are instead wrapped in one UNLOGGED batch.
+
+        Args:
+            rows: Customer rows in CUSTOMER_COLUMNS order
+            fuse: Combine each customer's two inserts into a single-partition batch
+        """
+        by_name = self.generator.generate_customer_by_name_row
+        for customer_row in rows:
+            by_name_row = by_name(customer_row)
+            if fuse:
+                batch = BatchStatement(batch_type=BatchType.UNLOGGED)
+                batch.add(self.insert_customer, customer_row)
+                batch.add(self.insert_customer_by_name, by_name_row)
+                yield batch, ()
+            else:
+                yield self.insert_customer, customer_row
+                yield self.insert_customer_by_name, by_name_row
+
+    def _district_customer_rows(self) -> Iterator[List[Tuple[Any, ...]]]:
+        """Generate customer rows one district at a time."""
+        now = datetime.now()
+        for w_id in range(1, self.generator.num_warehouses + 1):
+            for d_id in range(1, self.generator.num_districts_per_warehouse + 1):
+                yield self.generator.generate_district_customer_rows(d_id, w_id, now)
+
+    def _customer_rows(self, total: int) -> Iterator[Tuple[Any, ...]]:
+        """
+        Lazily generate every customer row, district by district.
+
+        Districts are generated on a producer thread a few slabs ahead of the caller,
+        so generation overlaps with waiting on Cassandra writes.
+
+        Args:
+            total: Total number of customers, for progress logging
+        """
+        progress = _Progress("Submitted customers", total)
+        count = 0
+        for rows in _prefetch(self._district_customer_rows(), name="customer-generator"):
+            yield from rows
+            count += len(rows)
+            progress.update(count)
+
     def load_customers(self, batch_size: int = 50) -> int:
         """
         Load customer data using concurrent execution for better performance.
 
+        Rows for the customer and customer_by_name tables are streamed from a generator
+        into a single concurrent submission, so no parameter lists are buffered. When
+        both tables share a partition key, each customer's pair is sent as one batch.
+
         Args:
             batch_size: Number of concurrent executions
 
@@ -176,108 +502,22 @@ class DataLoader:
             * self.generator.num_districts_per_warehouse
             * self.generator.num_customers_per_district
         )
-        logger.info(f"Loading {total} customers...")
+        fuse = self._customer_tables_share_partition()
+        logger.info(f"Loading {total} customers{' (batched per customer)' if fuse else ''}...")
 
-        count = 0
-        customer_params = []
-        customer_by_name_params = []
-
-        for w_id in range(1, self.generator.num_warehouses + 1):
-            for d_id in range(1, self.generator.num_districts_per_warehouse + 1):
-                for c_id in range(1, self.generator.num_customers_per_district + 1):
-                    customer = self.generator.generate_customer(c_id, d_id, w_id)
-
-                    # Prepare parameters for customer table
-                    customer_params.append(
-                        [
-                            customer["c_w_id"],
-                            customer["c_d_id"],
-                            customer["c_id"],
-                            customer["c_first"],
-                            customer["c_middle"],
-                            customer["c_last"],
-                            customer["c_street_1"],
-                            customer["c_street_2"],
-                            customer["c_city"],
-                            customer["c_state"],
-                            customer["c_zip"],
-                            customer["c_phone"],
-                            customer["c_since"],
-                            customer["c_credit"],
-                            customer["c_credit_lim"],
-                            customer["c_discount"],
-                            customer["c_balance"],
-                            customer["c_ytd_payment"],
-                            customer["c_payment_cnt"],
-                            customer["c_delivery_cnt"],
-                            customer["c_data"],
-                        ]
-                    )
-
-                    # Prepare parameters for customer_by_name table
-                    customer_by_name_params.append(
-                        [
-                            customer["c_w_id"],
-                            customer["c_d_id"],
-                            customer["c_last"],
-                            customer["c_first"],
-                            customer["c_id"],
-                            customer["c_middle"],
-                            customer["c_street_1"],
-                            customer["c_street_2"],
-                            customer["c_city"],
-                            customer["c_state"],
-                            customer["c_zip"],
-                            customer["c_phone"],
-                            customer["c_since"],
-                            customer["c_credit"],
-                            customer["c_credit_lim"],
-                            customer["c_discount"],
-                            customer["c_balance"],
-                            customer["c_ytd_payment"],
-                            customer["c_payment_cnt"],
-                            customer["c_delivery_cnt"],
-                            customer["c_data"],
-                        ]
-                    )
-
-                    count += 1
-
-                    # Execute in batches
-                    if len(customer_params) >= batch_size:
-                        execute_concurrent_with_args(
-                            self.session,
-                            self.insert_customer,
-                            customer_params,
-                            concurrency=batch_size,
-                        )
-                        execute_concurrent_with_args(
-                            self.session,
-                            self.insert_customer_by_name,
-                            customer_by_name_params,
-                            concurrency=batch_size,
-                        )
-                        logger.info(f"Loaded {count}/{total} customers")
-                        customer_params = []
-                        customer_by_name_params = []
-
-        # Execute remaining
-        if customer_params:
-            execute_concurrent_with_args(
+        # Draining the results generator waits for every write and surfaces the first error
+        deque(
+            execute_concurrent(
                 self.session,
-                self.insert_customer,
-                customer_params,
-                concurrency=len(customer_params),
-            )
-            execute_concurrent_with_args(
-                self.session,
-                self.insert_customer_by_name,
-                customer_by_name_params,
-                concurrency=len(customer_by_name_params),
-            )
+                self._customer_pairs(self._customer_rows(total), fuse),
+                concurrency=batch_size,
+                results_generator=True,
+            ),
+            maxlen=0,
+        )
 
-        logger.info(f"Loaded {count} customers successfully")
-        return count
+        logger.info(f"Loaded {total} customers successfully")
+        return total
 
     def load_items(self, batch_size: int = 100) -> int:
         """
@@ -291,48 +531,101 @@ class DataLoader:
         """
         logger.info(f"Loading {self.generator.num_items} items...")
 
+        total = self.generator.num_items
+        progress = _Progress("Loaded items", total)
         count = 0
-        item_params = []
+        for first_id in range(1, total + 1, batch_size):
+            rows = self.generator.generate_item_rows(first_id, min(batch_size, total - count))
+            self._flush(self.insert_item, rows, batch_size)
+            count += len(rows)
+            progress.update(count)
 
-        for i_id in range(1, self.generator.num_items + 1):
-            item = self.generator.generate_item(i_id)
-            item_params.append(
-                [item["i_id"], item["i_im_id"], item["i_name"], item["i_price"], item["i_data"]]
-            )
-            count += 1
+        logger.info(f"Loaded {count} items successfully")
+        return count
 
-            # Execute in batches
-            if len(item_params) >= batch_size:
-                execute_concurrent_with_args(
-                    self.session, self.insert_item, item_params, concurrency=batch_size
-                )
-                logger.info(f"Loaded {count}/{self.generator.num_items} items")
-                item_params = []
+    def load_warehouses_parallel(
+        self, processes: Optional[int] = None, concurrency: int = 50
+    ) -> Dict[str, int]:
+        """
+        Load warehouses, districts and customers, generating one warehouse per worker.
 
-        # Execute remaining
-        if item_params:
-            execute_concurrent_with_args(
-                self.session, self.insert_item, item_params, concurrency=len(item_params)
+        Generation is CPU-bound and embarrassingly parallel by warehouse, so it runs in a
+        process pool while this process submits each finished warehouse's rows.
+
+        Args:
+            processes: Worker processes (defaults to the CPU count)
+            concurrency: Number of concurrent executions
+
+        Returns:
+            Dictionary with counts of loaded warehouses, districts and customers
+        """
+        num_warehouses = self.generator.num_warehouses
+        scale = (
+            num_warehouses,
+            self.generator.num_districts_per_warehouse,
+            self.generator.num_customers_per_district,
+            self.generator.num_items,
+        )
+        processes = min(processes or os.cpu_count() or 1, num_warehouses)
+        fuse = self._customer_tables_share_partition()
+        logger.info(f"Generating {num_warehouses} warehouses across {processes} processes...")
+
+        counts = {"warehouses": 0, "districts": 0, "customers": 0}
+        progress = _Progress("Loaded warehouses", num_warehouses)
+        # spawn rather than fork: the parent already runs driver I/O threads
+        context = multiprocessing.get_context("spawn")
+        with context.Pool(processes=processes) as pool:
+            results = pool.imap_unordered(
+                partial(_generate_warehouse_rows, scale=scale),
+                range(1, num_warehouses + 1),
+                chunksize=1,
             )
+            for warehouse, districts, customers in results:
+                statements = chain(
+                    ((self.insert_warehouse, warehouse),),
+                    ((self.insert_district, district) for district in districts),
+                    self._customer_pairs(customers, fuse),
+                )
+                deque(
+                    execute_concurrent(
+                        self.session,
+                        statements,
+                        concurrency=concurrency,
+                        results_generator=True,
+                    ),
+                    maxlen=0,
+                )
+                counts["warehouses"] += 1
+                counts["districts"] += len(districts)
+                counts["customers"] += len(customers)
+                progress.update(counts["warehouses"])
 
-        logger.info(f"Loaded {count} items successfully")
-        return count
+        logger.info(f"Loaded {counts} successfully")
+        return counts
 
-    def load_all_data(self) -> dict:
+    def load_all_data(self, processes: Optional[int] = None) -> dict:
         """
         Load all TPC-C data.
 
+        Args:
+            processes: Worker processes for warehouse generation; None or 1 generates
+                everything in this process. Each worker sends its warehouse's rows back
+                to this process, so only use it when generation is the bottleneck.
+
         Returns:
             Dictionary with counts of loaded records
         """
         logger.info("Starting full data load...")
 
-        result = {
-            "warehouses": self.load_warehouses(),
-            "districts": self.load_districts(),
-            "customers": self.load_customers(),
-            "items": self.load_items(),
-        }
+        if processes and min(processes, self.generator.num_warehouses) > 1:
+            result = self.load_warehouses_parallel(processes)
+        else:
+            result = {
+                "warehouses": self.load_warehouses(),
+                "districts": self.load_districts(),
+                "customers": self.load_customers(),
+            }
+        result["items"] = self.load_items()
 
         logger.info(f"Data load complete: {result}")
         return result
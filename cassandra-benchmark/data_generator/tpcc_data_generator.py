@@ -5,8 +5,76 @@ Generates realistic test data based on TPC-C specifications.
 
 import random
 import string
-from datetime import datetime, timedelta
-from typing import Any, Dict
+import time
+from datetime import datetime
+from operator import itemgetter
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+# c_credit by "is good credit"
+_CREDIT = ("BC", "GC")
+
+# Timestamp arithmetic in epoch milliseconds, the driver's native timestamp encoding
+_DAY_MS = 86_400_000
+
+# Candidates pre-generated per fixed-length column; rows pick one instead of drawing chars.
+# This caps c_state/w_state/d_state, the zip columns and s_dist_*/ol_dist_info at this many
+# distinct values per generator. c_phone is still drawn per row to keep it near-unique.
+STRING_POOL_SIZE = 4096
+
+# Customer columns in the bind order of the customer table insert
+CUSTOMER_COLUMNS = (
+    "c_w_id",
+    "c_d_id",
+    "c_id",
+    "c_first",
+    "c_middle",
+    "c_last",
+    "c_street_1",
+    "c_street_2",
+    "c_city",
+    "c_state",
+    "c_zip",
+    "c_phone",
+    "c_since",
+    "c_credit",
+    "c_credit_lim",
+    "c_discount",
+    "c_balance",
+    "c_ytd_payment",
+    "c_payment_cnt",
+    "c_delivery_cnt",
+    "c_data",
+)
+
+# customer_by_name binds (c_last, c_first, c_id, c_middle) straight after the partition key
+_BY_NAME_ORDER = itemgetter(0, 1, 5, 3, 2, 4, *range(6, len(CUSTOMER_COLUMNS)))
+
+
+def _byte_table(alphabet: str):
+    """
+    Build a bytes.translate table mapping random bytes onto alphabet.
+
+    Bytes past the largest multiple of len(alphabet) are returned for deletion, so
+    every character stays equally likely.
+    """
+    codes = alphabet.encode("ascii")
+    cutoff = 256 - 256 % len(codes)
+    table = bytes(codes[b % len(codes)] for b in range(cutoff)) + bytes(256 - cutoff)
+    return table, bytes(range(cutoff, 256))
+
+
+_ALPHANUM_TABLE, _ALPHANUM_REJECT = _byte_table(string.ascii_uppercase + string.digits)
+_DIGIT_TABLE, _DIGIT_REJECT = _byte_table(string.digits)
+
+
+def _random_text(length: int, table: bytes, reject: bytes, _randbytes=random.randbytes) -> str:
+    """Draw length random bytes and translate them to text in C, topping up rejects."""
+    raw = _randbytes(length + length // 32 + 8).translate(table, reject)
+    while len(raw) < length:
+        raw += _randbytes(length).translate(table, reject)
+    return raw[:length].decode("ascii")
 
 
 class TPCCDataGenerator:
@@ -18,6 +86,7 @@ class TPCCDataGenerator:
         num_districts_per_warehouse: int = 10,
         num_customers_per_district: int = 3000,
         num_items: int = 100000,
+        seed: Optional[int] = None,
     ):
         """
         Initialize data generator with scale factors.
@@ -27,6 +96,7 @@ class TPCCDataGenerator:
             num_districts_per_warehouse: Districts per warehouse
             num_customers_per_district: Customers per district
             num_items: Total number of items
+            seed: Seed for the batch (numpy) generators; None draws fresh entropy
         """
         self.num_warehouses = num_warehouses
         self.num_districts_per_warehouse = num_districts_per_warehouse
@@ -34,7 +104,7 @@ class TPCCDataGenerator:
         self.num_items = num_items
 
         # Common last names for TPC-C
-        self.last_names = [
+        self.last_names = (
             "SMITH",
             "JONES",
             "WILLIAMS",
@@ -45,21 +115,52 @@ class TPCCDataGenerator:
             "GARCIA",
             "RODRIGUEZ",
             "WILSON",
+        )
+        self._rng = np.random.default_rng(seed)
+
+        # Fixed-length columns draw from pools; variable-length text stays dynamic
+        self._state_pool = self.generate_random_strings(STRING_POOL_SIZE, 2, 2)
+        self._zip_pool = [
+            prefix + "11111" for prefix in self.generate_random_numeric_strings(STRING_POOL_SIZE, 4)
         ]
+        self._dist_pool = self.generate_random_strings(STRING_POOL_SIZE, 24, 24)
 
     def generate_random_string(self, min_len: int, max_len: int) -> str:
         """Generate random alphanumeric string."""
         length = random.randint(min_len, max_len)
-        return "".join(random.choices(string.ascii_uppercase + string.digits, k=length))
+        return _random_text(length, _ALPHANUM_TABLE, _ALPHANUM_REJECT)
 
     def generate_random_numeric_string(self, length: int) -> str:
         """Generate random numeric string."""
-        return "".join(random.choices(string.digits, k=length))
+        return _random_text(length, _DIGIT_TABLE, _DIGIT_REJECT)
 
     def generate_zip(self) -> str:
         """Generate random ZIP code."""
         return self.generate_random_numeric_string(4) + "11111"
 
+    def _random_strings(
+        self, count: int, min_len: int, max_len: int, table: bytes, reject: bytes
+    ) -> List[str]:
+        """Generate count random strings through a translate table in one vectorized draw."""
+        lengths = self._rng.integers(min_len, max_len + 1, size=count)
+        ends = np.cumsum(lengths)
+        # Draw raw bytes below the table's cutoff so every character is equally likely,
+        # then map them to text with one C-level translate and one ASCII decode
+        raw = self._rng.integers(
+            0, 256 - len(reject), size=int(ends[-1]) if count else 0, dtype=np.uint8
+        )
+        text = raw.tobytes().translate(table).decode("ascii")
+        bounds = ends.tolist()
+        return [text[start:end] for start, end in zip([0] + bounds[:-1], bounds)]
+
+    def generate_random_strings(self, count: int, min_len: int, max_len: int) -> List[str]:
+        """Generate a batch of random alphanumeric strings."""
+        return self._random_strings(count, min_len, max_len, _ALPHANUM_TABLE, _ALPHANUM_REJECT)
+
+    def generate_random_numeric_strings(self, count: int, length: int) -> List[str]:
+        """Generate a batch of random numeric strings."""
+        return self._random_strings(count, length, length, _DIGIT_TABLE, _DIGIT_REJECT)
+
     def generate_warehouse(self, w_id: int) -> Dict[str, Any]:
         """
         Generate warehouse data.
@@ -76,8 +177,8 @@ class TPCCDataGenerator:
             "w_street_1": self.generate_random_string(10, 20),
             "w_street_2": self.generate_random_string(10, 20),
             "w_city": self.generate_random_string(10, 20),
-            "w_state": self.generate_random_string(2, 2),
-            "w_zip": self.generate_zip(),
+            "w_state": random.choice(self._state_pool),
+            "w_zip": random.choice(self._zip_pool),
             "w_tax": round(random.uniform(0.0, 0.2), 4),
             "w_ytd": 300000.00,
         }
@@ -100,14 +201,69 @@ class TPCCDataGenerator:
             "d_street_1": self.generate_random_string(10, 20),
             "d_street_2": self.generate_random_string(10, 20),
             "d_city": self.generate_random_string(10, 20),
-            "d_state": self.generate_random_string(2, 2),
-            "d_zip": self.generate_zip(),
+            "d_state": random.choice(self._state_pool),
+            "d_zip": random.choice(self._zip_pool),
             "d_tax": round(random.uniform(0.0, 0.2), 4),
             "d_ytd": 30000.00,
             "d_next_o_id": 3001,
         }
 
-    def generate_customer(self, c_id: int, d_id: int, w_id: int) -> Dict[str, Any]:
+    def generate_customer_row(
+        self, c_id: int, d_id: int, w_id: int, now: Optional[datetime] = None
+    ) -> Tuple[Any, ...]:
+        """
+        Generate customer data as a tuple in CUSTOMER_COLUMNS order.
+
+        Args:
+            c_id: Customer ID
+            d_id: District ID
+            w_id: Warehouse ID
+            now: Creation timestamp; defaults to datetime.now(). Pass one shared value
+                when generating in bulk to skip the per-row clock read
+
+        Returns:
+            Customer row tuple, ready to bind to the customer insert
+        """
+        return (
+            w_id,
+            d_id,
+            c_id,
+            self.generate_random_string(8, 16),
+            "OE",
+            random.choice(self.last_names),
+            self.generate_random_string(10, 20),
+            self.generate_random_string(10, 20),
+            self.generate_random_string(10, 20),
+            random.choice(self._state_pool),
+            random.choice(self._zip_pool),
+            self.generate_random_numeric_string(16),
+            now or datetime.now(),
+            "GC" if random.random() > 0.1 else "BC",
+            50000.00,
+            round(random.uniform(0.0, 0.5), 4),
+            -10.00,
+            10.00,
+            1,
+            0,
+            self.generate_random_string(300, 500),
+        )
+
+    @staticmethod
+    def generate_customer_by_name_row(customer_row: Tuple[Any, ...]) -> Tuple[Any, ...]:
+        """
+        Reorder a customer row into the bind order of the customer_by_name insert.
+
+        Args:
+            customer_row: Row from generate_customer_row or generate_district_customer_rows
+
+        Returns:
+            The same customer's values ordered for customer_by_name
+        """
+        return _BY_NAME_ORDER(customer_row)
+
+    def generate_customer(
+        self, c_id: int, d_id: int, w_id: int, now: Optional[datetime] = None
+    ) -> Dict[str, Any]:
         """
         Generate customer data.
 
@@ -115,33 +271,91 @@ class TPCCDataGenerator:
             c_id: Customer ID
             d_id: District ID
             w_id: Warehouse ID
+            now: Creation timestamp; defaults to datetime.now()
 
         Returns:
             Customer data dictionary
         """
-        return {
-            "c_id": c_id,
-            "c_d_id": d_id,
-            "c_w_id": w_id,
-            "c_first": self.generate_random_string(8, 16),
-            "c_middle": "OE",
-            "c_last": random.choice(self.last_names),
-            "c_street_1": self.generate_random_string(10, 20),
-            "c_street_2": self.generate_random_string(10, 20),
-            "c_city": self.generate_random_string(10, 20),
-            "c_state": self.generate_random_string(2, 2),
-            "c_zip": self.generate_zip(),
-            "c_phone": self.generate_random_numeric_string(16),
-            "c_since": datetime.now(),
-            "c_credit": "GC" if random.random() > 0.1 else "BC",
-            "c_credit_lim": 50000.00,
-            "c_discount": round(random.uniform(0.0, 0.5), 4),
-            "c_balance": -10.00,
-            "c_ytd_payment": 10.00,
-            "c_payment_cnt": 1,
-            "c_delivery_cnt": 0,
-            "c_data": self.generate_random_string(300, 500),
-        }
+        return dict(zip(CUSTOMER_COLUMNS, self.generate_customer_row(c_id, d_id, w_id, now)))
+
+    def generate_district_customer_rows(
+        self, d_id: int, w_id: int, now: Optional[datetime] = None
+    ) -> List[Tuple[Any, ...]]:
+        """
+        Generate every customer of a district as tuples in CUSTOMER_COLUMNS order.
+
+        The random string columns are drawn for the whole district at once, which is
+        far cheaper than per-customer generation at full TPC-C scale. The clock is
+        read at most once, so every customer of the district shares c_since.
+
+        Args:
+            d_id: District ID
+            w_id: Warehouse ID
+            now: Creation timestamp; defaults to datetime.now()
+
+        Returns:
+            Customer row tuples ordered by customer ID
+        """
+        n = self.num_customers_per_district
+        firsts = self.generate_random_strings(n, 8, 16)
+        streets_1 = self.generate_random_strings(n, 10, 20)
+        streets_2 = self.generate_random_strings(n, 10, 20)
+        cities = self.generate_random_strings(n, 10, 20)
+        states = random.choices(self._state_pool, k=n)
+        zips = random.choices(self._zip_pool, k=n)
+        phones = self.generate_random_numeric_strings(n, 16)
+        data = self.generate_random_strings(n, 300, 500)
+        discounts = np.round(self._rng.uniform(0.0, 0.5, size=n), 4).tolist()
+        last_names = random.choices(self.last_names, k=n)
+        # 90% good credit; index the two constants by the mask instead of building strings
+        credits = [_CREDIT[good] for good in (self._rng.random(n) > 0.1).tolist()]
+        now = now or datetime.now()
+
+        return [
+            (
+                w_id,
+                d_id,
+                i + 1,
+                firsts[i],
+                "OE",
+                last_names[i],
+                streets_1[i],
+                streets_2[i],
+                cities[i],
+                states[i],
+                zips[i],
+                phones[i],
+                now,
+                credits[i],
+                50000.00,
+                discounts[i],
+                -10.00,
+                10.00,
+                1,
+                0,
+                data[i],
+            )
+            for i in range(n)
+        ]
+
+    def generate_district_customers(
+        self, d_id: int, w_id: int, now: Optional[datetime] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Generate every customer of a district.
+
+        Args:
+            d_id: District ID
+            w_id: Warehouse ID
+            now: Creation timestamp; defaults to datetime.now()
+
+        Returns:
+            Customer data dictionaries ordered by customer ID
+        """
+        return [
+            dict(zip(CUSTOMER_COLUMNS, row))
+            for row in self.generate_district_customer_rows(d_id, w_id, now)
+        ]
 
     def generate_item(self, i_id: int) -> Dict[str, Any]:
         """
@@ -161,6 +375,30 @@ class TPCCDataGenerator:
             "i_data": self.generate_random_string(26, 50),
         }
 
+    def generate_item_rows(self, first_id: int, count: int) -> List[Tuple[Any, ...]]:
+        """
+        Generate consecutive items as tuples in item insert bind order.
+
+        Numeric columns come from vectorized numpy draws and strings from the batch
+        generators, instead of per-item random calls.
+
+        Args:
+            first_id: ID of the first item
+            count: Number of items
+
+        Returns:
+            Rows of (i_id, i_im_id, i_name, i_price, i_data)
+        """
+        return list(
+            zip(
+                range(first_id, first_id + count),
+                self._rng.integers(1, 10000, size=count, endpoint=True).tolist(),
+                self.generate_random_strings(count, 14, 24),
+                np.round(self._rng.uniform(1.0, 100.0, size=count), 2).tolist(),
+                self.generate_random_strings(count, 26, 50),
+            )
+        )
+
     def generate_stock(self, i_id: int, w_id: int) -> Dict[str, Any]:
         """
         Generate stock data.
@@ -172,27 +410,30 @@ class TPCCDataGenerator:
         Returns:
             Stock data dictionary
         """
+        dists = random.choices(self._dist_pool, k=10)
         return {
             "s_i_id": i_id,
             "s_w_id": w_id,
             "s_quantity": random.randint(10, 100),
-            "s_dist_01": self.generate_random_string(24, 24),
-            "s_dist_02": self.generate_random_string(24, 24),
-            "s_dist_03": self.generate_random_string(24, 24),
-            "s_dist_04": self.generate_random_string(24, 24),
-            "s_dist_05": self.generate_random_string(24, 24),
-            "s_dist_06": self.generate_random_string(24, 24),
-            "s_dist_07": self.generate_random_string(24, 24),
-            "s_dist_08": self.generate_random_string(24, 24),
-            "s_dist_09": self.generate_random_string(24, 24),
-            "s_dist_10": self.generate_random_string(24, 24),
+            "s_dist_01": dists[0],
+            "s_dist_02": dists[1],
+            "s_dist_03": dists[2],
+            "s_dist_04": dists[3],
+            "s_dist_05": dists[4],
+            "s_dist_06": dists[5],
+            "s_dist_07": dists[6],
+            "s_dist_08": dists[7],
+            "s_dist_09": dists[8],
+            "s_dist_10": dists[9],
             "s_ytd": 0,
             "s_order_cnt": 0,
             "s_remote_cnt": 0,
             "s_data": self.generate_random_string(26, 50),
         }
 
-    def generate_order(self, o_id: int, d_id: int, w_id: int, c_id: int) -> Dict[str, Any]:
+    def generate_order(
+        self, o_id: int, d_id: int, w_id: int, c_id: int, now_ms: Optional[int] = None
+    ) -> Dict[str, Any]:
         """
         Generate order data.
 
@@ -201,23 +442,30 @@ class TPCCDataGenerator:
             d_id: District ID
             w_id: Warehouse ID
             c_id: Customer ID
+            now_ms: Reference time in epoch milliseconds the entry date is offset from;
+                defaults to the current time
 
         Returns:
-            Order data dictionary
+            Order data dictionary; o_entry_d is in epoch milliseconds
         """
         return {
             "o_id": o_id,
             "o_d_id": d_id,
             "o_w_id": w_id,
             "o_c_id": c_id,
-            "o_entry_d": datetime.now() - timedelta(days=random.randint(0, 365)),
+            "o_entry_d": (now_ms or time.time_ns() // 1_000_000) - random.randint(0, 365) * _DAY_MS,
             "o_carrier_id": random.randint(1, 10) if random.random() > 0.3 else None,
             "o_ol_cnt": random.randint(5, 15),
             "o_all_local": 1,
         }
 
     def generate_order_line(
-        self, ol_number: int, ol_o_id: int, ol_d_id: int, ol_w_id: int
+        self,
+        ol_number: int,
+        ol_o_id: int,
+        ol_d_id: int,
+        ol_w_id: int,
+        now: Optional[datetime] = None,
     ) -> Dict[str, Any]:
         """
         Generate order line data.
@@ -227,6 +475,7 @@ class TPCCDataGenerator:
             ol_o_id: Order ID
             ol_d_id: District ID
             ol_w_id: Warehouse ID
+            now: Delivery timestamp for delivered lines; defaults to datetime.now()
 
         Returns:
             Order line data dictionary
@@ -238,14 +487,20 @@ class TPCCDataGenerator:
             "ol_number": ol_number,
             "ol_i_id": random.randint(1, self.num_items),
             "ol_supply_w_id": ol_w_id,
-            "ol_delivery_d": datetime.now() if random.random() > 0.3 else None,
+            "ol_delivery_d": (now or datetime.now()) if random.random() > 0.3 else None,
             "ol_quantity": random.randint(1, 10),
             "ol_amount": round(random.uniform(0.01, 9999.99), 2),
-            "ol_dist_info": self.generate_random_string(24, 24),
+            "ol_dist_info": random.choice(self._dist_pool),
         }
 
     def generate_history(
-        self, c_id: int, c_d_id: int, c_w_id: int, d_id: int, w_id: int
+        self,
+        c_id: int,
+        c_d_id: int,
+        c_w_id: int,
+        d_id: int,
+        w_id: int,
+        now_ms: Optional[int] = None,
     ) -> Dict[str, Any]:
         """
         Generate history record.
@@ -256,11 +511,13 @@ class TPCCDataGenerator:
             c_w_id: Customer warehouse ID
             d_id: District ID
             w_id: Warehouse ID
+            now_ms: Reference time in epoch milliseconds the history date is offset from;
+                defaults to the current time
 
         Returns:
-            History data dictionary
+            History data dictionary; h_date is in epoch milliseconds
         """
-        h_date = datetime.now() - timedelta(days=random.randint(0, 365))
+        h_date = (now_ms or time.time_ns() // 1_000_000) - random.randint(0, 365) * _DAY_MS
         return {
             "h_c_id": c_id,
             "h_c_d_id": c_d_id,
@@ -270,7 +527,7 @@ class TPCCDataGenerator:
             "h_date": h_date,
             "h_amount": round(random.uniform(10.0, 5000.0), 2),
             "h_data": self.generate_random_string(12, 24),
-            "date_bucket": h_date.strftime("%Y-%m-%d"),
+            "date_bucket": time.strftime("%Y-%m-%d", time.gmtime(h_date // 1000)),
         }
 
     def get_scale_info(self) -> Dict[str, int]:
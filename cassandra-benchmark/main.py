@@ -4,22 +4,25 @@ Main entry point for Cassandra TPC-C Benchmark Framework.
 Provides CLI interface for all benchmark operations.
 """
 
+from __future__ import annotations
+
 import logging
 import sys
+import traceback
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Iterator
 
 import click
+import numpy as np
 
-# Add parent directory to path for imports
+# Add parent directory to path for imports. Modules that pull in the Cassandra driver
+# are imported inside the commands that use them, so --help and info start quickly.
 sys.path.insert(0, str(Path(__file__).parent))
 
-import yaml  # noqa: E402
-from cassandra.auth import PlainTextAuthProvider  # noqa: E402
-from cassandra.cluster import Cluster  # noqa: E402
-from data_generator.data_loader import DataLoader  # noqa: E402
-from data_generator.tpcc_data_generator import TPCCDataGenerator  # noqa: E402
-from schema.schema_setup import SchemaSetup  # noqa: E402
-from test_harness.benchmark_runner import BenchmarkRunner  # noqa: E402
+from config_loader import USING_PURE_PYTHON_YAML, load_yaml  # noqa: E402
+from benchmarks.query_definitions import QUERY_REGISTRY, QueryType  # noqa: E402
 
 # Setup logging
 logging.basicConfig(
@@ -33,14 +36,39 @@ logger = logging.getLogger(__name__)
 
 def load_cassandra_config(config_path: str = "config/cassandra_config.yaml") -> dict:
     """Load Cassandra configuration."""
-    with open(config_path, "r") as f:
-        return yaml.safe_load(f)
+    return load_yaml(config_path)
 
 
 def load_benchmark_config(config_path: str = "config/benchmark_config.yaml") -> dict:
     """Load benchmark configuration."""
-    with open(config_path, "r") as f:
-        return yaml.safe_load(f)
+    return load_yaml(config_path)
+
+
+def _sample_indices(population: int, count: int, chunk_size: int = 1024) -> Iterator[int]:
+    """Yield count uniform indices in [0, population), drawn chunk_size at a time."""
+    rng = np.random.default_rng()
+    for start in range(0, count, chunk_size):
+        yield from rng.integers(0, population, size=min(chunk_size, count - start)).tolist()
+
+
+def _run_concurrently(execute_query, queries: list, iterations: int, concurrency: int) -> None:
+    """Execute sampled queries, keeping up to `concurrency` in flight and waiting on the oldest."""
+    inflight = deque()
+    completed = 0
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        for index in _sample_indices(len(queries), iterations):
+            if len(inflight) >= concurrency:
+                inflight.popleft().result()
+                completed += 1
+                if completed % 10 == 0:
+                    logger.info(f"Executed {completed}/{iterations} queries")
+            inflight.append(executor.submit(execute_query, queries[index]))
+
+        while inflight:
+            inflight.popleft().result()
+            completed += 1
+            if completed % 10 == 0:
+                logger.info(f"Executed {completed}/{iterations} queries")
 
 
 @click.group()
@@ -54,6 +82,12 @@ def cli(verbose):
         logging.getLogger().setLevel(logging.DEBUG)
         logger.debug("Verbose logging enabled")
 
+    if USING_PURE_PYTHON_YAML:
+        logger.debug(
+            "PyYAML was built without libyaml; config files are parsed by the slower "
+            "pure-Python loader (reinstall pyyaml against libyaml-dev to fix)"
+        )
+
 
 @cli.command()
 @click.option("--replication-factor", "-r", default=1, help="Replication factor (default: 1)")
@@ -62,6 +96,8 @@ def cli(verbose):
 )
 def setup_schema(replication_factor, config):
     """Create keyspace and tables for TPC-C benchmark."""
+    from schema.schema_setup import SchemaSetup
+
     try:
         logger.info("Setting up Cassandra schema...")
         setup = SchemaSetup(config_path=config)
@@ -88,8 +124,18 @@ def setup_schema(replication_factor, config):
 @click.option(
     "--sample-only", is_flag=True, help="Generate only a small sample of data for testing"
 )
-def generate_data(cassandra_config, benchmark_config, sample_only):
+@click.option(
+    "--processes",
+    "-j",
+    default=1,
+    help="Worker processes generating warehouses in parallel (default: 1, in-process)",
+)
+def generate_data(cassandra_config, benchmark_config, sample_only, processes):
     """Generate and load TPC-C data into Cassandra."""
+    from connection import get_session
+    from data_generator.data_loader import DataLoader
+    from data_generator.tpcc_data_generator import TPCCDataGenerator
+
     try:
         logger.info("Starting data generation and loading...")
 
@@ -130,27 +176,13 @@ def generate_data(cassandra_config, benchmark_config, sample_only):
         logger.info(f"  Estimated total records: {scale_info['estimated_total_records']:,}")
 
         # Connect to Cassandra
-        keyspace = cass_config["cassandra"]["keyspace"]
-        auth_provider = None
-        if cass_config["cassandra"].get("username"):
-            auth_provider = PlainTextAuthProvider(
-                username=cass_config["cassandra"]["username"],
-                password=cass_config["cassandra"].get("password", ""),
-            )
-
-        cluster = Cluster(
-            contact_points=cass_config["cassandra"]["contact_points"],
-            port=cass_config["cassandra"]["port"],
-            auth_provider=auth_provider,
-        )
-        session = cluster.connect()
-        session.set_keyspace(keyspace)
+        session = get_session(cass_config)
 
         # Create data loader
         loader = DataLoader(session, generator)
 
         # Load data
-        result = loader.load_all_data()
+        result = loader.load_all_data(processes=processes)
 
         logger.info("✓ Data generation and loading completed successfully")
         logger.info(f"  Warehouses loaded: {result['warehouses']}")
@@ -158,12 +190,8 @@ def generate_data(cassandra_config, benchmark_config, sample_only):
         logger.info(f"  Customers loaded: {result['customers']}")
         logger.info(f"  Items loaded: {result['items']}")
 
-        cluster.shutdown()
-
     except Exception as e:
         logger.error(f"✗ Data generation failed: {e}")
-        import traceback
-
         traceback.print_exc()
         sys.exit(1)
 
@@ -184,6 +212,8 @@ def generate_data(cassandra_config, benchmark_config, sample_only):
 @click.option("--dry-run", is_flag=True, help="Validate configuration without running")
 def run_benchmark(cassandra_config, benchmark_config, dry_run):
     """Execute the full benchmark suite."""
+    from test_harness.benchmark_runner import BenchmarkRunner
+
     try:
         logger.info("Initializing benchmark runner...")
 
@@ -207,8 +237,6 @@ def run_benchmark(cassandra_config, benchmark_config, dry_run):
 
     except Exception as e:
         logger.error(f"✗ Benchmark execution failed: {e}")
-        import traceback
-
         traceback.print_exc()
         sys.exit(1)
 
@@ -222,14 +250,23 @@ def run_benchmark(cassandra_config, benchmark_config, dry_run):
     help="Path to Cassandra config file",
 )
 @click.option("--iterations", "-n", default=100, help="Number of iterations (default: 100)")
-def run_query(query_type, cassandra_config, iterations):
+@click.option(
+    "--concurrency",
+    "-p",
+    default=1,
+    type=click.IntRange(min=1),
+    help="Maximum queries in flight at once (default: 1, queries run one after another)",
+)
+def run_query(query_type, cassandra_config, iterations, concurrency):
     """Execute a specific query type."""
-    try:
-        from benchmarks.query_definitions import QueryType
+    from connection import get_session
+    from test_harness.benchmark_runner import BenchmarkRunner
 
+    try:
         logger.info(f"Running {query_type} queries ({iterations} iterations)...")
 
         runner = BenchmarkRunner(cassandra_config_path=cassandra_config)
+        runner.connect(session=get_session(load_cassandra_config(cassandra_config)))
         runner.initialize_components()
 
         # Get queries of specified type
@@ -242,15 +279,15 @@ def run_query(query_type, cassandra_config, iterations):
 
         logger.info(f"Found {len(queries)} {query_type} queries")
 
-        # Execute queries
-        import random
-
-        for i in range(iterations):
-            query = random.choice(queries)
-            runner.query_executor.execute_query(query)
-
-            if (i + 1) % 10 == 0:
-                logger.info(f"Executed {i + 1}/{iterations} queries")
+        execute_query = runner.query_executor.execute_query
+        if concurrency == 1:
+            # Serial: each latency is measured on an otherwise idle session
+            for completed, index in enumerate(_sample_indices(len(queries), iterations), 1):
+                execute_query(queries[index])
+                if completed % 10 == 0:
+                    logger.info(f"Executed {completed}/{iterations} queries")
+        else:
+            _run_concurrently(execute_query, queries, iterations, concurrency)
 
         # Print metrics
         metrics = runner.query_executor.get_metrics_summary()
@@ -262,8 +299,6 @@ def run_query(query_type, cassandra_config, iterations):
 
     except Exception as e:
         logger.error(f"✗ Query execution failed: {e}")
-        import traceback
-
         traceback.print_exc()
         sys.exit(1)
 
@@ -278,6 +313,8 @@ def cleanup(config, force):
     if not force:
         click.confirm("This will DELETE ALL data in the TPC-C keyspace. Are you sure?", abort=True)
 
+    from schema.schema_setup import SchemaSetup
+
     try:
         logger.info("Starting cleanup...")
         setup = SchemaSetup(config_path=config)
@@ -293,24 +330,18 @@ def cleanup(config, force):
 @cli.command()
 def info():
     """Display information about the benchmark framework."""
-    from benchmarks.query_definitions import QueryDefinitions
-
-    query_defs = QueryDefinitions()
-
     print("\n" + "=" * 80)
     print("Cassandra TPC-C Benchmark Framework")
     print("=" * 80)
     print("\nQuery Statistics:")
-    print(f"  Total queries defined: {len(query_defs.get_all_queries())}")
+    print(f"  Total queries defined: {len(QUERY_REGISTRY.get_all_queries())}")
 
-    type_counts = query_defs.get_query_count_by_type()
     print("\n  By Type:")
-    for query_type, count in type_counts.items():
+    for query_type, count in QUERY_REGISTRY.get_query_count_by_type().items():
         print(f"    {query_type.upper():10s}: {count}")
 
-    complexity_counts = query_defs.get_query_count_by_complexity()
     print("\n  By Complexity:")
-    for complexity, count in complexity_counts.items():
+    for complexity, count in QUERY_REGISTRY.get_query_count_by_complexity().items():
         print(f"    {complexity.capitalize():10s}: {count}")
 
     print("\nAvailable Commands:")
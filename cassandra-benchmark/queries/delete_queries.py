@@ -3,10 +3,96 @@ DELETE queries for TPC-C benchmark.
 Categorized by complexity: Simple, Medium, Complex
 """
 
-from typing import Any, Dict, List
-
-from cassandra.cluster import Session
-from cassandra.query import BatchStatement, ConsistencyLevel
+import logging
+import threading
+import weakref
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from cassandra.cluster import ResponseFuture, Session
+from cassandra.query import BatchStatement, BatchType, ConsistencyLevel
+from queries.driver_errors import DRIVER_ERRORS, log_failure
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on execute_async requests awaiting a response at once
+MAX_IN_FLIGHT = 256
+
+# Statements per single-partition UNLOGGED batch, well under the server's batch size warning
+MAX_BATCH_SIZE = 30
+
+# Retention for inventory_log entries: the TTL written by mark_for_ttl_expiration and the
+# age past which D17 deletes entries written without one
+INVENTORY_LOG_TTL_SECONDS = 30 * 86400
+_INVENTORY_LOG_RETENTION = timedelta(seconds=INVENTORY_LOG_TTL_SECONDS)
+
+# Structured dtype for passing new-order keys to D7 without per-row dicts
+ORDER_KEY_DTYPE = np.dtype([("w", "i4"), ("d", "i4"), ("o", "i4")])
+OrderKeys = Union[np.ndarray, Sequence[Tuple[int, int, int]], Sequence[Mapping[str, Any]]]
+
+# Non-key customer columns D8 may delete; only these names are ever formatted into CQL
+DELETABLE_CUSTOMER_COLUMNS = frozenset(
+    (
+        "c_first",
+        "c_middle",
+        "c_last",
+        "c_street_1",
+        "c_street_2",
+        "c_city",
+        "c_state",
+        "c_zip",
+        "c_phone",
+        "c_since",
+        "c_credit",
+        "c_credit_lim",
+        "c_discount",
+        "c_balance",
+        "c_ytd_payment",
+        "c_payment_cnt",
+        "c_delivery_cnt",
+        "c_data",
+    )
+)
+
+# Prepared DELETE statements per session, keyed by CQL, kept for the session's lifetime
+_PREPARED: "weakref.WeakKeyDictionary[Any, Dict[str, Any]]" = weakref.WeakKeyDictionary()
+
+
+def _log_failure(message: str, *args: Any) -> None:
+    """Log the exception being handled for a failed delete."""
+    log_failure(logger, message, *args)
+
+
+def _group_order_keys(orders: np.ndarray) -> Dict[Tuple[int, int], List[int]]:
+    """
+    Group an array of order keys by (warehouse, district) partition.
+
+    The sort and partition boundaries are computed in NumPy, so Python only touches
+    each partition once rather than each row; order ids keep their input order.
+    """
+    if orders.dtype.names:
+        warehouse, district, order = (orders[name] for name in orders.dtype.names[:3])
+    else:
+        warehouse, district, order = orders.reshape(-1, 3).T
+    if not len(order):
+        return {}
+    by_partition = np.lexsort((district, warehouse))
+    warehouse, district, order = (
+        warehouse[by_partition],
+        district[by_partition],
+        order[by_partition],
+    )
+    changed = (warehouse[1:] != warehouse[:-1]) | (district[1:] != district[:-1])
+    starts = np.concatenate(([0], np.flatnonzero(changed) + 1))
+    ends = np.append(starts[1:], len(order))
+    return {
+        (w, d): order[start:end].tolist()
+        for w, d, start, end in zip(
+            warehouse[starts].tolist(), district[starts].tolist(), starts.tolist(), ends.tolist()
+        )
+    }
 
 
 class DeleteQueries:
@@ -20,19 +106,35 @@ class DeleteQueries:
             session: Active Cassandra session
         """
         self.session = session
+        # D15 statements by IN-list length, so the CQL is only built once per arity
+        self._in_delete_stmts: Dict[int, Any] = {}
         self._prepare_statements()
 
+    def _prepare(self, cql: str) -> Any:
+        """
+        Prepare cql, reusing the statement already prepared for it on this session.
+
+        Queries whose text is built per call, or that are prepared on first use rather
+        than in _prepare_statements, go through here too, so each distinct CQL string is
+        prepared once per session.
+        """
+        cache = _PREPARED.setdefault(self.session, {})
+        statement = cache.get(cql)
+        if statement is None:
+            statement = cache[cql] = self.session.prepare(cql)
+        return statement
+
     def _prepare_statements(self) -> None:
         """Prepare all DELETE statements for better performance."""
         # Simple deletes
-        self.delete_order_line_stmt = self.session.prepare(
+        self.delete_order_line_stmt = self._prepare(
             """
             DELETE FROM order_line
             WHERE ol_w_id = ? AND ol_d_id = ? AND ol_o_id = ? AND ol_number = ?
             """
         )
 
-        self.delete_new_order_stmt = self.session.prepare(
+        self.delete_new_order_stmt = self._prepare(
             """
             DELETE FROM new_order
             WHERE no_w_id = ? AND no_d_id = ? AND no_o_id = ?
@@ -40,7 +142,7 @@ class DeleteQueries:
         )
 
         # Medium deletes - conditional
-        self.delete_new_order_conditional_stmt = self.session.prepare(
+        self.delete_new_order_conditional_stmt = self._prepare(
             """
             DELETE FROM new_order
             WHERE no_w_id = ? AND no_d_id = ? AND no_o_id = ?
@@ -48,14 +150,145 @@ class DeleteQueries:
             """
         )
 
+        self.select_new_order_exists_stmt = self._prepare(
+            """
+            SELECT no_o_id FROM new_order
+            WHERE no_w_id = ? AND no_d_id = ? AND no_o_id = ?
+            LIMIT 1
+            """
+        )
+        self.select_new_order_exists_stmt.consistency_level = ConsistencyLevel.ONE
+
         # Complex deletes - batch
-        self.delete_all_order_lines_stmt = self.session.prepare(
+        self.delete_all_order_lines_stmt = self._prepare(
             """
             DELETE FROM order_line
             WHERE ol_w_id = ? AND ol_d_id = ? AND ol_o_id = ?
             """
         )
 
+        self.delete_order_stmt = self._prepare(
+            """
+            DELETE FROM orders
+            WHERE o_w_id = ? AND o_d_id = ? AND o_id = ?
+            """
+        )
+
+        self.delete_order_tracking_stmt = self._prepare(
+            """
+            DELETE FROM order_tracking
+            WHERE o_w_id = ? AND o_status = ? AND o_timestamp = ? AND o_id = ?
+            """
+        )
+
+        # Medium deletes - clustering range
+        self.delete_old_history_stmt = self._prepare(
+            """
+            DELETE FROM history
+            WHERE h_w_id = ? AND h_d_id = ? AND date_bucket = ? AND h_date < ?
+            """
+        )
+
+        # Manual inventory_log cleanup, for entries written without a TTL
+        self.delete_expired_inventory_log_stmt = self._prepare(
+            """
+            DELETE FROM inventory_log
+            WHERE i_w_id = ? AND i_id = ? AND log_timestamp < ?
+            """
+        )
+
+        # Single-row deletes are only token-aware routed if the driver knew the
+        # partition key columns when preparing
+        for stmt in (
+            self.delete_order_line_stmt,
+            self.delete_new_order_stmt,
+            self.delete_all_order_lines_stmt,
+        ):
+            if stmt.routing_key_indexes is None:
+                logger.warning(
+                    "No routing key for %r; deletes will go through an extra coordinator hop",
+                    stmt.query_string.strip(),
+                )
+
+    def _execute_pipelined(self, statements: Iterable[Any]) -> int:
+        """
+        Execute bound or batch statements with execute_async.
+
+        Completion is tracked with driver callbacks rather than blocking on each
+        future, and a semaphore keeps at most MAX_IN_FLIGHT requests outstanding.
+        Submission stops at the first failure.
+
+        Args:
+            statements: Statements ready to execute (bound, batch or simple)
+
+        Returns:
+            Number of statements executed
+
+        Raises:
+            Exception: The first error reported by a request
+        """
+        window = threading.Semaphore(MAX_IN_FLIGHT)
+        errors = []
+
+        def on_success(_rows: Any) -> None:
+            window.release()
+
+        def on_error(error: Exception) -> None:
+            errors.append(error)
+            window.release()
+
+        count = 0
+        for statement in statements:
+            window.acquire()
+            if errors:
+                window.release()
+                break
+            self.session.execute_async(statement).add_callbacks(on_success, on_error)
+            count += 1
+
+        # Drain: every permit comes back once the outstanding requests complete
+        for _ in range(MAX_IN_FLIGHT):
+            window.acquire()
+        if errors:
+            raise errors[0]
+        return count
+
+    def _new_order_deletes(self, orders: OrderKeys) -> Iterator[Any]:
+        """
+        Yield QUORUM statements deleting the given new orders, grouped by partition.
+
+        Orders sharing a partition go out in UNLOGGED batches of up to MAX_BATCH_SIZE,
+        each atomic within that partition; a lone order is bound directly.
+        """
+        if isinstance(orders, np.ndarray):
+            partitions = _group_order_keys(orders)
+        else:
+            if orders and isinstance(orders[0], Mapping):
+                rows = [(o["warehouse_id"], o["district_id"], o["order_id"]) for o in orders]
+            else:
+                rows = orders
+            partitions = {}
+            for warehouse_id, district_id, order_id in rows:
+                partitions.setdefault((warehouse_id, district_id), []).append(order_id)
+
+        for (warehouse_id, district_id), order_ids in partitions.items():
+            for start in range(0, len(order_ids), MAX_BATCH_SIZE):
+                chunk = order_ids[start : start + MAX_BATCH_SIZE]
+                if len(chunk) > 1:
+                    statement = BatchStatement(
+                        batch_type=BatchType.UNLOGGED, consistency_level=ConsistencyLevel.QUORUM
+                    )
+                    for order_id in chunk:
+                        statement.add(
+                            self.delete_new_order_stmt, (warehouse_id, district_id, order_id)
+                        )
+                else:
+                    statement = self.delete_new_order_stmt.bind(
+                        (warehouse_id, district_id, chunk[0])
+                    )
+                    statement.consistency_level = ConsistencyLevel.QUORUM
+                yield statement
+
     # ========== SIMPLE DELETE QUERIES ==========
 
     def delete_order_line(
@@ -75,14 +308,31 @@ class DeleteQueries:
             True if successful
         """
         try:
-            self.session.execute(
-                self.delete_order_line_stmt, [warehouse_id, district_id, order_id, line_number]
-            )
+            self.delete_order_line_async(warehouse_id, district_id, order_id, line_number).result()
             return True
-        except Exception as e:
-            print(f"Error deleting order line: {e}")
+        except DRIVER_ERRORS:
+            _log_failure(
+                "delete_order_line failed w=%s d=%s o=%s line=%s",
+                warehouse_id,
+                district_id,
+                order_id,
+                line_number,
+            )
             return False
 
+    def delete_order_line_async(
+        self, warehouse_id: int, district_id: int, order_id: int, line_number: int
+    ) -> ResponseFuture:
+        """
+        D1 without waiting: submit the order line delete and return its future.
+
+        Returns:
+            ResponseFuture for the delete; call result() to wait for it
+        """
+        return self.session.execute_async(
+            self.delete_order_line_stmt, [warehouse_id, district_id, order_id, line_number]
+        )
+
     def delete_new_order(self, warehouse_id: int, district_id: int, order_id: int) -> bool:
         """
         D2: Delete a new order record.
@@ -97,39 +347,69 @@ class DeleteQueries:
             True if successful
         """
         try:
-            self.session.execute(self.delete_new_order_stmt, [warehouse_id, district_id, order_id])
+            self.delete_new_order_async(warehouse_id, district_id, order_id).result()
             return True
-        except Exception as e:
-            print(f"Error deleting new order: {e}")
+        except DRIVER_ERRORS:
+            _log_failure(
+                "delete_new_order failed w=%s d=%s o=%s", warehouse_id, district_id, order_id
+            )
             return False
 
+    def delete_new_order_async(
+        self, warehouse_id: int, district_id: int, order_id: int
+    ) -> ResponseFuture:
+        """
+        D2 without waiting: submit the new order delete and return its future.
+
+        Returns:
+            ResponseFuture for the delete; call result() to wait for it
+        """
+        return self.session.execute_async(
+            self.delete_new_order_stmt, [warehouse_id, district_id, order_id]
+        )
+
     # ========== MEDIUM DELETE QUERIES ==========
 
     def delete_new_order_conditional(
-        self, warehouse_id: int, district_id: int, order_id: int
+        self, warehouse_id: int, district_id: int, order_id: int, linearizable: bool = True
     ) -> Dict[str, Any]:
         """
         D3: Delete new order with conditional (IF EXISTS).
         Complexity: Medium - Conditional delete
 
+        With linearizable=False the Paxos round is skipped: existence is checked with a
+        CL ONE read and a plain DELETE follows. That costs two round trips instead of
+        four, but two callers racing on the same order may both report it applied.
+
         Args:
             warehouse_id: Warehouse identifier
             district_id: District identifier
             order_id: Order identifier
+            linearizable: Use a lightweight transaction (IF EXISTS)
 
         Returns:
             Dict with 'applied' boolean
         """
+        key = [warehouse_id, district_id, order_id]
         try:
-            result = self.session.execute(
-                self.delete_new_order_conditional_stmt, [warehouse_id, district_id, order_id]
-            )
-            row = result.one()
+            if linearizable:
+                applied = self.session.execute(self.delete_new_order_conditional_stmt, key).one()[0]
+            else:
+                row = self.session.execute(self.select_new_order_exists_stmt, key).one()
+                applied = row is not None
+                if applied:
+                    self.session.execute(self.delete_new_order_stmt, key)
             return {
-                "applied": row[0],
-                "message": "Delete successful" if row[0] else "Record does not exist",
+                "applied": applied,
+                "message": "Delete successful" if applied else "Record does not exist",
             }
-        except Exception as e:
+        except DRIVER_ERRORS as e:
+            _log_failure(
+                "delete_new_order_conditional failed w=%s d=%s o=%s",
+                warehouse_id,
+                district_id,
+                order_id,
+            )
             return {"applied": False, "message": f"Error: {e}"}
 
     def delete_old_history_records(
@@ -138,6 +418,7 @@ class DeleteQueries:
         """
         D4: Delete old history records (before cutoff date).
         Complexity: Medium - Time-series delete
+        Cassandra Concept: Range tombstone on the leading clustering column
 
         Args:
             warehouse_id: Warehouse identifier
@@ -149,32 +430,18 @@ class DeleteQueries:
             True if successful
         """
         try:
-            # Note: In Cassandra, we can't directly delete by range in clustering column
-            # First, we need to select the records, then delete them
-            select_query = """
-                SELECT h_date, h_c_id FROM history
-                WHERE h_w_id = ? AND h_d_id = ? AND date_bucket = ? AND h_date < ?
-            """
-            result = self.session.execute(
-                select_query, [warehouse_id, district_id, date_bucket, cutoff_date]
-            )
-
-            # Delete each record
-            delete_stmt = self.session.prepare(
-                """
-                DELETE FROM history
-                WHERE h_w_id = ? AND h_d_id = ? AND date_bucket = ? AND h_date = ? AND h_c_id = ?
-                """
+            # h_date is the first clustering column, so one range tombstone covers the rows
+            self.session.execute(
+                self.delete_old_history_stmt, [warehouse_id, district_id, date_bucket, cutoff_date]
             )
-
-            for row in result:
-                self.session.execute(
-                    delete_stmt, [warehouse_id, district_id, date_bucket, row.h_date, row.h_c_id]
-                )
-
             return True
-        except Exception as e:
-            print(f"Error deleting old history records: {e}")
+        except DRIVER_ERRORS:
+            _log_failure(
+                "delete_old_history_records failed w=%s d=%s bucket=%s",
+                warehouse_id,
+                district_id,
+                date_bucket,
+            )
             return False
 
     # ========== COMPLEX DELETE QUERIES ==========
@@ -193,14 +460,27 @@ class DeleteQueries:
             True if successful
         """
         try:
-            self.session.execute(
-                self.delete_all_order_lines_stmt, [warehouse_id, district_id, order_id]
-            )
+            self.delete_all_order_lines_async(warehouse_id, district_id, order_id).result()
             return True
-        except Exception as e:
-            print(f"Error deleting all order lines: {e}")
+        except DRIVER_ERRORS:
+            _log_failure(
+                "delete_all_order_lines failed w=%s d=%s o=%s", warehouse_id, district_id, order_id
+            )
             return False
 
+    def delete_all_order_lines_async(
+        self, warehouse_id: int, district_id: int, order_id: int
+    ) -> ResponseFuture:
+        """
+        D5 without waiting: submit the partition delete and return its future.
+
+        Returns:
+            ResponseFuture for the delete; call result() to wait for it
+        """
+        return self.session.execute_async(
+            self.delete_all_order_lines_stmt, [warehouse_id, district_id, order_id]
+        )
+
     def delete_order_with_lines_batch(
         self, warehouse_id: int, district_id: int, order_id: int, customer_id: int
     ) -> bool:
@@ -208,6 +488,10 @@ class DeleteQueries:
         D6: Delete order and all its lines in a batch.
         Complexity: Complex - Multi-table batch delete
 
+        order_line is partitioned by (w_id, d_id, o_id), not (w_id, d_id) like orders and
+        new_order, so the three deletes go in one LOGGED batch: the batchlog guarantees
+        that either all of them are eventually applied or none is.
+
         Args:
             warehouse_id: Warehouse identifier
             district_id: District identifier
@@ -217,64 +501,55 @@ class DeleteQueries:
         Returns:
             True if successful
         """
+        key = (warehouse_id, district_id, order_id)
         try:
             batch = BatchStatement(consistency_level=ConsistencyLevel.QUORUM)
 
             # Delete from orders table
-            delete_order = self.session.prepare(
-                """
-                DELETE FROM orders
-                WHERE o_w_id = ? AND o_d_id = ? AND o_id = ?
-                """
-            )
-            batch.add(delete_order, [warehouse_id, district_id, order_id])
+            batch.add(self.delete_order_stmt, key)
 
-            # Delete from orders_by_customer table
-            _ = self.session.prepare(
-                """
-                DELETE FROM orders_by_customer
-                WHERE o_c_id = ? AND o_w_id = ? AND o_d_id = ? AND o_entry_d >= ? AND o_id = ?
-                """
-            )
-            # Note: We need entry_d for the delete, so we'd need to fetch it first
-            # For this example, we'll skip the denormalized table delete
+            # orders_by_customer is left alone: its key needs o_entry_d, which would
+            # take a read first
 
             # Delete all order lines
-            batch.add(self.delete_all_order_lines_stmt, [warehouse_id, district_id, order_id])
+            batch.add(self.delete_all_order_lines_stmt, key)
 
             # Delete from new_order if exists
-            batch.add(self.delete_new_order_stmt, [warehouse_id, district_id, order_id])
+            batch.add(self.delete_new_order_stmt, key)
 
             self.session.execute(batch)
             return True
-        except Exception as e:
-            print(f"Error batch deleting order with lines: {e}")
+        except DRIVER_ERRORS:
+            _log_failure(
+                "delete_order_with_lines_batch failed w=%s d=%s o=%s",
+                warehouse_id,
+                district_id,
+                order_id,
+            )
             return False
 
-    def delete_multiple_new_orders_batch(self, orders: List[Dict[str, Any]]) -> bool:
+    def delete_multiple_new_orders_batch(self, orders: OrderKeys) -> bool:
         """
         D7: Delete multiple new orders in a batch.
         Complexity: Complex - Batch delete operation
 
+        Orders are grouped by (warehouse_id, district_id) partition and each partition
+        is deleted with its own request, pipelined with execute_async, rather than one
+        multi-partition logged batch.
+
         Args:
-            orders: List of order dictionaries with warehouse_id, district_id, order_id
+            orders: (warehouse_id, district_id, order_id) keys, as an ORDER_KEY_DTYPE
+                array, a sequence of tuples, or a list of dicts with those names
 
         Returns:
             True if successful
         """
         try:
-            batch = BatchStatement(consistency_level=ConsistencyLevel.QUORUM)
-
-            for order in orders:
-                batch.add(
-                    self.delete_new_order_stmt,
-                    [order["warehouse_id"], order["district_id"], order["order_id"]],
-                )
-
-            self.session.execute(batch)
+            requests = self._execute_pipelined(self._new_order_deletes(orders))
+            logger.debug("Deleted %d new orders in %d requests", len(orders), requests)
             return True
-        except Exception as e:
-            print(f"Error batch deleting new orders: {e}")
+        except DRIVER_ERRORS:
+            _log_failure("delete_multiple_new_orders_batch failed for %d orders", len(orders))
             return False
 
     # ========== ADDITIONAL DELETE QUERIES (D8-D20) ==========
@@ -291,20 +566,31 @@ class DeleteQueries:
             warehouse_id: Warehouse identifier
             district_id: District identifier
             customer_id: Customer identifier
-            column_name: Name of column to delete
+            column_name: Name of column to delete, one of DELETABLE_CUSTOMER_COLUMNS
 
         Returns:
             True if successful
+
+        Raises:
+            ValueError: If column_name is not a deletable customer column
         """
+        if column_name not in DELETABLE_CUSTOMER_COLUMNS:
+            raise ValueError(f"Cannot delete column {column_name!r} from customer")
         try:
             query = f"""
                 DELETE {column_name} FROM customer
                 WHERE c_w_id = ? AND c_d_id = ? AND c_id = ?
             """
-            self.session.execute(query, [warehouse_id, district_id, customer_id])
+            self.session.execute(self._prepare(query), [warehouse_id, district_id, customer_id])
             return True
-        except Exception as e:
-            print(f"Error deleting column: {e}")
+        except DRIVER_ERRORS:
+            _log_failure(
+                "delete_specific_column failed w=%s d=%s c=%s column=%s",
+                warehouse_id,
+                district_id,
+                customer_id,
+                column_name,
+            )
             return False
 
     def delete_from_set_collection(
@@ -330,10 +616,17 @@ class DeleteQueries:
                 SET c_phone_numbers = c_phone_numbers - ?
                 WHERE c_w_id = ? AND c_d_id = ? AND c_id = ?
             """
-            self.session.execute(query, [{phone_to_remove}, warehouse_id, district_id, customer_id])
+            self.session.execute(
+                self._prepare(query), [{phone_to_remove}, warehouse_id, district_id, customer_id]
+            )
             return True
-        except Exception as e:
-            print(f"Error deleting from set: {e}")
+        except DRIVER_ERRORS:
+            _log_failure(
+                "delete_from_set_collection failed w=%s d=%s c=%s",
+                warehouse_id,
+                district_id,
+                customer_id,
+            )
             return False
 
     def delete_from_map_by_key(
@@ -358,10 +651,18 @@ class DeleteQueries:
                 DELETE c_preferences[?] FROM customer_extended
                 WHERE c_w_id = ? AND c_d_id = ? AND c_id = ?
             """
-            self.session.execute(query, [pref_key, warehouse_id, district_id, customer_id])
+            self.session.execute(
+                self._prepare(query), [pref_key, warehouse_id, district_id, customer_id]
+            )
             return True
-        except Exception as e:
-            print(f"Error deleting from map: {e}")
+        except DRIVER_ERRORS:
+            _log_failure(
+                "delete_from_map_by_key failed w=%s d=%s c=%s key=%s",
+                warehouse_id,
+                district_id,
+                customer_id,
+                pref_key,
+            )
             return False
 
     def delete_from_list_by_index(
@@ -386,10 +687,18 @@ class DeleteQueries:
                 DELETE c_email_history[?] FROM customer_extended
                 WHERE c_w_id = ? AND c_d_id = ? AND c_id = ?
             """
-            self.session.execute(query, [index, warehouse_id, district_id, customer_id])
+            self.session.execute(
+                self._prepare(query), [index, warehouse_id, district_id, customer_id]
+            )
             return True
-        except Exception as e:
-            print(f"Error deleting from list: {e}")
+        except DRIVER_ERRORS:
+            _log_failure(
+                "delete_from_list_by_index failed w=%s d=%s c=%s index=%s",
+                warehouse_id,
+                district_id,
+                customer_id,
+                index,
+            )
             return False
 
     def delete_with_timestamp(
@@ -415,10 +724,14 @@ class DeleteQueries:
                 WHERE o_w_id = ? AND o_d_id = ? AND o_id = ?
                 USING TIMESTAMP ?
             """
-            self.session.execute(query, [warehouse_id, district_id, order_id, timestamp_micros])
+            self.session.execute(
+                self._prepare(query), [warehouse_id, district_id, order_id, timestamp_micros]
+            )
             return True
-        except Exception as e:
-            print(f"Error deleting with timestamp: {e}")
+        except DRIVER_ERRORS:
+            _log_failure(
+                "delete_with_timestamp failed w=%s d=%s o=%s", warehouse_id, district_id, order_id
+            )
             return False
 
     def delete_static_column(self, category_id: int) -> bool:
@@ -438,10 +751,10 @@ class DeleteQueries:
                 DELETE category_description FROM product_catalog
                 WHERE category_id = ?
             """
-            self.session.execute(query, [category_id])
+            self.session.execute(self._prepare(query), [category_id])
             return True
-        except Exception as e:
-            print(f"Error deleting static column: {e}")
+        except DRIVER_ERRORS:
+            _log_failure("delete_static_column failed category=%s", category_id)
             return False
 
     def delete_clustering_range(
@@ -467,10 +780,12 @@ class DeleteQueries:
                 WHERE i_w_id = ? AND i_id = ?
                 AND log_timestamp >= ? AND log_timestamp <= ?
             """
-            self.session.execute(query, [warehouse_id, item_id, start_timestamp, end_timestamp])
+            self.session.execute(
+                self._prepare(query), [warehouse_id, item_id, start_timestamp, end_timestamp]
+            )
             return True
-        except Exception as e:
-            print(f"Error deleting range: {e}")
+        except DRIVER_ERRORS:
+            _log_failure("delete_clustering_range failed w=%s i=%s", warehouse_id, item_id)
             return False
 
     def delete_with_in_clause(
@@ -490,16 +805,23 @@ class DeleteQueries:
             True if successful
         """
         try:
-            query = f"""
-                DELETE FROM orders
-                WHERE o_w_id = ? AND o_d_id = ?
-                AND o_id IN ({','.join('?' * len(order_ids))})
-            """
-            params = [warehouse_id, district_id] + order_ids
-            self.session.execute(query, params)
+            stmt = self._in_delete_stmts.get(len(order_ids))
+            if stmt is None:
+                query = f"""
+                    DELETE FROM orders
+                    WHERE o_w_id = ? AND o_d_id = ?
+                    AND o_id IN ({','.join('?' * len(order_ids))})
+                """
+                stmt = self._in_delete_stmts[len(order_ids)] = self._prepare(query)
+            self.session.execute(stmt, [warehouse_id, district_id, *order_ids])
             return True
-        except Exception as e:
-            print(f"Error deleting with IN clause: {e}")
+        except DRIVER_ERRORS:
+            _log_failure(
+                "delete_with_in_clause failed w=%s d=%s for %d orders",
+                warehouse_id,
+                district_id,
+                len(order_ids),
+            )
             return False
 
     def delete_with_lwt_condition(
@@ -526,14 +848,20 @@ class DeleteQueries:
                 IF o_carrier_id = ?
             """
             result = self.session.execute(
-                query, [warehouse_id, district_id, order_id, expected_carrier]
+                self._prepare(query), [warehouse_id, district_id, order_id, expected_carrier]
             )
             row = result.one()
             return {
                 "applied": row[0],
                 "message": "Delete successful" if row[0] else "Condition not met",
             }
-        except Exception as e:
+        except DRIVER_ERRORS as e:
+            _log_failure(
+                "delete_with_lwt_condition failed w=%s d=%s o=%s",
+                warehouse_id,
+                district_id,
+                order_id,
+            )
             return {"applied": False, "message": f"Error: {e}"}
 
     def delete_expired_records_ttl(self, warehouse_id: int, item_id: int) -> bool:
@@ -542,6 +870,10 @@ class DeleteQueries:
         Complexity: Medium - Time-based deletion
         Cassandra Concept: Manual cleanup of expired data
 
+        This is the fallback for entries written without a TTL; each call writes a
+        range tombstone. Entries written with one (see mark_for_ttl_expiration) expire
+        in the storage engine and need no delete pass.
+
         Args:
             warehouse_id: Warehouse identifier
             item_id: Item identifier
@@ -550,20 +882,60 @@ class DeleteQueries:
             True if successful
         """
         try:
-            # Delete records older than certain timestamp
-            query = """
-                DELETE FROM inventory_log
-                WHERE i_w_id = ? AND i_id = ?
-                AND log_timestamp < ?
-            """
             # Use current time minus retention period
-            from datetime import datetime, timedelta
+            cutoff = datetime.now() - _INVENTORY_LOG_RETENTION
+            self.session.execute(
+                self.delete_expired_inventory_log_stmt, [warehouse_id, item_id, cutoff]
+            )
+            return True
+        except DRIVER_ERRORS:
+            _log_failure("delete_expired_records_ttl failed w=%s i=%s", warehouse_id, item_id)
+            return False
+
+    def mark_for_ttl_expiration(
+        self,
+        warehouse_id: int,
+        item_id: int,
+        log_timestamp: Any,
+        log_type: str,
+        message: str,
+        metadata: Optional[Dict[str, str]] = None,
+        ttl_seconds: int = INVENTORY_LOG_TTL_SECONDS,
+    ) -> bool:
+        """
+        Rewrite an inventory log entry with a TTL so Cassandra expires it.
 
-            cutoff = datetime.now() - timedelta(days=30)
-            self.session.execute(query, [warehouse_id, item_id, cutoff])
+        The entry is re-inserted with all of its columns rather than updated:
+        UPDATE ... USING TTL only expires the columns it sets and leaves the row
+        marker from the original INSERT live. New entries should be written with
+        a TTL in the first place (I12, insert_inventory_log_with_ttl).
+
+        Args:
+            warehouse_id: Warehouse identifier
+            item_id: Item identifier
+            log_timestamp: Timestamp of the existing entry
+            log_type: Type of log entry
+            message: Log message
+            metadata: Log metadata map
+            ttl_seconds: Time to live in seconds
+
+        Returns:
+            True if successful
+        """
+        try:
+            query = """
+                INSERT INTO inventory_log
+                (i_w_id, i_id, log_timestamp, log_type, log_message, log_metadata)
+                VALUES (?, ?, ?, ?, ?, ?)
+                USING TTL ?
+            """
+            self.session.execute(
+                self._prepare(query),
+                [warehouse_id, item_id, log_timestamp, log_type, message, metadata, ttl_seconds],
+            )
             return True
-        except Exception as e:
-            print(f"Error deleting expired records: {e}")
+        except DRIVER_ERRORS:
+            _log_failure("mark_for_ttl_expiration failed w=%s i=%s", warehouse_id, item_id)
             return False
 
     def delete_batch_logged(self, deletes: List[Dict[str, Any]]) -> bool:
@@ -582,20 +954,15 @@ class DeleteQueries:
             batch = BatchStatement(consistency_level=ConsistencyLevel.QUORUM)
 
             for delete in deletes:
-                delete_stmt = self.session.prepare(
-                    """
-                    DELETE FROM new_order
-                    WHERE no_w_id = ? AND no_d_id = ? AND no_o_id = ?
-                    """
-                )
                 batch.add(
-                    delete_stmt, [delete["warehouse_id"], delete["district_id"], delete["order_id"]]
+                    self.delete_new_order_stmt,
+                    (delete["warehouse_id"], delete["district_id"], delete["order_id"]),
                 )
 
             self.session.execute(batch)
             return True
-        except Exception as e:
-            print(f"Error in logged batch delete: {e}")
+        except DRIVER_ERRORS:
+            _log_failure("delete_batch_logged failed for %d deletes", len(deletes))
             return False
 
     def delete_batch_unlogged(self, tracking_deletes: List[Dict[str, Any]]) -> bool:
@@ -611,30 +978,23 @@ class DeleteQueries:
             True if successful
         """
         try:
-            batch_query = "BEGIN UNLOGGED BATCH\n"
-            params = []
+            batch = BatchStatement(batch_type=BatchType.UNLOGGED)
 
             for delete in tracking_deletes:
-                batch_query += """
-                    DELETE FROM order_tracking
-                    WHERE o_w_id = ? AND o_status = ?
-                    AND o_timestamp = ? AND o_id = ?;
-                """
-                params.extend(
-                    [
+                batch.add(
+                    self.delete_order_tracking_stmt,
+                    (
                         delete["warehouse_id"],
                         delete["status"],
                         delete["timestamp"],
                         delete["order_id"],
-                    ]
+                    ),
                 )
 
-            batch_query += "APPLY BATCH;"
-
-            self.session.execute(batch_query, params)
+            self.session.execute(batch)
             return True
-        except Exception as e:
-            print(f"Error in unlogged batch delete: {e}")
+        except DRIVER_ERRORS:
+            _log_failure("delete_batch_unlogged failed for %d deletes", len(tracking_deletes))
             return False
 
     def delete_partition(self, warehouse_id: int, district_id: int) -> bool:
@@ -655,8 +1015,8 @@ class DeleteQueries:
                 DELETE FROM orders
                 WHERE o_w_id = ? AND o_d_id = ?
             """
-            self.session.execute(query, [warehouse_id, district_id])
+            self.session.execute(self._prepare(query), [warehouse_id, district_id])
             return True
-        except Exception as e:
-            print(f"Error deleting partition: {e}")
+        except DRIVER_ERRORS:
+            _log_failure("delete_partition failed w=%s d=%s", warehouse_id, district_id)
             return False
@@ -0,0 +1,37 @@
+"""
+Driver failure handling shared by the TPC-C query modules.
+"""
+
+import logging
+import sys
+from typing import Any
+
+from cassandra import (
+    DriverException,
+    RequestExecutionException,
+    RequestValidationException,
+    WriteTimeout,
+)
+from cassandra.cluster import NoHostAvailable
+
+# Failures reported by the driver or the cluster; anything else is a bug and propagates
+DRIVER_ERRORS = (
+    RequestExecutionException,
+    RequestValidationException,
+    DriverException,
+    NoHostAvailable,
+)
+
+
+def log_failure(log: logging.Logger, message: str, *args: Any) -> None:
+    """
+    Log the driver exception being handled for a failed query.
+
+    Write timeouts are routine under overload, so they get a one-line warning instead
+    of a traceback to keep outages from flooding the log.
+    """
+    error = sys.exc_info()[1]
+    if isinstance(error, WriteTimeout):
+        log.warning(message + ": %s", *args, error)
+    else:
+        log.exception(message, *args)
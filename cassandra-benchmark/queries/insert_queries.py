@@ -3,11 +3,21 @@ INSERT queries for TPC-C benchmark.
 Categorized by complexity: Simple, Medium, Complex
 """
 
+import logging
 from datetime import datetime
 from typing import Any, Dict, List
 
+from benchmarks.query_definitions import QUERY_REGISTRY
 from cassandra.cluster import Session
 from cassandra.query import BatchStatement, ConsistencyLevel
+from queries.driver_errors import DRIVER_ERRORS, log_failure
+
+logger = logging.getLogger(__name__)
+
+
+def _log_failure(message: str, *args: Any) -> None:
+    """Log the exception being handled for a failed insert."""
+    log_failure(logger, message, *args)
 
 
 class InsertQueries:
@@ -129,8 +139,8 @@ class InsertQueries:
                 ],
             )
             return True
-        except Exception as e:
-            print(f"Error inserting customer: {e}")
+        except DRIVER_ERRORS:
+            _log_failure("insert_customer failed")
             return False
 
     def insert_order(self, data: Dict[str, Any]) -> bool:
@@ -175,8 +185,8 @@ class InsertQueries:
                 ],
             )
             return True
-        except Exception as e:
-            print(f"Error inserting order: {e}")
+        except DRIVER_ERRORS:
+            _log_failure("insert_order failed")
             return False
 
     def insert_history(self, data: Dict[str, Any]) -> bool:
@@ -212,8 +222,8 @@ class InsertQueries:
                 ],
             )
             return True
-        except Exception as e:
-            print(f"Error inserting history: {e}")
+        except DRIVER_ERRORS:
+            _log_failure("insert_history failed")
             return False
 
     # ========== MEDIUM INSERT QUERIES ==========
@@ -230,11 +240,13 @@ class InsertQueries:
             True if successful
         """
         try:
-            batch = BatchStatement(consistency_level=ConsistencyLevel.QUORUM)
-
-            for line in order_lines:
-                batch.add(
-                    self.insert_order_line_stmt,
+            # Lines of a single order share one partition, so an UNLOGGED batch is atomic
+            partitions = {
+                (line["ol_w_id"], line["ol_d_id"], line["ol_o_id"]) for line in order_lines
+            }
+            batch = QUERY_REGISTRY.build_batch(
+                self.insert_order_line_stmt,
+                (
                     [
                         line["ol_w_id"],
                         line["ol_d_id"],
@@ -246,13 +258,16 @@ class InsertQueries:
                         line["ol_quantity"],
                         line["ol_amount"],
                         line["ol_dist_info"],
-                    ],
-                )
-
+                    ]
+                    for line in order_lines
+                ),
+                logged=len(partitions) > 1,
+                consistency_level=ConsistencyLevel.QUORUM,
+            )
             self.session.execute(batch)
             return True
-        except Exception as e:
-            print(f"Error batch inserting order lines: {e}")
+        except DRIVER_ERRORS:
+            _log_failure("insert_order_lines_batch failed for %d order lines", len(order_lines))
             return False
 
     def insert_history_with_ttl(self, data: Dict[str, Any], ttl_seconds: int) -> bool:
@@ -290,8 +305,8 @@ class InsertQueries:
                 ],
             )
             return True
-        except Exception as e:
-            print(f"Error inserting history with TTL: {e}")
+        except DRIVER_ERRORS:
+            _log_failure("insert_history_with_ttl failed")
             return False
 
     # ========== COMPLEX INSERT QUERIES ==========
@@ -320,7 +335,10 @@ class InsertQueries:
                 "applied": row[0],  # First column is [applied]
                 "message": "Insert successful" if row[0] else "Record already exists",
             }
-        except Exception as e:
+        except DRIVER_ERRORS as e:
+            _log_failure(
+                "insert_new_order_lwt failed w=%s d=%s o=%s", warehouse_id, district_id, order_id
+            )
             return {"applied": False, "message": f"Error: {e}"}
 
     def insert_customer_with_denormalization(self, data: Dict[str, Any]) -> bool:
@@ -377,8 +395,8 @@ class InsertQueries:
                 ],
             )
             return True
-        except Exception as e:
-            print(f"Error inserting customer with denormalization: {e}")
+        except DRIVER_ERRORS:
+            _log_failure("insert_customer_with_denormalization failed")
             return False
 
     # ========== ADDITIONAL INSERT QUERIES (I8-I20) ==========
@@ -420,8 +438,13 @@ class InsertQueries:
                 query, [warehouse_id, district_id, customer_id, name, phones, emails, prefs]
             )
             return True
-        except Exception as e:
-            print(f"Error inserting customer with collections: {e}")
+        except DRIVER_ERRORS:
+            _log_failure(
+                "insert_customer_with_collections failed w=%s d=%s c=%s",
+                warehouse_id,
+                district_id,
+                customer_id,
+            )
             return False
 
     def insert_warehouse_metric_counter(
@@ -448,8 +471,8 @@ class InsertQueries:
             """
             self.session.execute(query, [increment, warehouse_id, metric_name])
             return True
-        except Exception as e:
-            print(f"Error updating counter: {e}")
+        except DRIVER_ERRORS:
+            _log_failure("insert_warehouse_metric_counter failed w=%s", warehouse_id)
             return False
 
     def insert_customer_with_udt(
@@ -482,8 +505,13 @@ class InsertQueries:
                 query, [warehouse_id, district_id, customer_id, name, address_data]
             )
             return True
-        except Exception as e:
-            print(f"Error inserting with UDT: {e}")
+        except DRIVER_ERRORS:
+            _log_failure(
+                "insert_customer_with_udt failed w=%s d=%s c=%s",
+                warehouse_id,
+                district_id,
+                customer_id,
+            )
             return False
 
     def insert_product_with_static(
@@ -514,8 +542,8 @@ class InsertQueries:
                 query, [category_id, category_name, product_id, product_name, tags]
             )
             return True
-        except Exception as e:
-            print(f"Error inserting with static column: {e}")
+        except DRIVER_ERRORS:
+            _log_failure("insert_product_with_static failed")
             return False
 
     def insert_inventory_log_with_ttl(
@@ -545,8 +573,8 @@ class InsertQueries:
             """
             self.session.execute(query, [warehouse_id, item_id, log_type, message, ttl_seconds])
             return True
-        except Exception as e:
-            print(f"Error inserting with TTL: {e}")
+        except DRIVER_ERRORS:
+            _log_failure("insert_inventory_log_with_ttl failed w=%s i=%s", warehouse_id, item_id)
             return False
 
     def insert_orders_batch_logged(self, orders: List[Dict[str, Any]]) -> bool:
@@ -581,8 +609,8 @@ class InsertQueries:
 
             self.session.execute(batch)
             return True
-        except Exception as e:
-            print(f"Error in logged batch insert: {e}")
+        except DRIVER_ERRORS:
+            _log_failure("insert_orders_batch_logged failed for %d orders", len(orders))
             return False
 
     def insert_order_tracking_batch_unlogged(self, tracking_records: List[Dict[str, Any]]) -> bool:
@@ -622,8 +650,11 @@ class InsertQueries:
 
             self.session.execute(batch_query, params)
             return True
-        except Exception as e:
-            print(f"Error in unlogged batch insert: {e}")
+        except DRIVER_ERRORS:
+            _log_failure(
+                "insert_order_tracking_batch_unlogged failed for %d tracking records",
+                len(tracking_records),
+            )
             return False
 
     def insert_order_with_timestamp(self, data: Dict[str, Any], timestamp_micros: int) -> bool:
@@ -661,8 +692,8 @@ class InsertQueries:
                 ],
             )
             return True
-        except Exception as e:
-            print(f"Error inserting with timestamp: {e}")
+        except DRIVER_ERRORS:
+            _log_failure("insert_order_with_timestamp failed")
             return False
 
     def insert_item_all_types(
@@ -694,8 +725,8 @@ class InsertQueries:
             category_id = item_id % 10
             self.session.execute(query, [category_id, item_id, name, tags, specs, reviews])
             return True
-        except Exception as e:
-            print(f"Error inserting with all collection types: {e}")
+        except DRIVER_ERRORS:
+            _log_failure("insert_item_all_types failed i=%s", item_id)
             return False
 
     def insert_into_multiple_tables(self, order_data: Dict[str, Any]) -> bool:
@@ -769,8 +800,8 @@ class InsertQueries:
             )
 
             return True
-        except Exception as e:
-            print(f"Error inserting into multiple tables: {e}")
+        except DRIVER_ERRORS:
+            _log_failure("insert_into_multiple_tables failed")
             return False
 
     def insert_with_lwt_condition(
@@ -808,7 +839,14 @@ class InsertQueries:
                 "applied": row[0],
                 "message": "Insert successful" if row[0] else "Record already exists",
             }
-        except Exception as e:
+        except DRIVER_ERRORS as e:
+            _log_failure(
+                "insert_with_lwt_condition failed w=%s d=%s o=%s c=%s",
+                warehouse_id,
+                district_id,
+                order_id,
+                customer_id,
+            )
             return {"applied": False, "message": f"Error: {e}"}
 
     def insert_customer_activity_json(self, customer_id: int, activity_json: str) -> bool:
@@ -830,8 +868,8 @@ class InsertQueries:
             """
             self.session.execute(query)
             return True
-        except Exception as e:
-            print(f"Error inserting from JSON: {e}")
+        except DRIVER_ERRORS:
+            _log_failure("insert_customer_activity_json failed c=%s", customer_id)
             return False
 
     def increment_warehouse_counter(
@@ -865,6 +903,6 @@ class InsertQueries:
                 query, [orders_increment, revenue_increment, warehouse_id, stat_date]
             )
             return True
-        except Exception as e:
-            print(f"Error incrementing counters: {e}")
+        except DRIVER_ERRORS:
+            _log_failure("increment_warehouse_counter failed w=%s", warehouse_id)
             return False
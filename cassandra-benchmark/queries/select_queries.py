@@ -5,6 +5,7 @@ Categorized by complexity: Simple, Medium, Complex
 
 from typing import Any, Dict, List
 
+from benchmarks.query_definitions import QUERY_REGISTRY
 from cassandra.cluster import Session
 
 
@@ -22,49 +23,25 @@ class SelectQueries:
         self._prepare_statements()
 
     def _prepare_statements(self) -> None:
-        """Prepare all SELECT statements for better performance."""
-        # Simple queries
-        self.get_warehouse_stmt = self.session.prepare("SELECT * FROM warehouse WHERE w_id = ?")
-
-        self.get_customer_stmt = self.session.prepare(
-            "SELECT * FROM customer WHERE c_w_id = ? AND c_d_id = ? AND c_id = ?"
-        )
+        """Bind the SELECT statements prepared once per session by the query registry."""
+        prepared = QUERY_REGISTRY.prepare_all(self.session)
 
-        self.get_item_stmt = self.session.prepare("SELECT * FROM item WHERE i_id = ?")
-
-        self.get_district_stmt = self.session.prepare(
-            "SELECT * FROM district WHERE d_w_id = ? AND d_id = ?"
-        )
+        # Simple queries
+        self.get_warehouse_stmt = prepared["S1"]
+        self.get_customer_stmt = prepared["S2"]
+        self.get_item_stmt = prepared["S3"]
+        self.get_district_stmt = prepared["S4"]
 
         # Medium queries
-        self.get_customers_by_district_stmt = self.session.prepare(
-            "SELECT * FROM customer WHERE c_w_id = ? AND c_d_id = ? LIMIT ?"
-        )
-
-        self.get_stock_stmt = self.session.prepare(
-            "SELECT * FROM stock WHERE s_w_id = ? AND s_i_id = ?"
-        )
-
-        self.get_orders_by_customer_stmt = self.session.prepare(
-            "SELECT * FROM orders_by_customer WHERE o_c_id = ? AND o_w_id = ? AND o_d_id = ? LIMIT ?"  # noqa: E501
-        )
-
-        self.get_order_lines_stmt = self.session.prepare(
-            "SELECT * FROM order_line WHERE ol_w_id = ? AND ol_d_id = ? AND ol_o_id = ?"
-        )
+        self.get_customers_by_district_stmt = prepared["M1"]
+        self.get_stock_stmt = prepared["M2"]
+        self.get_orders_by_customer_stmt = prepared["M3"]
+        self.get_order_lines_stmt = prepared["M4"]
 
         # Complex queries
-        self.get_customers_by_name_stmt = self.session.prepare(
-            "SELECT * FROM customer_by_name WHERE c_w_id = ? AND c_d_id = ? AND c_last = ?"
-        )
-
-        self.get_new_orders_stmt = self.session.prepare(
-            "SELECT * FROM new_order WHERE no_w_id = ? AND no_d_id = ? LIMIT ?"
-        )
-
-        self.get_history_by_date_stmt = self.session.prepare(
-            "SELECT * FROM history WHERE h_w_id = ? AND h_d_id = ? AND date_bucket = ? AND h_date >= ? AND h_date <= ?"  # noqa: E501
-        )
+        self.get_customers_by_name_stmt = prepared["C1"]
+        self.get_new_orders_stmt = prepared["C2"]
+        self.get_history_by_date_stmt = prepared["C3"]
 
     # ========== SIMPLE SELECT QUERIES ==========
 
@@ -3,10 +3,20 @@ UPDATE queries for TPC-C benchmark.
 Categorized by complexity: Simple, Medium, Complex
 """
 
+import logging
 from typing import Any, Dict, List
 
+from benchmarks.query_definitions import QUERY_REGISTRY
 from cassandra.cluster import Session
 from cassandra.query import BatchStatement, ConsistencyLevel
+from queries.driver_errors import DRIVER_ERRORS, log_failure
+
+logger = logging.getLogger(__name__)
+
+
+def _log_failure(message: str, *args: Any) -> None:
+    """Log the exception being handled for a failed update."""
+    log_failure(logger, message, *args)
 
 
 class UpdateQueries:
@@ -69,6 +79,14 @@ class UpdateQueries:
         )
 
         # Complex updates - LWT with multiple conditions
+        self.update_stock_level_stmt = self.session.prepare(
+            """
+            UPDATE stock
+            SET s_quantity = ?
+            WHERE s_w_id = ? AND s_i_id = ?
+            """
+        )
+
         self.update_stock_with_lwt_stmt = self.session.prepare(
             """
             UPDATE stock
@@ -110,8 +128,13 @@ class UpdateQueries:
                 [balance, ytd_payment, payment_cnt, warehouse_id, district_id, customer_id],
             )
             return True
-        except Exception as e:
-            print(f"Error updating customer balance: {e}")
+        except DRIVER_ERRORS:
+            _log_failure(
+                "update_customer_balance failed w=%s d=%s c=%s",
+                warehouse_id,
+                district_id,
+                customer_id,
+            )
             return False
 
     def update_stock_quantity(
@@ -136,8 +159,8 @@ class UpdateQueries:
                 self.update_stock_quantity_stmt, [quantity, ytd, order_cnt, warehouse_id, item_id]
             )
             return True
-        except Exception as e:
-            print(f"Error updating stock quantity: {e}")
+        except DRIVER_ERRORS:
+            _log_failure("update_stock_quantity failed w=%s i=%s", warehouse_id, item_id)
             return False
 
     def update_district_next_order(
@@ -160,8 +183,8 @@ class UpdateQueries:
                 self.update_district_next_order_stmt, [next_order_id, warehouse_id, district_id]
             )
             return True
-        except Exception as e:
-            print(f"Error updating district next order: {e}")
+        except DRIVER_ERRORS:
+            _log_failure("update_district_next_order failed w=%s d=%s", warehouse_id, district_id)
             return False
 
     # ========== MEDIUM UPDATE QUERIES ==========
@@ -191,7 +214,13 @@ class UpdateQueries:
                 "applied": row[0],
                 "message": "Update successful" if row[0] else "Carrier already assigned",
             }
-        except Exception as e:
+        except DRIVER_ERRORS as e:
+            _log_failure(
+                "update_order_carrier_conditional failed w=%s d=%s o=%s",
+                warehouse_id,
+                district_id,
+                order_id,
+            )
             return {"applied": False, "message": f"Error: {e}"}
 
     def update_customer_credit_conditional(
@@ -228,7 +257,13 @@ class UpdateQueries:
                 "applied": row[0],
                 "message": "Update successful" if row[0] else "Credit status mismatch",
             }
-        except Exception as e:
+        except DRIVER_ERRORS as e:
+            _log_failure(
+                "update_customer_credit_conditional failed w=%s d=%s c=%s",
+                warehouse_id,
+                district_id,
+                customer_id,
+            )
             return {"applied": False, "message": f"Error: {e}"}
 
     def update_stocks_batch(self, updates: List[Dict[str, Any]]) -> bool:
@@ -259,8 +294,8 @@ class UpdateQueries:
 
             self.session.execute(batch)
             return True
-        except Exception as e:
-            print(f"Error batch updating stocks: {e}")
+        except DRIVER_ERRORS:
+            _log_failure("update_stocks_batch failed for %d updates", len(updates))
             return False
 
     # ========== COMPLEX UPDATE QUERIES ==========
@@ -302,7 +337,8 @@ class UpdateQueries:
                 "message": "Update successful" if row[0] else "Insufficient stock quantity",
                 "current_quantity": row.s_quantity if not row[0] else new_quantity,
             }
-        except Exception as e:
+        except DRIVER_ERRORS as e:
+            _log_failure("update_stock_with_lwt failed w=%s i=%s", warehouse_id, item_id)
             return {"applied": False, "message": f"Error: {e}", "current_quantity": None}
 
     def update_order_and_customer_batch(
@@ -355,8 +391,8 @@ class UpdateQueries:
 
             self.session.execute(batch)
             return True
-        except Exception as e:
-            print(f"Error batch updating order and customer: {e}")
+        except DRIVER_ERRORS:
+            _log_failure("update_order_and_customer_batch failed")
             return False
 
     # ========== ADDITIONAL UPDATE QUERIES (U9-U23) ==========
@@ -386,8 +422,13 @@ class UpdateQueries:
             """
             self.session.execute(query, [{new_phone}, warehouse_id, district_id, customer_id])
             return True
-        except Exception as e:
-            print(f"Error updating set collection: {e}")
+        except DRIVER_ERRORS:
+            _log_failure(
+                "update_customer_add_phone failed w=%s d=%s c=%s",
+                warehouse_id,
+                district_id,
+                customer_id,
+            )
             return False
 
     def update_customer_preferences_map(
@@ -415,8 +456,13 @@ class UpdateQueries:
             """
             self.session.execute(query, [prefs_update, warehouse_id, district_id, customer_id])
             return True
-        except Exception as e:
-            print(f"Error updating map collection: {e}")
+        except DRIVER_ERRORS:
+            _log_failure(
+                "update_customer_preferences_map failed w=%s d=%s c=%s",
+                warehouse_id,
+                district_id,
+                customer_id,
+            )
             return False
 
     def update_customer_append_email(
@@ -444,8 +490,13 @@ class UpdateQueries:
             """
             self.session.execute(query, [[new_email], warehouse_id, district_id, customer_id])
             return True
-        except Exception as e:
-            print(f"Error updating list collection: {e}")
+        except DRIVER_ERRORS:
+            _log_failure(
+                "update_customer_append_email failed w=%s d=%s c=%s",
+                warehouse_id,
+                district_id,
+                customer_id,
+            )
             return False
 
     def update_customer_remove_phone(
@@ -473,8 +524,13 @@ class UpdateQueries:
             """
             self.session.execute(query, [{phone_to_remove}, warehouse_id, district_id, customer_id])
             return True
-        except Exception as e:
-            print(f"Error removing from set: {e}")
+        except DRIVER_ERRORS:
+            _log_failure(
+                "update_customer_remove_phone failed w=%s d=%s c=%s",
+                warehouse_id,
+                district_id,
+                customer_id,
+            )
             return False
 
     def update_order_with_ttl(
@@ -506,8 +562,10 @@ class UpdateQueries:
                 query, [carrier_id, warehouse_id, district_id, order_id, ttl_seconds]
             )
             return True
-        except Exception as e:
-            print(f"Error updating with TTL: {e}")
+        except DRIVER_ERRORS:
+            _log_failure(
+                "update_order_with_ttl failed w=%s d=%s o=%s", warehouse_id, district_id, order_id
+            )
             return False
 
     def update_customer_with_timestamp(
@@ -544,8 +602,13 @@ class UpdateQueries:
                 query, [balance, warehouse_id, district_id, customer_id, timestamp_micros]
             )
             return True
-        except Exception as e:
-            print(f"Error updating with timestamp: {e}")
+        except DRIVER_ERRORS:
+            _log_failure(
+                "update_customer_with_timestamp failed w=%s d=%s c=%s",
+                warehouse_id,
+                district_id,
+                customer_id,
+            )
             return False
 
     def update_warehouse_metrics_counter(
@@ -572,8 +635,8 @@ class UpdateQueries:
             """
             self.session.execute(query, [increment, warehouse_id, metric_name])
             return True
-        except Exception as e:
-            print(f"Error updating counter: {e}")
+        except DRIVER_ERRORS:
+            _log_failure("update_warehouse_metrics_counter failed w=%s", warehouse_id)
             return False
 
     def update_multiple_customer_fields(
@@ -604,8 +667,13 @@ class UpdateQueries:
             params = list(updates.values()) + [warehouse_id, district_id, customer_id]
             self.session.execute(query, params)
             return True
-        except Exception as e:
-            print(f"Error updating multiple fields: {e}")
+        except DRIVER_ERRORS:
+            _log_failure(
+                "update_multiple_customer_fields failed w=%s d=%s c=%s",
+                warehouse_id,
+                district_id,
+                customer_id,
+            )
             return False
 
     def update_customer_with_collection_and_ttl(
@@ -637,8 +705,13 @@ class UpdateQueries:
                 query, [{tag}, warehouse_id, district_id, customer_id, ttl_seconds]
             )
             return True
-        except Exception as e:
-            print(f"Error updating collection with TTL: {e}")
+        except DRIVER_ERRORS:
+            _log_failure(
+                "update_customer_with_collection_and_ttl failed w=%s d=%s c=%s",
+                warehouse_id,
+                district_id,
+                customer_id,
+            )
             return False
 
     def update_static_column(self, category_id: int, new_description: str) -> bool:
@@ -662,8 +735,8 @@ class UpdateQueries:
             """
             self.session.execute(query, [new_description, category_id])
             return True
-        except Exception as e:
-            print(f"Error updating static column: {e}")
+        except DRIVER_ERRORS:
+            _log_failure("update_static_column failed")
             return False
 
     def update_with_lwt_multiple_conditions(
@@ -716,7 +789,13 @@ class UpdateQueries:
                 "current_balance": row.c_balance if not row[0] else new_balance,
                 "current_credit": row.c_credit if not row[0] else expected_credit,
             }
-        except Exception as e:
+        except DRIVER_ERRORS as e:
+            _log_failure(
+                "update_with_lwt_multiple_conditions failed w=%s d=%s c=%s",
+                warehouse_id,
+                district_id,
+                customer_id,
+            )
             return {"applied": False, "message": f"Error: {e}"}
 
     def update_batch_unlogged(self, updates: List[Dict[str, Any]]) -> bool:
@@ -732,21 +811,15 @@ class UpdateQueries:
             True if successful
         """
         try:
-            batch_query = "BEGIN UNLOGGED BATCH\n"
-            params = []
-
-            for update in updates:
-                batch_query += """
-                    UPDATE stock
-                    SET s_quantity = ?
-                    WHERE s_w_id = ? AND s_i_id = ?;
-                """
-                params.extend([update["quantity"], update["warehouse_id"], update["item_id"]])
-
-            batch_query += "APPLY BATCH;"
-
-            self.session.execute(batch_query, params)
+            batch = QUERY_REGISTRY.build_batch(
+                self.update_stock_level_stmt,
+                (
+                    [update["quantity"], update["warehouse_id"], update["item_id"]]
+                    for update in updates
+                ),
+            )
+            self.session.execute(batch)
             return True
-        except Exception as e:
-            print(f"Error in unlogged batch update: {e}")
+        except DRIVER_ERRORS:
+            _log_failure("update_batch_unlogged failed for %d updates", len(updates))
             return False
@@ -9,11 +9,12 @@ import random
 import time
 from typing import Any, Dict, List, Optional
 
-import yaml
-from benchmarks.query_definitions import ComplexityLevel, QueryDefinitions, QueryType
+from benchmarks.query_definitions import QUERY_REGISTRY, ComplexityLevel, QueryType
 from benchmarks.query_executor import QueryExecutor
 from cassandra.auth import PlainTextAuthProvider
-from cassandra.cluster import Cluster, Session
+from cassandra.cluster import EXEC_PROFILE_DEFAULT, Cluster, ExecutionProfile, Session
+from cassandra.policies import DCAwareRoundRobinPolicy, TokenAwarePolicy
+from config_loader import load_yaml
 from test_harness.concurrency_manager import ConcurrencyManager, LoadPattern
 from test_harness.metrics_collector import MetricsCollector
 
@@ -40,7 +41,7 @@ class BenchmarkRunner:
 
         self.cluster: Optional[Cluster] = None
         self.session: Optional[Session] = None
-        self.query_definitions = QueryDefinitions()
+        self.query_definitions = QUERY_REGISTRY
         self.query_executor: Optional[QueryExecutor] = None
         self.concurrency_manager: Optional[ConcurrencyManager] = None
         self.metrics_collector: Optional[MetricsCollector] = None
@@ -50,11 +51,21 @@ class BenchmarkRunner:
 
     def _load_config(self, config_path: str) -> dict:
         """Load configuration from YAML file."""
-        with open(config_path, "r") as f:
-            return yaml.safe_load(f)
+        return load_yaml(config_path)
+
+    def connect(self, session: Optional[Session] = None) -> None:
+        """
+        Establish connection to Cassandra cluster.
+
+        Args:
+            session: Existing session on the configured keyspace to use instead of
+                connecting a new cluster; its owner stays responsible for shutting it down
+        """
+        if session is not None:
+            self.session = session
+            self.is_connected = True
+            return
 
-    def connect(self) -> None:
-        """Establish connection to Cassandra cluster."""
         cassandra_config = self.cassandra_config["cassandra"]
 
         # Setup authentication
@@ -64,12 +75,25 @@ class BenchmarkRunner:
                 username=cassandra_config["username"], password=cassandra_config.get("password", "")
             )
 
-        # Create cluster connection
+        # Route each prepared statement straight to a replica of its partition
+        profile = ExecutionProfile(
+            load_balancing_policy=TokenAwarePolicy(
+                DCAwareRoundRobinPolicy(local_dc=cassandra_config.get("local_dc"))
+            )
+        )
+
+        # Create cluster connection, on the libev reactor when the driver was built with it
+        from connection import driver_connection_class
+
+        connection_class = driver_connection_class()
+        options = {} if connection_class is None else {"connection_class": connection_class}
         self.cluster = Cluster(
             contact_points=cassandra_config["contact_points"],
             port=cassandra_config["port"],
             auth_provider=auth_provider,
             protocol_version=cassandra_config.get("protocol_version", 4),
+            execution_profiles={EXEC_PROFILE_DEFAULT: profile},
+            **options,
         )
 
         self.session = self.cluster.connect()
@@ -158,14 +182,13 @@ class BenchmarkRunner:
         # For each query type
         for query_type_str, type_pct in query_dist.items():
             query_type = QueryType(query_type_str)
-            type_queries = self.query_definitions.get_queries_by_type(query_type)
 
             # Distribute by complexity
             for complexity_str, complexity_pct in complexity_dist.items():
                 complexity = ComplexityLevel(complexity_str)
 
-                # Filter queries by both type and complexity
-                matching_queries = [q for q in type_queries if q.complexity == complexity]
+                # Look up queries matching both type and complexity
+                matching_queries = self.query_definitions.filter_queries(query_type, complexity)
 
                 if matching_queries:
                     # Calculate how many queries of this type/complexity
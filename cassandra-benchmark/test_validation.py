@@ -3,7 +3,13 @@ Validation tests for Cassandra TPC-C Benchmark Framework.
 Tests all components without requiring a running Cassandra instance.
 """
 
+import dataclasses
+import importlib
+import importlib.util
+import string
 import sys
+import tempfile
+import threading
 import unittest
 from pathlib import Path
 
@@ -38,7 +44,7 @@ class TestQueryDefinitions(unittest.TestCase):
             self.assertEqual(
                 len(queries),
                 20,
-                f"Expected 20 queries for type {query_type.value}, got {len(queries)}",
+                f"Expected 20 queries for type {query_type.label}, got {len(queries)}",
             )
 
     def test_complexity_levels(self):
@@ -46,7 +52,7 @@ class TestQueryDefinitions(unittest.TestCase):
         for complexity in ComplexityLevel:
             queries = self.query_defs.get_queries_by_complexity(complexity)
             self.assertGreater(
-                len(queries), 0, f"No queries found for complexity {complexity.value}"
+                len(queries), 0, f"No queries found for complexity {complexity.label}"
             )
 
     def test_query_counts_by_type(self):
@@ -89,7 +95,283 @@ class TestQueryDefinitions(unittest.TestCase):
             self.assertIsInstance(query.complexity, ComplexityLevel)
             self.assertTrue(query.description)
             self.assertTrue(query.method_name)
-            self.assertIsNotNone(query.params_generator)
+            self.assertIsNotNone(query.params_template)
+
+    def test_query_ids_unique(self):
+        """Test that the query table registers each query ID exactly once."""
+        from unittest import mock
+
+        from benchmarks import query_definitions
+        from benchmarks.query_data import QUERY_ROWS
+
+        ids = [row[0] for row in QUERY_ROWS]
+        self.assertEqual(len(ids), len(set(ids)))
+        self.assertEqual(len(ids), len(self.query_defs.queries))
+
+        with mock.patch("benchmarks.query_definitions.QUERY_ROWS", QUERY_ROWS + QUERY_ROWS[:1]):
+            with self.assertRaisesRegex(ValueError, "S1"):
+                query_definitions._register_queries()
+
+    def test_params_templates_shared(self):
+        """Test that identical default parameters share one template."""
+        s2 = self.query_defs.get_query("S2")
+        u1_key = {"warehouse_id": 1, "district_id": 1, "customer_id": 100}
+        matches = [
+            q for q in self.query_defs.get_all_queries() if dict(q.params_template) == u1_key
+        ]
+
+        self.assertGreater(len(matches), 1)
+        for query in matches:
+            self.assertIs(query.params_template, s2.params_template)
+
+        c1 = self.query_defs.get_query("C1").params_template
+        name = "".join(["warehouse", "_id"])
+        self.assertIs(next(k for k in c1 if k == name), sys.intern(name))
+        self.assertIs(c1["last_name"], sys.intern("".join(["SMI", "TH"])))
+
+    def test_registry_shared(self):
+        """Test that instances share the import-time registry and it is read-only."""
+        from benchmarks import query_definitions
+
+        self.assertIs(QueryDefinitions().queries, self.query_defs.queries)
+        self.assertIs(query_definitions.QUERY_REGISTRY.queries, self.query_defs.queries)
+        with self.assertRaises(TypeError):
+            self.query_defs.queries["S1"] = None
+
+        with self.assertRaises(TypeError):
+            self.query_defs._groups[(QueryType.SELECT, None)] = ()
+
+        s1 = self.query_defs.get_query("S1")
+        with self.assertRaises(TypeError):
+            self.query_defs.remove("S1")
+
+        copy = self.query_defs.mutable_copy()
+        with self.assertRaises(TypeError):
+            del copy.queries["S1"]
+        copy.remove("S1")
+        self.assertIsNone(copy.get_query("S1"))
+        self.assertNotIn(s1, copy.get_queries_by_type(QueryType.SELECT))
+        self.assertEqual(copy.get_query_count_by_type()["select"], 19)
+        self.assertIs(self.query_defs.get_query("S1"), s1)
+
+        copy.add(dataclasses.replace(s1, complexity=ComplexityLevel.COMPLEX))
+        self.assertIn("S1", copy.queries)
+        complex_selects = copy.filter_queries(QueryType.SELECT, ComplexityLevel.COMPLEX)
+        self.assertIs(complex_selects[-1], copy.get_query("S1"))
+
+    def test_bind_resolves_methods(self):
+        """Test that bind() pre-resolves method names against the handlers."""
+
+        class Handler:
+            def __getattr__(self, name):
+                return name
+
+        handlers = {query_type: Handler() for query_type in QueryType}
+        bound = self.query_defs.bind(handlers)
+
+        self.assertEqual(len(bound), 80)
+        query_id, method, params = bound[0]
+        query = self.query_defs.get_query(query_id)
+        self.assertEqual(method, query.method_name)
+        self.assertIs(params, query.params_template)
+
+    def test_build_dispatcher(self):
+        """Test that the dispatcher calls the bound method with default params."""
+        from unittest.mock import MagicMock
+
+        handlers = {query_type: MagicMock() for query_type in QueryType}
+        dispatch = self.query_defs.build_dispatcher(handlers)
+
+        dispatch("S2")
+
+        handlers[QueryType.SELECT].select_customer_by_id.assert_called_once_with(
+            warehouse_id=1, district_id=1, customer_id=100
+        )
+        with self.assertRaises(KeyError):
+            dispatch("X1")
+
+    def test_partition_key_fields(self):
+        """Test that partition key fields name real parameters."""
+        for query in self.query_defs.get_all_queries():
+            for name in query.partition_key_fields:
+                self.assertIn(name, query.params_template, query.query_id)
+
+    def test_group_by_partition(self):
+        """Test grouping queries by partition key values."""
+        groups = self.query_defs.group_by_partition(
+            ["U1", "D8", "U2", "D7"], params={"D8": {"warehouse_id": 2, "district_id": 1}}
+        )
+
+        self.assertEqual(
+            groups,
+            {
+                (("warehouse_id", 1), ("district_id", 1)): ["U1"],
+                (("warehouse_id", 2), ("district_id", 1)): ["D8"],
+                (("warehouse_id", 1), ("item_id", 1000)): ["U2"],
+            },
+        )
+
+    def test_prepare_all_once_per_session(self):
+        """Test that CQL statements are prepared once per session."""
+        from unittest.mock import MagicMock
+
+        session = MagicMock()
+        session.prepare.side_effect = lambda cql: ("prepared", cql)
+
+        prepared = self.query_defs.prepare_all(session)
+        again = QueryDefinitions().prepare_all(session)
+
+        self.assertIs(prepared, again)
+        self.assertEqual(prepared["S1"], ("prepared", self.query_defs.get_query("S1").cql))
+        self.assertEqual(session.prepare.call_count, len(prepared))
+
+    def test_bind_values(self):
+        """Test positional bind values in CQL bind-marker order."""
+        m3 = self.query_defs.get_query("M3")
+        self.assertEqual(m3.bind_order, ("customer_id", "warehouse_id", "district_id", "limit"))
+        self.assertEqual(m3.bind_values(), (100, 1, 1, 20))
+        self.assertIs(m3.bind_values(), m3.bind_defaults)
+        self.assertEqual(
+            m3.bind_values({"limit": 5, "district_id": 2, "warehouse_id": 3, "customer_id": 4}),
+            (4, 3, 2, 5),
+        )
+        self.assertEqual(self.query_defs.get_query("I1").bind_order, ())
+
+    def test_execute_all_async(self):
+        """Test that queries are all submitted before any result is awaited."""
+        from unittest.mock import MagicMock
+
+        events = []
+        session = MagicMock()
+        session.prepare.side_effect = lambda cql: cql
+
+        def execute_async(statement, values):
+            events.append(("submit", statement))
+            future = MagicMock()
+            future.result.side_effect = lambda: events.append(("result", statement)) or values
+            return future
+
+        session.execute_async.side_effect = execute_async
+
+        results = self.query_defs.execute_all_async(
+            session, ["S2", "M1"], params={"M1": {"warehouse_id": 3, "district_id": 4, "limit": 5}}
+        )
+
+        self.assertEqual(results, [(1, 1, 100), (3, 4, 5)])
+        self.assertEqual([kind for kind, _ in events], ["submit", "submit", "result", "result"])
+        with self.assertRaises(KeyError):
+            self.query_defs.execute_all_async(session, ["I1"])
+
+    def test_build_batch(self):
+        """Test that build_batch binds one statement per row in an UNLOGGED batch."""
+        from unittest import mock
+
+        driver = mock.MagicMock()
+        with mock.patch.dict(
+            sys.modules, {"cassandra": mock.MagicMock(), "cassandra.query": driver}
+        ):
+            batch = QueryDefinitions.build_batch("stmt", ([1, 2], [3, 4]))
+            QueryDefinitions.build_batch("stmt", [], logged=True)
+
+        self.assertEqual(
+            driver.BatchStatement.call_args_list,
+            [
+                mock.call(batch_type=driver.BatchType.UNLOGGED, consistency_level=None),
+                mock.call(batch_type=driver.BatchType.LOGGED, consistency_level=None),
+            ],
+        )
+        self.assertEqual(
+            batch.add.call_args_list, [mock.call("stmt", [1, 2]), mock.call("stmt", [3, 4])]
+        )
+
+    def test_enum_label_lookup(self):
+        """Test that integer enums still resolve from their config labels."""
+        self.assertIs(QueryType("select"), QueryType.SELECT)
+        self.assertIs(ComplexityLevel("complex"), ComplexityLevel.COMPLEX)
+        self.assertEqual(QueryType.DELETE.label, "delete")
+        with self.assertRaises(ValueError):
+            QueryType("merge")
+
+    def test_grouped_views(self):
+        """Test that the type and complexity getters return the shared filter results."""
+        selects = self.query_defs.filter_queries(query_type=QueryType.SELECT)
+        self.assertEqual(len(selects), 20)
+        self.assertIs(selects, self.query_defs.get_queries_by_type(QueryType.SELECT))
+        self.assertTrue(
+            all(
+                q.complexity == ComplexityLevel.SIMPLE
+                for q in self.query_defs.get_queries_by_complexity(ComplexityLevel.SIMPLE)
+            )
+        )
+
+    def test_query_definition_immutable(self):
+        """Test that query definitions are frozen and slotted."""
+        query = self.query_defs.get_query("S1")
+
+        self.assertFalse(hasattr(query, "__dict__"))
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            query.name = "Renamed"
+
+    def test_column_layout(self):
+        """Test that the columnar index agrees with the query dict."""
+        for query_id, query in self.query_defs.queries.items():
+            self.assertIs(self.query_defs.get(query_id), query)
+
+    def test_filter_indices(self):
+        """Test that the filter index matches a full scan for every combination."""
+        all_queries = self.query_defs.get_all_queries()
+        for query_type in (None, *QueryType):
+            for complexity in (None, *ComplexityLevel):
+                expected = tuple(
+                    q
+                    for q in all_queries
+                    if query_type in (None, q.query_type) and complexity in (None, q.complexity)
+                )
+                self.assertEqual(self.query_defs.filter_queries(query_type, complexity), expected)
+
+        deletes = self.query_defs.filter_queries(query_type=QueryType.DELETE)
+        self.assertIs(self.query_defs.filter_queries(query_type=QueryType.DELETE), deletes)
+
+    def test_params_template_read_only(self):
+        """Test that default parameters are shared read-only templates."""
+        query = self.query_defs.get_query("S1")
+
+        with self.assertRaises(TypeError):
+            query.params_template["warehouse_id"] = 2
+
+        params = query.make_params()
+        params["warehouse_id"] = 2
+        self.assertEqual(query.params_template["warehouse_id"], 1)
+
+        # params_generator() stays available and returns the shared template
+        self.assertIs(query.params_generator(), query.params_template)
+        self.assertEqual(query.params_generator.copy(), {"warehouse_id": 1})
+        # ...without a per-definition callable stored on the instance
+        self.assertNotIn("params_generator", QueryDefinition.__slots__)
+
+    def test_to_arrow(self):
+        """Test Arrow export of the registry."""
+        try:
+            import pyarrow as pa
+        except ImportError:
+            self.skipTest("pyarrow not installed")
+
+        batch = self.query_defs.to_arrow()
+        self.assertEqual(batch.num_rows, 80)
+        self.assertEqual(
+            batch.schema.names, ["id", "name", "qtype", "complexity", "method", "params_json"]
+        )
+        row = batch.slice(0, 1).to_pylist()[0]
+        self.assertEqual(row["id"], "S1")
+        self.assertEqual(row["qtype"], QueryType.SELECT)
+        self.assertEqual(row["complexity"], ComplexityLevel.SIMPLE)
+        self.assertEqual(row["params_json"], '{"warehouse_id": 1}')
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = str(Path(tmp) / "queries.arrow")
+            self.query_defs.write_arrow(path)
+            with pa.memory_map(path) as source:
+                self.assertTrue(pa.ipc.open_file(source).get_batch(0).equals(batch))
 
 
 class TestTPCCDataGenerator(unittest.TestCase):
@@ -152,6 +434,103 @@ class TestTPCCDataGenerator(unittest.TestCase):
         self.assertIn(customer["c_credit"], ["GC", "BC"])
         self.assertIsInstance(customer["c_balance"], float)
 
+    def test_generate_customer_rows(self):
+        """Tuple rows follow CUSTOMER_COLUMNS and reorder cleanly for customer_by_name."""
+        from data_generator.tpcc_data_generator import CUSTOMER_COLUMNS
+
+        row = self.generator.generate_customer_row(7, 2, 1)
+        self.assertEqual(len(row), len(CUSTOMER_COLUMNS))
+        customer = dict(zip(CUSTOMER_COLUMNS, row))
+        self.assertEqual((customer["c_w_id"], customer["c_d_id"], customer["c_id"]), (1, 2, 7))
+
+        by_name = self.generator.generate_customer_by_name_row(row)
+        self.assertEqual(len(by_name), len(row))
+        self.assertEqual(
+            by_name[:6],
+            tuple(
+                customer[c] for c in ("c_w_id", "c_d_id", "c_last", "c_first", "c_id", "c_middle")
+            ),
+        )
+        self.assertEqual(by_name[6:], row[6:])
+
+        rows = self.generator.generate_district_customer_rows(2, 1)
+        self.assertEqual([r[2] for r in rows], list(range(1, 101)))
+
+    def test_shared_now(self):
+        """A caller-supplied timestamp is used instead of reading the clock per row."""
+        from datetime import datetime
+
+        now = datetime(2024, 1, 1, 12, 0)
+        self.assertEqual(self.generator.generate_customer(1, 1, 1, now)["c_since"], now)
+        rows = self.generator.generate_district_customer_rows(1, 1, now)
+        self.assertEqual({row[12] for row in rows}, {now})
+
+    def test_epoch_ms_dates(self):
+        """Order and history dates are whole days before now, in epoch milliseconds."""
+        from datetime import datetime, timedelta
+
+        now_ms = 1_704_110_400_000  # 2024-01-01 12:00 UTC
+        day_ms = 86_400_000
+        entry = self.generator.generate_order(1, 1, 1, 1, now_ms=now_ms)["o_entry_d"]
+        self.assertIsInstance(entry, int)
+        self.assertTrue(now_ms - 365 * day_ms <= entry <= now_ms)
+        self.assertEqual((now_ms - entry) % day_ms, 0)
+
+        history = self.generator.generate_history(1, 1, 1, 1, 1, now_ms=now_ms)
+        self.assertTrue(now_ms - 365 * day_ms <= history["h_date"] <= now_ms)
+        days = (now_ms - history["h_date"]) // day_ms
+        expected = (datetime(2024, 1, 1) - timedelta(days=days)).strftime("%Y-%m-%d")
+        self.assertEqual(history["date_bucket"], expected)
+
+    def test_fixed_length_pools(self):
+        """Fixed-length columns are drawn from the pre-generated pools."""
+        stock = self.generator.generate_stock(1, 1)
+        for i in range(1, 11):
+            self.assertIn(stock[f"s_dist_{i:02d}"], self.generator._dist_pool)
+        customer = self.generator.generate_customer(1, 1, 1)
+        self.assertIn(customer["c_state"], self.generator._state_pool)
+        self.assertIn(customer["c_zip"], self.generator._zip_pool)
+        self.assertFalse(hasattr(self.generator, "_phone_pool"))
+        self.assertEqual(len(customer["c_phone"]), 16)
+        self.assertTrue(all(len(d) == 24 for d in self.generator._dist_pool))
+
+    def test_generate_random_string(self):
+        """Scalar string generators honour lengths and alphabets."""
+        alphabet = set(string.ascii_uppercase + string.digits)
+        for min_len, max_len in ((0, 0), (2, 2), (10, 20), (300, 500)):
+            value = self.generator.generate_random_string(min_len, max_len)
+            self.assertTrue(min_len <= len(value) <= max_len)
+            self.assertLessEqual(set(value), alphabet)
+        self.assertEqual(
+            set("".join(self.generator.generate_random_string(9, 9) for _ in range(200))), alphabet
+        )
+        self.assertRegex(self.generator.generate_random_numeric_string(16), r"^[0-9]{16}$")
+
+    def test_generate_random_strings_batch(self):
+        """Batch string generators honour lengths and alphabets."""
+        strings = self.generator.generate_random_strings(500, 3, 7)
+        self.assertEqual(len(strings), 500)
+        self.assertTrue(all(3 <= len(s) <= 7 and s.isalnum() and s.upper() == s for s in strings))
+        phones = self.generator.generate_random_numeric_strings(50, 16)
+        self.assertTrue(all(len(p) == 16 and p.isdigit() for p in phones))
+        self.assertEqual(self.generator.generate_random_strings(0, 1, 2), [])
+
+    def test_generate_district_customers(self):
+        """District batches match the per-customer generator's shape."""
+        customers = self.generator.generate_district_customers(2, 1)
+
+        self.assertEqual([c["c_id"] for c in customers], list(range(1, 101)))
+        self.assertEqual(set(customers[0]), set(self.generator.generate_customer(1, 2, 1)))
+        self.assertIsInstance(self.generator.last_names, tuple)
+        self.assertLessEqual({c["c_last"] for c in customers}, set(self.generator.last_names))
+        self.assertLessEqual({c["c_credit"] for c in customers}, {"GC", "BC"})
+        for customer in customers:
+            self.assertEqual((customer["c_d_id"], customer["c_w_id"]), (2, 1))
+            self.assertTrue(300 <= len(customer["c_data"]) <= 500)
+            self.assertTrue(customer["c_zip"].endswith("11111"))
+            self.assertEqual(len(customer["c_phone"]), 16)
+        self.assertEqual(len({c["c_phone"] for c in customers}), len(customers))
+
     def test_generate_item(self):
         """Test item data generation."""
         item = self.generator.generate_item(100)
@@ -162,6 +541,19 @@ class TestTPCCDataGenerator(unittest.TestCase):
         self.assertIsInstance(item["i_price"], float)
         self.assertGreater(item["i_price"], 0)
 
+    def test_generate_item_rows(self):
+        """Vectorized item rows stay within the per-item generator's ranges."""
+        rows = self.generator.generate_item_rows(11, 50)
+        self.assertEqual([row[0] for row in rows], list(range(11, 61)))
+        for i_id, im_id, name, price, data in rows:
+            self.assertIsInstance(im_id, int)
+            self.assertTrue(1 <= im_id <= 10000)
+            self.assertTrue(14 <= len(name) <= 24)
+            self.assertIsInstance(price, float)
+            self.assertTrue(1.0 <= price <= 100.0)
+            self.assertEqual(price, round(price, 2))
+            self.assertTrue(26 <= len(data) <= 50)
+
     def test_generate_stock(self):
         """Test stock data generation."""
         stock = self.generator.generate_stock(100, 1)
@@ -214,6 +606,830 @@ class TestTPCCDataGenerator(unittest.TestCase):
         self.assertTrue(history["date_bucket"])
 
 
+class TestDataLoader(unittest.TestCase):
+    """Test DataLoader submission patterns against a mocked driver."""
+
+    def setUp(self):
+        """Import DataLoader with the Cassandra driver modules mocked out."""
+        from unittest import mock
+
+        modules = {
+            name: mock.MagicMock()
+            for name in (
+                "cassandra",
+                "cassandra.cluster",
+                "cassandra.concurrent",
+                "cassandra.policies",
+                "cassandra.query",
+            )
+        }
+        patcher = mock.patch.dict(sys.modules, modules)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        sys.modules.pop("data_generator.data_loader", None)
+        self.addCleanup(sys.modules.pop, "data_generator.data_loader", None)
+
+        # import_module rather than "from data_generator import data_loader", which would
+        # return the package attribute bound to an earlier test's mocked driver
+        data_loader = importlib.import_module("data_generator.data_loader")
+
+        self.submitted = []
+
+        def execute_concurrent_with_args(session, statement, parameters, **kwargs):
+            self.submitted.append((statement, list(parameters), kwargs))
+            return []
+
+        def execute_concurrent(session, statements_and_params, **kwargs):
+            for statement, params in statements_and_params:
+                self.submitted.append((statement, [params], kwargs))
+            return iter(())
+
+        for name, fake in (
+            ("execute_concurrent_with_args", execute_concurrent_with_args),
+            ("execute_concurrent", execute_concurrent),
+        ):
+            patcher = mock.patch.object(data_loader, name, fake)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        self.session = mock.MagicMock()
+        self.session.prepare.side_effect = lambda cql: mock.MagicMock(query_string=cql)
+        self.generator = TPCCDataGenerator(
+            num_warehouses=3,
+            num_districts_per_warehouse=4,
+            num_customers_per_district=5,
+            num_items=7,
+        )
+        self.loader = data_loader.DataLoader(self.session, self.generator)
+        self.data_loader = data_loader
+
+    def _set_partition_keys(self, **tables):
+        from unittest import mock
+
+        metadata = self.session.cluster.metadata.keyspaces[self.session.keyspace]
+        metadata.tables = {
+            table: mock.MagicMock(partition_key=[mock.MagicMock(name=c) for c in columns])
+            for table, columns in tables.items()
+        }
+        for table, columns in tables.items():
+            for column, name in zip(metadata.tables[table].partition_key, columns):
+                column.name = name
+
+    def _rows(self, statement):
+        return [row for stmt, rows, _ in self.submitted if stmt is statement for row in rows]
+
+    def test_prepared_inserts_idempotent(self):
+        """Every prepared insert is marked idempotent so the driver may retry it."""
+        prepared = {call.args[0] for call in self.session.prepare.call_args_list}
+        self.assertEqual(prepared, set(self.data_loader._INSERT_CQL.values()))
+        for name in ("warehouse", "district", "customer", "customer_by_name", "item", "stock"):
+            self.assertIs(getattr(self.loader, f"insert_{name}").is_idempotent, True)
+
+    def test_prepared_statements_reused_per_cluster(self):
+        """A second loader on the same cluster and keyspace does not prepare again."""
+        second = self.data_loader.DataLoader(self.session, self.generator)
+        self.assertEqual(self.session.prepare.call_count, 6)
+        self.assertIs(second.insert_customer, self.loader.insert_customer)
+
+        self.session.keyspace = "other_keyspace"
+        self.data_loader.DataLoader(self.session, self.generator)
+        self.assertEqual(self.session.prepare.call_count, 12)
+
+    def test_build_session_token_aware(self):
+        """build_session routes through a token-aware default profile."""
+        dl = self.data_loader
+        session = dl.DataLoader.build_session(["10.0.0.1"], keyspace="tpcc", protocol_version=5)
+
+        kwargs = dl.Cluster.call_args.kwargs
+        self.assertEqual(kwargs["protocol_version"], 5)
+        lz4_available = importlib.util.find_spec("lz4") is not None
+        self.assertEqual(kwargs["compression"], "lz4" if lz4_available else True)
+        self.assertEqual(
+            kwargs["execution_profiles"],
+            {dl.EXEC_PROFILE_DEFAULT: dl.ExecutionProfile.return_value},
+        )
+        dl.TokenAwarePolicy.assert_called_once_with(dl.DCAwareRoundRobinPolicy.return_value)
+        dl.Cluster.return_value.set_core_connections_per_host.assert_not_called()
+        dl.Cluster.return_value.connect.assert_called_once_with("tpcc")
+        self.assertIs(session, dl.Cluster.return_value.connect.return_value)
+
+        dl.DataLoader.build_session(["10.0.0.1"], protocol_version=2)
+        dl.Cluster.return_value.set_core_connections_per_host.assert_called_once_with(
+            dl.HostDistance.LOCAL, 8
+        )
+
+    def _import_connection(self, **modules):
+        from unittest import mock
+
+        modules = {"cassandra.auth": mock.MagicMock(), **modules}
+        patcher = mock.patch.dict(sys.modules, modules)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        sys.modules.pop("connection", None)
+        self.addCleanup(sys.modules.pop, "connection", None)
+        return importlib.import_module("connection")
+
+    def test_get_session_shared(self):
+        """get_session connects once per target, on libev, and defers shutdown to exit."""
+        from unittest import mock
+
+        libev = mock.MagicMock()
+        connection = self._import_connection(
+            **{
+                "cassandra.cython_deps": mock.MagicMock(HAVE_CYTHON=True),
+                "cassandra.cmurmur3": mock.MagicMock(),
+                "cassandra.io": mock.MagicMock(),
+                "cassandra.io.libevreactor": libev,
+            }
+        )
+
+        config = {"cassandra": {"contact_points": ["10.0.0.1"], "port": 9042, "keyspace": "tpcc"}}
+        with self.assertNoLogs("connection", "WARNING"):
+            session = connection.get_session(config)
+        self.assertIs(connection.get_session(dict(config)), session)
+
+        self.data_loader.Cluster.assert_called_once()
+        self.assertIs(
+            self.data_loader.Cluster.call_args.kwargs["connection_class"], libev.LibevConnection
+        )
+
+    def test_get_session_shutdown_at_exit(self):
+        """Every cached session is kept and its cluster shut down by one exit handler."""
+        from unittest import mock
+
+        with mock.patch("atexit.register", side_effect=lambda func: func) as register:
+            connection = self._import_connection()
+        register.assert_called_once_with(connection._shutdown_sessions)
+
+        self.data_loader.Cluster.side_effect = lambda **kwargs: mock.MagicMock()
+        sessions = []
+        with mock.patch.object(connection, "driver_connection_class", return_value=None):
+            for port in range(9042, 9052):
+                config = {"cassandra": {"contact_points": ["10.0.0.1"], "port": port}}
+                sessions.append(connection.get_session(config))
+        self.assertEqual(len(connection._sessions), 10)
+        self.assertEqual(len({id(session) for session in sessions}), 10)
+
+        connection._shutdown_sessions()
+        self.assertEqual(connection._sessions, {})
+        for session in sessions:
+            session.cluster.shutdown.assert_called_once_with()
+
+    def test_driver_extensions_missing(self):
+        """Missing driver C extensions are warned about and the default reactor is kept."""
+        connection = self._import_connection()
+
+        with self.assertLogs("connection", "WARNING") as logs:
+            self.assertIsNone(connection.driver_connection_class())
+        self.assertEqual(len(logs.records), 3)
+
+    def test_generate_warehouse_rows(self):
+        """Worker rows are in bind order, and unseeded like the serial loaders."""
+        scale = (3, 4, 5, 7)
+        warehouse, districts, customers = self.data_loader._generate_warehouse_rows(2, scale)
+        self.assertEqual(warehouse[0], 2)
+        self.assertEqual([d[:2] for d in districts], [(2, d_id) for d_id in range(1, 5)])
+        self.assertEqual(len(customers), 20)
+        from unittest import mock
+
+        with mock.patch("random.seed") as seed:
+            self.data_loader._generate_warehouse_rows(2, scale)
+        seed.assert_not_called()
+
+    def test_load_all_data_serial_by_default(self):
+        """Without processes, everything is generated in this process."""
+        from unittest import mock
+
+        with mock.patch.object(self.data_loader.multiprocessing, "get_context") as get_context:
+            result = self.loader.load_all_data()
+
+        get_context.assert_not_called()
+        self.assertEqual(result, {"warehouses": 3, "districts": 12, "customers": 60, "items": 7})
+
+    def test_load_all_data_parallel(self):
+        """With several processes, warehouses are generated in a pool and streamed out."""
+        from unittest import mock
+
+        class InlinePool:
+            def __init__(self, processes):
+                self.processes = processes
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc):
+                return False
+
+            def imap_unordered(self, func, iterable, chunksize=1):
+                return map(func, iterable)
+
+        context = mock.MagicMock(Pool=mock.MagicMock(side_effect=InlinePool))
+        with mock.patch.object(
+            self.data_loader.multiprocessing, "get_context", return_value=context
+        ):
+            result = self.loader.load_all_data(processes=2)
+
+        context.Pool.assert_called_once_with(processes=2)
+        self.assertEqual(result, {"warehouses": 3, "districts": 12, "customers": 60, "items": 7})
+        self.assertEqual(len(self._rows(self.loader.insert_warehouse)), 3)
+        self.assertEqual(len(self._rows(self.loader.insert_district)), 12)
+        self.assertEqual(len(self._rows(self.loader.insert_customer_by_name)), 60)
+
+    def test_progress_rate_limited(self):
+        """Progress messages are throttled by interval and skipped below INFO."""
+        logger = self.data_loader.logger
+        with self.assertLogs(logger, "INFO") as captured:
+            quiet = self.data_loader._Progress("Loaded items", 10, interval=3600)
+            chatty = self.data_loader._Progress("Loaded rows", 10, interval=0)
+            for count in range(1, 4):
+                quiet.update(count)
+                chatty.update(count)
+        self.assertEqual(len(captured.output), 3)
+        self.assertTrue(all("Loaded rows" in line for line in captured.output))
+
+        with self.assertNoLogs(logger, "INFO"):
+            logger.setLevel("WARNING")
+            try:
+                self.data_loader._Progress("Loaded rows", 10, interval=0).update(1)
+            finally:
+                logger.setLevel("NOTSET")
+
+    def test_prefetch(self):
+        """Prefetched items arrive in order, errors propagate and early close stops the thread."""
+        prefetch = self.data_loader._prefetch
+        self.assertEqual(list(prefetch(range(50), maxsize=2)), list(range(50)))
+
+        def failing():
+            yield 1
+            raise ValueError("boom")
+
+        items = prefetch(failing())
+        self.assertEqual(next(items), 1)
+        with self.assertRaisesRegex(ValueError, "boom"):
+            next(items)
+
+        endless = prefetch(iter(int, 1), maxsize=1, name="endless")
+        self.assertEqual(next(endless), 0)
+        endless.close()
+        self.assertFalse(any(t.name == "endless" for t in threading.enumerate()))
+
+    def test_load_warehouses_concurrent(self):
+        """Warehouses are submitted concurrently in slabs, never one execute() per row."""
+        self.assertEqual(self.loader.load_warehouses(batch_size=2), 3)
+        self.session.execute.assert_not_called()
+        rows = self._rows(self.loader.insert_warehouse)
+        self.assertEqual([row[0] for row in rows], [1, 2, 3])
+        self.assertEqual(len(rows[0]), 9)
+
+    def test_flush_keeps_fixed_concurrency(self):
+        """Every slab, including the short tail, uses the same in-flight cap."""
+        self.assertEqual(self.loader.load_items(batch_size=5), 7)
+        slabs = [
+            (len(rows), kw) for stmt, rows, kw in self.submitted if stmt is self.loader.insert_item
+        ]
+        self.assertEqual([n for n, _ in slabs], [5, 2])
+        for _, kwargs in slabs:
+            self.assertEqual(kwargs, {"concurrency": 5, "results_generator": True})
+
+    def test_load_districts_concurrent(self):
+        """Districts are submitted concurrently in slabs, never one execute() per row."""
+        self.assertEqual(self.loader.load_districts(batch_size=5), 12)
+        self.session.execute.assert_not_called()
+        rows = self._rows(self.loader.insert_district)
+        self.assertEqual(len(rows), 12)
+        self.assertEqual((rows[-1][0], rows[-1][1]), (3, 4))
+
+    def test_load_customers_streams_both_tables(self):
+        """Customer rows for both tables come from one stream and describe the same customer."""
+        self.assertEqual(self.loader.load_customers(batch_size=8), 60)
+        self.session.execute.assert_not_called()
+
+        customers = self._rows(self.loader.insert_customer)
+        by_name = self._rows(self.loader.insert_customer_by_name)
+        self.assertEqual(len(customers), 60)
+        self.assertEqual(len(by_name), 60)
+        first, first_by_name = customers[0], by_name[0]
+        self.assertEqual(first[:3], (1, 1, 1))
+        # customer_by_name reorders (c_last, c_first, c_id) after the partition key
+        self.assertEqual(first_by_name[2:5], (first[5], first[3], first[2]))
+        self.assertEqual(first_by_name[5:], first[4:5] + first[6:])
+
+    def test_load_customers_unfused_for_shipped_schema(self):
+        """customer_by_name is partitioned by (c_w_id, c_d_id, c_last), so no batch is built."""
+        self._set_partition_keys(
+            customer=("c_w_id", "c_d_id"), customer_by_name=("c_w_id", "c_d_id", "c_last")
+        )
+        self.assertFalse(self.loader._customer_tables_share_partition())
+        self.loader.load_customers(batch_size=8)
+        self.data_loader.BatchStatement.assert_not_called()
+        self.assertEqual(len(self._rows(self.loader.insert_customer)), 60)
+
+    def test_load_customers_fused_when_partition_keys_match(self):
+        """Matching partition keys send each customer's two rows as one unlogged batch."""
+        self._set_partition_keys(
+            customer=("c_w_id", "c_d_id"), customer_by_name=("c_w_id", "c_d_id")
+        )
+        self.assertTrue(self.loader._customer_tables_share_partition())
+        self.assertEqual(self.loader.load_customers(batch_size=8), 60)
+
+        batch_statement = self.data_loader.BatchStatement
+        self.assertEqual(batch_statement.call_count, 60)
+        batch_statement.assert_called_with(batch_type=self.data_loader.BatchType.UNLOGGED)
+        self.assertEqual(batch_statement.return_value.add.call_count, 120)
+        self.assertEqual(self._rows(batch_statement.return_value), [()] * 60)
+        self.assertEqual(self._rows(self.loader.insert_customer), [])
+
+
+class TestDeleteQueries(unittest.TestCase):
+    """Test DeleteQueries submission patterns against a mocked driver."""
+
+    def setUp(self):
+        """Import DeleteQueries with the Cassandra driver modules mocked out."""
+        from unittest import mock
+
+        modules = {
+            name: mock.MagicMock() for name in ("cassandra", "cassandra.cluster", "cassandra.query")
+        }
+        cassandra = modules["cassandra"]
+        cassandra.DriverException = type("DriverException", (Exception,), {})
+        cassandra.RequestValidationException = type("RequestValidationException", (Exception,), {})
+        cassandra.RequestExecutionException = type("RequestExecutionException", (Exception,), {})
+        cassandra.WriteTimeout = type("WriteTimeout", (cassandra.RequestExecutionException,), {})
+        modules["cassandra.cluster"].NoHostAvailable = type("NoHostAvailable", (Exception,), {})
+        patcher = mock.patch.dict(sys.modules, modules)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        for name in ("queries.driver_errors", "queries.delete_queries"):
+            sys.modules.pop(name, None)
+            self.addCleanup(sys.modules.pop, name, None)
+        self.delete_queries = importlib.import_module("queries.delete_queries")
+        self.cassandra = cassandra
+
+        self.session = mock.MagicMock()
+        self.session.prepare.side_effect = lambda cql: mock.MagicMock(query_string=cql)
+
+        def execute_async(statement, values=None):
+            # Requests complete as soon as their callbacks are attached
+            future = mock.MagicMock()
+            future.add_callbacks.side_effect = lambda callback, errback: callback([])
+            future.result.return_value = []
+            return future
+
+        self.session.execute_async.side_effect = execute_async
+        self.queries = self.delete_queries.DeleteQueries(self.session)
+
+    def test_simple_deletes_return_futures(self):
+        """Test that D1/D2/D5 submit without waiting and the sync forms wait on them."""
+        futures = [
+            self.queries.delete_order_line_async(1, 2, 3, 4),
+            self.queries.delete_new_order_async(1, 2, 3),
+            self.queries.delete_all_order_lines_async(1, 2, 3),
+        ]
+        self.assertEqual(
+            [call.args for call in self.session.execute_async.call_args_list],
+            [
+                (self.queries.delete_order_line_stmt, [1, 2, 3, 4]),
+                (self.queries.delete_new_order_stmt, [1, 2, 3]),
+                (self.queries.delete_all_order_lines_stmt, [1, 2, 3]),
+            ],
+        )
+        for future in futures:
+            future.result.assert_not_called()
+
+        self.assertTrue(self.queries.delete_new_order(1, 2, 3))
+        self.session.execute.assert_not_called()
+
+    def test_prepared_statements_shared_per_session(self):
+        """Test that a second DeleteQueries on the same session prepares nothing."""
+        prepares = self.session.prepare.call_count
+
+        again = self.delete_queries.DeleteQueries(self.session)
+
+        self.assertEqual(self.session.prepare.call_count, prepares)
+        self.assertIs(again.delete_new_order_stmt, self.queries.delete_new_order_stmt)
+
+    def test_ad_hoc_queries_prepared_once(self):
+        """Test that queries built at call time are prepared on first use and then reused."""
+        prepares = self.session.prepare.call_count
+
+        for _ in range(3):
+            self.assertTrue(self.queries.delete_specific_column(1, 2, 3, "c_data"))
+            self.assertTrue(self.queries.delete_partition(1, 2))
+
+        self.assertEqual(self.session.prepare.call_count, prepares + 2)
+        statement = self.session.execute.call_args.args[0]
+        self.assertIn("DELETE FROM orders", statement.query_string)
+
+    def test_delete_specific_column_whitelist(self):
+        """Test that D8 only formats known customer columns into CQL."""
+        prepares = self.session.prepare.call_count
+
+        for column in ("c_id", "c_data FROM customer; DROP TABLE customer; --", "x"):
+            with self.assertRaises(ValueError):
+                self.queries.delete_specific_column(1, 2, 3, column)
+
+        self.assertEqual(self.session.prepare.call_count, prepares)
+        self.session.execute.assert_not_called()
+
+    def test_in_clause_prepared_per_arity(self):
+        """Test that D15 prepares one statement per IN-list length and binds the ids."""
+        prepares = self.session.prepare.call_count
+
+        self.assertTrue(self.queries.delete_with_in_clause(1, 2, [3, 4]))
+        first = self.session.execute.call_args.args
+        self.assertTrue(self.queries.delete_with_in_clause(1, 2, [5, 6]))
+        self.assertTrue(self.queries.delete_with_in_clause(1, 2, [7, 8, 9]))
+
+        self.assertEqual(self.session.prepare.call_count, prepares + 2)
+        self.assertIn("o_id IN (?,?)", first[0].query_string)
+        self.assertEqual(first[1], [1, 2, 3, 4])
+        self.assertIs(self.session.execute.call_args_list[1].args[0], first[0])
+        self.assertEqual(self.session.execute.call_args.args[1], [1, 2, 7, 8, 9])
+
+    def test_inventory_log_expiry(self):
+        """Test that D17 uses its prepared delete and TTL marking rewrites the whole entry."""
+        self.assertTrue(self.queries.delete_expired_records_ttl(1, 7))
+        statement, params = self.session.execute.call_args.args
+        self.assertIs(statement, self.queries.delete_expired_inventory_log_stmt)
+        self.assertEqual(params[:2], [1, 7])
+
+        self.assertTrue(self.queries.mark_for_ttl_expiration(1, 7, "2024-01-01", "ADJUST", "m"))
+        statement, params = self.session.execute.call_args.args
+        self.assertIn("INSERT INTO inventory_log", statement.query_string)
+        self.assertIn("USING TTL ?", statement.query_string)
+        self.assertEqual(params, [1, 7, "2024-01-01", "ADJUST", "m", None, 30 * 86400])
+
+    def test_new_order_conditional_non_linearizable(self):
+        """Test that linearizable=False replaces the LWT with a read and a plain delete."""
+        self.session.execute.return_value.one.return_value = None
+        result = self.queries.delete_new_order_conditional(1, 2, 3, linearizable=False)
+        self.assertFalse(result["applied"])
+        self.session.execute.assert_called_once_with(
+            self.queries.select_new_order_exists_stmt, [1, 2, 3]
+        )
+
+        self.session.execute.reset_mock()
+        self.session.execute.return_value.one.return_value = (3,)
+        result = self.queries.delete_new_order_conditional(1, 2, 3, linearizable=False)
+        self.assertTrue(result["applied"])
+        self.assertEqual(
+            [call.args[0] for call in self.session.execute.call_args_list],
+            [self.queries.select_new_order_exists_stmt, self.queries.delete_new_order_stmt],
+        )
+        self.assertEqual(
+            self.queries.select_new_order_exists_stmt.consistency_level,
+            self.delete_queries.ConsistencyLevel.ONE,
+        )
+
+    def test_old_history_records_range_delete(self):
+        """Test that old history is removed with one prepared range delete."""
+        prepares = self.session.prepare.call_count
+
+        self.assertTrue(self.queries.delete_old_history_records(1, 2, "2024-01-01", "x"))
+
+        self.assertEqual(self.session.prepare.call_count, prepares)
+        self.assertIn("h_date < ?", self.queries.delete_old_history_stmt.query_string)
+        self.session.execute.assert_called_once_with(
+            self.queries.delete_old_history_stmt, [1, 2, "2024-01-01", "x"]
+        )
+
+    def test_history_range_delete_schema(self):
+        """Test that h_date leads history's clustering key, as the D4 range delete requires."""
+        import re
+
+        schema = Path("schema/tpcc_schema.cql").read_text()
+        table = schema[schema.index("CREATE TABLE IF NOT EXISTS history") :]
+        primary_key = re.search(r"PRIMARY KEY \(\(([^)]*)\),\s*([^)]*)\)", table)
+        self.assertEqual(primary_key.group(1), "h_w_id, h_d_id, date_bucket")
+        self.assertEqual(primary_key.group(2).split(",")[0].strip(), "h_date")
+
+    def test_order_with_lines_batch_atomic(self):
+        """Test that D6 deletes orders, order_line and new_order in one LOGGED batch."""
+        prepares = self.session.prepare.call_count
+
+        self.assertTrue(self.queries.delete_order_with_lines_batch(1, 2, 3, 4))
+
+        self.assertEqual(self.session.prepare.call_count, prepares)
+        batch_statement = self.delete_queries.BatchStatement
+        self.assertNotIn("batch_type", batch_statement.call_args.kwargs)
+        self.assertEqual(
+            [call.args for call in batch_statement.return_value.add.call_args_list],
+            [
+                (self.queries.delete_order_stmt, (1, 2, 3)),
+                (self.queries.delete_all_order_lines_stmt, (1, 2, 3)),
+                (self.queries.delete_new_order_stmt, (1, 2, 3)),
+            ],
+        )
+        self.session.execute.assert_called_once_with(batch_statement.return_value)
+        self.session.execute_async.assert_not_called()
+
+    def test_batch_logged_prepares_nothing(self):
+        """Test that D18 reuses the prepared new_order delete for every row."""
+        prepares = self.session.prepare.call_count
+        deletes = [{"warehouse_id": 1, "district_id": 2, "order_id": o} for o in (3, 4)]
+
+        self.assertTrue(self.queries.delete_batch_logged(deletes))
+
+        self.assertEqual(self.session.prepare.call_count, prepares)
+        add = self.delete_queries.BatchStatement.return_value.add
+        self.assertEqual(
+            [call.args for call in add.call_args_list],
+            [(self.queries.delete_new_order_stmt, (1, 2, o)) for o in (3, 4)],
+        )
+
+    def test_batch_unlogged_uses_prepared_child(self):
+        """Test that D19 binds a prepared child into an UNLOGGED BatchStatement."""
+        deletes = [
+            {"warehouse_id": 1, "status": "NEW", "timestamp": t, "order_id": t} for t in (5, 6)
+        ]
+
+        self.assertTrue(self.queries.delete_batch_unlogged(deletes))
+
+        batch_statement = self.delete_queries.BatchStatement
+        batch_statement.assert_called_once_with(batch_type=self.delete_queries.BatchType.UNLOGGED)
+        self.assertEqual(
+            [call.args for call in batch_statement.return_value.add.call_args_list],
+            [
+                (self.queries.delete_order_tracking_stmt, (1, "NEW", 5, 5)),
+                (self.queries.delete_order_tracking_stmt, (1, "NEW", 6, 6)),
+            ],
+        )
+        self.session.execute.assert_called_once_with(batch_statement.return_value)
+
+    def test_failures_logged(self):
+        """Test that failures are logged, with a traceback unless they are write timeouts."""
+        logger_name = "queries.delete_queries"
+        self.session.execute_async.side_effect = None
+        self.session.execute_async.return_value.result.side_effect = (
+            self.cassandra.RequestExecutionException("boom")
+        )
+        with self.assertLogs(logger_name, "ERROR") as logs:
+            self.assertFalse(self.queries.delete_new_order(1, 2, 3))
+        self.assertEqual(logs.records[0].getMessage(), "delete_new_order failed w=1 d=2 o=3")
+        self.assertIsNotNone(logs.records[0].exc_info)
+
+        self.session.execute.side_effect = self.cassandra.WriteTimeout("slow")
+        with self.assertLogs(logger_name, "WARNING") as logs:
+            self.assertFalse(self.queries.delete_partition(1, 2))
+        self.assertEqual(logs.records[0].levelname, "WARNING")
+        self.assertEqual(logs.records[0].getMessage(), "delete_partition failed w=1 d=2: slow")
+        self.assertIsNone(logs.records[0].exc_info)
+
+    def test_non_driver_errors_propagate(self):
+        """Test that only driver failures become a False result; bugs are raised."""
+        self.session.execute_async.side_effect = TypeError("bad bind")
+        with self.assertRaises(TypeError):
+            self.queries.delete_new_order(1, 2, 3)
+        self.session.execute.side_effect = TypeError("bad bind")
+        with self.assertRaises(TypeError):
+            self.queries.delete_with_lwt_condition(1, 2, 3, 4)
+
+        self.session.execute.side_effect = sys.modules["cassandra.cluster"].NoHostAvailable("down")
+        with self.assertLogs("queries.delete_queries", "ERROR"):
+            result = self.queries.delete_with_lwt_condition(1, 2, 3, 4)
+        self.assertEqual(result, {"applied": False, "message": "Error: down"})
+
+    def test_multiple_new_orders_grouped_by_partition(self):
+        """Test that new orders are batched UNLOGGED per partition and singletons bound."""
+        orders = [
+            {"warehouse_id": 1, "district_id": 2, "order_id": 3},
+            {"warehouse_id": 1, "district_id": 5, "order_id": 3},
+            {"warehouse_id": 1, "district_id": 2, "order_id": 4},
+        ]
+
+        self.assertTrue(self.queries.delete_multiple_new_orders_batch(orders))
+
+        batch_statement = self.delete_queries.BatchStatement
+        batch_statement.assert_called_once()
+        self.assertEqual(
+            batch_statement.call_args.kwargs["batch_type"], self.delete_queries.BatchType.UNLOGGED
+        )
+        self.assertEqual(
+            [call.args[1] for call in batch_statement.return_value.add.call_args_list],
+            [(1, 2, 3), (1, 2, 4)],
+        )
+        stmt = self.queries.delete_new_order_stmt
+        stmt.bind.assert_called_once_with((1, 5, 3))
+        self.assertEqual(
+            [call.args for call in self.session.execute_async.call_args_list],
+            [(batch_statement.return_value,), (stmt.bind.return_value,)],
+        )
+        self.session.execute.assert_not_called()
+
+    def test_multiple_new_orders_batch_size_capped(self):
+        """Test that a large partition is split into batches of at most MAX_BATCH_SIZE."""
+        orders = [(1, 2, o) for o in range(61)]
+
+        self.assertTrue(self.queries.delete_multiple_new_orders_batch(orders))
+
+        self.assertEqual(self.delete_queries.BatchStatement.call_count, 2)
+        self.assertEqual(self.delete_queries.BatchStatement.return_value.add.call_count, 60)
+        self.queries.delete_new_order_stmt.bind.assert_called_once_with((1, 2, 60))
+        self.assertEqual(self.session.execute_async.call_count, 3)
+
+    def test_multiple_new_orders_key_formats(self):
+        """Test that D7 accepts structured arrays and tuples as well as dicts."""
+        import numpy as np
+
+        keys = [(1, 2, 3), (1, 5, 3), (1, 2, 4)]
+        stmt = self.queries.delete_new_order_stmt
+        add = self.delete_queries.BatchStatement.return_value.add
+        for orders in (np.array(keys, dtype=self.delete_queries.ORDER_KEY_DTYPE), keys):
+            stmt.bind.reset_mock()
+            add.reset_mock()
+            self.assertTrue(self.queries.delete_multiple_new_orders_batch(orders))
+            stmt.bind.assert_called_once_with((1, 5, 3))
+            self.assertEqual([call.args[1] for call in add.call_args_list], [(1, 2, 3), (1, 2, 4)])
+
+    def test_order_key_arrays_grouped_in_numpy(self):
+        """Test that array keys are grouped by partition keeping each partition's order."""
+        import numpy as np
+
+        keys = [(2, 1, 9), (1, 2, 3), (2, 1, 4), (1, 2, 1), (1, 3, 3)]
+        expected = {(1, 2): [3, 1], (1, 3): [3], (2, 1): [9, 4]}
+        group = self.delete_queries._group_order_keys
+        self.assertEqual(group(np.array(keys, dtype=self.delete_queries.ORDER_KEY_DTYPE)), expected)
+        self.assertEqual(group(np.array(keys, dtype=np.int64)), expected)
+        self.assertEqual(group(np.empty(0, dtype=self.delete_queries.ORDER_KEY_DTYPE)), {})
+
+    def test_pipelined_in_flight_window(self):
+        """Test that pipelined deletes never exceed the in-flight window."""
+        import queue
+        from unittest import mock
+
+        pending = queue.Queue()
+        inflight = []
+        peak = [0]
+
+        def execute_async(statement):
+            future = mock.MagicMock()
+            future.add_callbacks.side_effect = lambda callback, errback: pending.put(callback)
+            inflight.append(statement)
+            peak[0] = max(peak[0], len(inflight))
+            return future
+
+        def reactor():
+            # Wait for the window to fill before completing the oldest request
+            callbacks = [pending.get(timeout=5)]
+            for remaining in range(4, -1, -1):
+                if remaining:
+                    callbacks.append(pending.get(timeout=5))
+                inflight.pop(0)
+                callbacks.pop(0)([])
+
+        self.session.execute_async.side_effect = execute_async
+        orders = [{"warehouse_id": 1, "district_id": d, "order_id": 3} for d in range(5)]
+        thread = threading.Thread(target=reactor)
+        with mock.patch.object(self.delete_queries, "MAX_IN_FLIGHT", 2):
+            thread.start()
+            self.assertTrue(self.queries.delete_multiple_new_orders_batch(orders))
+        thread.join()
+
+        self.assertEqual(self.session.execute_async.call_count, 5)
+        self.assertEqual(peak[0], 2)
+        self.assertEqual(inflight, [])
+
+    def test_pipelined_failure_stops_submission(self):
+        """Test that the first errback stops submission and fails the delete."""
+        from unittest import mock
+
+        def execute_async(statement):
+            future = mock.MagicMock()
+            future.add_callbacks.side_effect = lambda callback, errback: errback(
+                self.cassandra.RequestExecutionException("unavailable")
+            )
+            return future
+
+        self.session.execute_async.side_effect = execute_async
+        orders = [{"warehouse_id": 1, "district_id": d, "order_id": 3} for d in range(5)]
+
+        with self.assertLogs("queries.delete_queries", "ERROR"):
+            self.assertFalse(self.queries.delete_multiple_new_orders_batch(orders))
+        self.assertEqual(self.session.execute_async.call_count, 1)
+
+
+class TestInsertUpdateErrors(unittest.TestCase):
+    """Test that INSERT and UPDATE batch paths only swallow driver errors."""
+
+    def setUp(self):
+        """Import InsertQueries and UpdateQueries with the Cassandra driver mocked out."""
+        from unittest import mock
+
+        modules = {
+            name: mock.MagicMock() for name in ("cassandra", "cassandra.cluster", "cassandra.query")
+        }
+        cassandra = modules["cassandra"]
+        cassandra.DriverException = type("DriverException", (Exception,), {})
+        cassandra.RequestValidationException = type("RequestValidationException", (Exception,), {})
+        cassandra.RequestExecutionException = type("RequestExecutionException", (Exception,), {})
+        cassandra.WriteTimeout = type("WriteTimeout", (cassandra.RequestExecutionException,), {})
+        modules["cassandra.cluster"].NoHostAvailable = type("NoHostAvailable", (Exception,), {})
+        patcher = mock.patch.dict(sys.modules, modules)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        names = ("queries.driver_errors", "queries.insert_queries", "queries.update_queries")
+        for name in names:
+            sys.modules.pop(name, None)
+            self.addCleanup(sys.modules.pop, name, None)
+        self.cassandra = cassandra
+
+        self.session = mock.MagicMock()
+        self.inserts = importlib.import_module("queries.insert_queries").InsertQueries(self.session)
+        self.updates = importlib.import_module("queries.update_queries").UpdateQueries(self.session)
+        self.orders = [
+            {
+                "o_w_id": 1,
+                "o_d_id": 2,
+                "o_id": o_id,
+                "o_c_id": 4,
+                "o_entry_d": None,
+                "o_ol_cnt": 5,
+                "o_all_local": 1,
+            }
+            for o_id in (3, 4)
+        ]
+        self.stock_updates = [{"quantity": 10, "warehouse_id": 1, "item_id": 7}]
+
+    def test_driver_errors_logged(self):
+        """Driver failures are logged through the module logger and reported as False."""
+        self.session.execute.side_effect = self.cassandra.RequestExecutionException("boom")
+
+        with self.assertLogs("queries.insert_queries", "ERROR") as logs:
+            self.assertFalse(self.inserts.insert_orders_batch_logged(self.orders))
+        self.assertIn("insert_orders_batch_logged failed for 2 orders", logs.output[0])
+        with self.assertLogs("queries.update_queries", "ERROR") as logs:
+            self.assertFalse(self.updates.update_batch_unlogged(self.stock_updates))
+        self.assertIn("update_batch_unlogged failed for 1 updates", logs.output[0])
+
+        self.session.execute.side_effect = self.cassandra.WriteTimeout("slow")
+        with self.assertLogs("queries.update_queries", "WARNING") as logs:
+            self.assertFalse(self.updates.update_batch_unlogged(self.stock_updates))
+        self.assertEqual(logs.records[0].levelname, "WARNING")
+
+    def test_programming_errors_propagate(self):
+        """Errors that are not from the driver are not swallowed."""
+        self.session.execute.side_effect = TypeError("bad bind")
+
+        with self.assertRaises(TypeError):
+            self.inserts.insert_orders_batch_logged(self.orders)
+        with self.assertRaises(TypeError):
+            self.updates.update_batch_unlogged(self.stock_updates)
+        with self.assertRaises(KeyError):
+            self.updates.update_batch_unlogged([{"quantity": 10}])
+
+
+class TestQueryExecutor(unittest.TestCase):
+    """Test QueryExecutor metrics against a mocked driver."""
+
+    def setUp(self):
+        """Import QueryExecutor with the Cassandra driver modules mocked out."""
+        from unittest import mock
+
+        modules = {
+            name: mock.MagicMock() for name in ("cassandra", "cassandra.cluster", "cassandra.query")
+        }
+        patcher = mock.patch.dict(sys.modules, modules)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        for name in (
+            "benchmarks.query_executor",
+            "queries.delete_queries",
+            "queries.insert_queries",
+            "queries.select_queries",
+            "queries.update_queries",
+        ):
+            sys.modules.pop(name, None)
+            self.addCleanup(sys.modules.pop, name, None)
+        query_executor = importlib.import_module("benchmarks.query_executor")
+        self.executor = query_executor.QueryExecutor(mock.MagicMock())
+
+    def test_metrics_updated_under_lock(self):
+        """Test that execute_query updates its counters only while holding the metrics lock."""
+        import types
+
+        self.executor.delete_queries.noop_delete = lambda: None
+        query_def = types.SimpleNamespace(
+            query_id="DX",
+            name="No-op delete",
+            query_type=QueryType.DELETE,
+            complexity=ComplexityLevel.SIMPLE,
+            method_name="noop_delete",
+            params_template={},
+        )
+
+        worker = threading.Thread(target=self.executor.execute_query, args=(query_def,))
+        with self.executor._metrics_lock:
+            worker.start()
+            worker.join(timeout=0.2)
+            self.assertTrue(worker.is_alive())
+            self.assertEqual(self.executor.execution_count, 0)
+        worker.join()
+
+        metrics = self.executor.get_metrics_summary()
+        self.assertEqual(metrics["total_executions"], 1)
+        self.assertEqual(metrics["successful_executions"], 1)
+
+
 class TestConfiguration(unittest.TestCase):
     """Test configuration files."""
 
@@ -266,6 +1482,18 @@ class TestConfiguration(unittest.TestCase):
             f"schema_file '{schema_file}' referenced in benchmark config not found",
         )
 
+    def test_load_yaml_matches_safe_load(self):
+        """load_yaml parses like yaml.safe_load and hands out independent copies."""
+        import yaml
+        from config_loader import load_yaml
+
+        with open("config/benchmark_config.yaml") as f:
+            expected = yaml.safe_load(f)
+        first = load_yaml("config/benchmark_config.yaml")
+        self.assertEqual(first, expected)
+        first["benchmark"] = None
+        self.assertEqual(load_yaml("config/benchmark_config.yaml"), expected)
+
 
 class TestSnapshotIsolation(unittest.TestCase):
     """Test snapshot isolation logic without a live Cassandra instance."""
@@ -279,6 +1507,7 @@ class TestSnapshotIsolation(unittest.TestCase):
             "cassandra",
             "cassandra.cluster",
             "cassandra.auth",
+            "cassandra.policies",
             "cassandra.query",
             "cassandra.concurrent",
             "numpy",
@@ -392,6 +1621,10 @@ def run_validation_tests():
     # Add all test classes
     suite.addTests(loader.loadTestsFromTestCase(TestQueryDefinitions))
     suite.addTests(loader.loadTestsFromTestCase(TestTPCCDataGenerator))
+    suite.addTests(loader.loadTestsFromTestCase(TestDataLoader))
+    suite.addTests(loader.loadTestsFromTestCase(TestDeleteQueries))
+    suite.addTests(loader.loadTestsFromTestCase(TestInsertUpdateErrors))
+    suite.addTests(loader.loadTestsFromTestCase(TestQueryExecutor))
     suite.addTests(loader.loadTestsFromTestCase(TestConfiguration))
     suite.addTests(loader.loadTestsFromTestCase(TestProjectStructure))
     suite.addTests(loader.loadTestsFromTestCase(TestSnapshotIsolation))
@@ -3,10 +3,13 @@ Query definitions for TPC-E benchmark.
 Central registry of all 80 queries (20 per type: SELECT, INSERT, UPDATE, DELETE).
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import date, datetime
 from enum import Enum
-from typing import Callable, Dict, List
+from functools import cached_property, partial
+from operator import attrgetter
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Tuple
 
 
 class QueryType(Enum):
@@ -26,7 +29,27 @@ class ComplexityLevel(Enum):
     COMPLEX = "complex"
 
 
-@dataclass
+# Enum members in definition order, for per-call count tables
+_QUERY_TYPES = tuple(QueryType)
+_COMPLEXITY_LEVELS = tuple(ComplexityLevel)
+
+
+def _static(**params: Any) -> Callable[[], Dict[str, Any]]:
+    """Params generator returning a shallow copy of a dict built once at registration."""
+    return partial(dict.copy, params)
+
+
+def _group(
+    queries: Iterable["QueryDefinition"], key: Callable[["QueryDefinition"], Any]
+) -> Mapping[Any, Tuple["QueryDefinition", ...]]:
+    """Group queries by key, preserving registration order."""
+    groups: Dict[Any, List[QueryDefinition]] = {}
+    for query in queries:
+        groups.setdefault(key(query), []).append(query)
+    return MappingProxyType({k: tuple(v) for k, v in groups.items()})
+
+
+@dataclass(slots=True, frozen=True)
 class QueryDefinition:
     """Definition of a benchmark query."""
 
@@ -37,6 +60,13 @@ class QueryDefinition:
     description: str
     method_name: str
     params_generator: Callable
+    # Plain-string copies of the enum values for per-execution results and filters
+    query_type_value: str = field(init=False, repr=False, compare=False)
+    complexity_value: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "query_type_value", self.query_type.value)
+        object.__setattr__(self, "complexity_value", self.complexity.value)
 
 
 class QueryDefinitions:
@@ -47,6 +77,16 @@ class QueryDefinitions:
         self.queries: Dict[str, QueryDefinition] = {}
         self._register_queries()
 
+    @cached_property
+    def by_type(self) -> Mapping[QueryType, Tuple[QueryDefinition, ...]]:
+        """Read-only view of the registered queries grouped by type."""
+        return _group(self.queries.values(), attrgetter("query_type"))
+
+    @cached_property
+    def by_complexity(self) -> Mapping[ComplexityLevel, Tuple[QueryDefinition, ...]]:
+        """Read-only view of the registered queries grouped by complexity."""
+        return _group(self.queries.values(), attrgetter("complexity"))
+
     def _register_queries(self) -> None:
         """Register all 80 query definitions (20 per type)."""
 
@@ -62,7 +102,7 @@ class QueryDefinitions:
             complexity=ComplexityLevel.SIMPLE,
             description="Get customer by ID - single partition lookup",
             method_name="select_customer_by_id",
-            params_generator=lambda: {"customer_id": 1},
+            params_generator=_static(customer_id=1),
         )
 
         self.queries["S2"] = QueryDefinition(
@@ -72,7 +112,7 @@ class QueryDefinitions:
             complexity=ComplexityLevel.SIMPLE,
             description="Get customer account by ID - single partition lookup",
             method_name="select_account_by_id",
-            params_generator=lambda: {"account_id": 1},
+            params_generator=_static(account_id=1),
         )
 
         self.queries["S3"] = QueryDefinition(
@@ -82,7 +122,7 @@ class QueryDefinitions:
             complexity=ComplexityLevel.SIMPLE,
             description="Get broker by ID - single partition lookup",
             method_name="select_broker_by_id",
-            params_generator=lambda: {"broker_id": 1},
+            params_generator=_static(broker_id=1),
         )
 
         self.queries["S4"] = QueryDefinition(
@@ -92,7 +132,7 @@ class QueryDefinitions:
             complexity=ComplexityLevel.SIMPLE,
             description="Get security by symbol - single partition lookup",
             method_name="select_security_by_symbol",
-            params_generator=lambda: {"symbol": "S00001"},
+            params_generator=_static(symbol="S00001"),
         )
 
         self.queries["S5"] = QueryDefinition(
@@ -102,7 +142,7 @@ class QueryDefinitions:
             complexity=ComplexityLevel.SIMPLE,
             description="Get last trade price by symbol - single partition lookup",
             method_name="select_last_trade_by_symbol",
-            params_generator=lambda: {"symbol": "S00001"},
+            params_generator=_static(symbol="S00001"),
         )
 
         self.queries["S6"] = QueryDefinition(
@@ -112,7 +152,7 @@ class QueryDefinitions:
             complexity=ComplexityLevel.SIMPLE,
             description="Get status type by ID - single partition lookup",
             method_name="select_status_type_by_id",
-            params_generator=lambda: {"status_id": "ACTV"},
+            params_generator=_static(status_id="ACTV"),
         )
 
         # --- Medium SELECT (8) ---
@@ -123,7 +163,7 @@ class QueryDefinitions:
             complexity=ComplexityLevel.MEDIUM,
             description="Get recent trades for account - denormalized table scan",
             method_name="select_trades_by_account",
-            params_generator=lambda: {"account_id": 1, "limit": 20},
+            params_generator=_static(account_id=1, limit=20),
         )
 
         self.queries["M2"] = QueryDefinition(
@@ -133,7 +173,7 @@ class QueryDefinitions:
             complexity=ComplexityLevel.MEDIUM,
             description="Get all holdings for account - multi-row partition query",
             method_name="select_holdings_by_account",
-            params_generator=lambda: {"account_id": 1, "limit": 50},
+            params_generator=_static(account_id=1, limit=50),
         )
 
         self.queries["M3"] = QueryDefinition(
@@ -143,7 +183,7 @@ class QueryDefinitions:
             complexity=ComplexityLevel.MEDIUM,
             description="Get all watch items in a watch list",
             method_name="select_watch_items_by_watchlist",
-            params_generator=lambda: {"watchlist_id": 1},
+            params_generator=_static(watchlist_id=1),
         )
 
         self.queries["M4"] = QueryDefinition(
@@ -153,11 +193,9 @@ class QueryDefinitions:
             complexity=ComplexityLevel.MEDIUM,
             description="Get daily market data for symbol over date range",
             method_name="select_daily_market_range",
-            params_generator=lambda: {
-                "symbol": "S00001",
-                "start_date": date(2024, 1, 1),
-                "end_date": date(2024, 3, 31),
-            },
+            params_generator=_static(
+                symbol="S00001", start_date=date(2024, 1, 1), end_date=date(2024, 3, 31)
+            ),
         )
 
         self.queries["M5"] = QueryDefinition(
@@ -167,7 +205,7 @@ class QueryDefinitions:
             complexity=ComplexityLevel.MEDIUM,
             description="Get companies in a given industry",
             method_name="select_companies_by_industry",
-            params_generator=lambda: {"industry_id": "IN01", "limit": 20},
+            params_generator=_static(industry_id="IN01", limit=20),
         )
 
         self.queries["M6"] = QueryDefinition(
@@ -177,7 +215,7 @@ class QueryDefinitions:
             complexity=ComplexityLevel.MEDIUM,
             description="Get financial records for a company",
             method_name="select_financial_by_company",
-            params_generator=lambda: {"company_id": 1, "limit": 8},
+            params_generator=_static(company_id=1, limit=8),
         )
 
         self.queries["M7"] = QueryDefinition(
@@ -187,7 +225,7 @@ class QueryDefinitions:
             complexity=ComplexityLevel.MEDIUM,
             description="Get holding summary for account - multi-row partition query",
             method_name="select_holding_summary_by_account",
-            params_generator=lambda: {"account_id": 1},
+            params_generator=_static(account_id=1),
         )
 
         self.queries["M8"] = QueryDefinition(
@@ -197,7 +235,7 @@ class QueryDefinitions:
             complexity=ComplexityLevel.MEDIUM,
             description="Get recent news articles for company - denormalized table",
             method_name="select_news_by_company",
-            params_generator=lambda: {"company_id": 1, "limit": 10},
+            params_generator=_static(company_id=1, limit=10),
         )
 
         # --- Complex SELECT (6) ---
@@ -208,12 +246,12 @@ class QueryDefinitions:
             complexity=ComplexityLevel.COMPLEX,
             description="Get trades for symbol within date range - clustering key range",
             method_name="select_trades_by_symbol_date_range",
-            params_generator=lambda: {
-                "symbol": "S00001",
-                "start_dts": datetime(2024, 1, 1),
-                "end_dts": datetime(2024, 3, 31),
-                "limit": 50,
-            },
+            params_generator=_static(
+                symbol="S00001",
+                start_dts=datetime(2024, 1, 1),
+                end_dts=datetime(2024, 3, 31),
+                limit=50,
+            ),
         )
 
         self.queries["C2"] = QueryDefinition(
@@ -223,7 +261,7 @@ class QueryDefinitions:
             complexity=ComplexityLevel.COMPLEX,
             description="Lookup customers by last name across partitions",
             method_name="select_customer_by_name",
-            params_generator=lambda: {"last_name": "Smith", "limit": 20},
+            params_generator=_static(last_name="Smith", limit=20),
         )
 
         self.queries["C3"] = QueryDefinition(
@@ -233,7 +271,7 @@ class QueryDefinitions:
             complexity=ComplexityLevel.COMPLEX,
             description="Filter active trades by status using secondary index",
             method_name="select_active_trades_with_filter",
-            params_generator=lambda: {"account_id": 1, "status_id": "ACTV", "limit": 20},
+            params_generator=_static(account_id=1, status_id="ACTV", limit=20),
         )
 
         self.queries["C4"] = QueryDefinition(
@@ -243,7 +281,7 @@ class QueryDefinitions:
             complexity=ComplexityLevel.COMPLEX,
             description="Get latest market feed entries - TTL table query",
             method_name="select_market_feed_latest",
-            params_generator=lambda: {"symbol": "S00001", "limit": 10},
+            params_generator=_static(symbol="S00001", limit=10),
         )
 
         self.queries["C5"] = QueryDefinition(
@@ -253,7 +291,7 @@ class QueryDefinitions:
             complexity=ComplexityLevel.COMPLEX,
             description="Calculate portfolio value from holdings and last trade price",
             method_name="select_portfolio_value",
-            params_generator=lambda: {"account_id": 1},
+            params_generator=_static(account_id=1),
         )
 
         self.queries["C6"] = QueryDefinition(
@@ -263,7 +301,7 @@ class QueryDefinitions:
             complexity=ComplexityLevel.COMPLEX,
             description="Get broker performance metrics from counter table",
             method_name="select_broker_performance",
-            params_generator=lambda: {"broker_id": 1},
+            params_generator=_static(broker_id=1),
         )
 
         # ==================================================================
@@ -278,20 +316,20 @@ class QueryDefinitions:
             complexity=ComplexityLevel.SIMPLE,
             description="Insert new customer record",
             method_name="insert_customer",
-            params_generator=lambda: {
-                "customer_id": 9_000_001,
-                "tax_id": "TAXID9001",
-                "status_id": "ACTV",
-                "last_name": "New",
-                "first_name": "Customer",
-                "middle": "T",
-                "gender": "M",
-                "tier": 1,
-                "dob": date(1980, 1, 1),
-                "address_id": 1,
-                "email1": "new@example.com",
-                "email2": "",
-            },
+            params_generator=_static(
+                customer_id=9_000_001,
+                tax_id="TAXID9001",
+                status_id="ACTV",
+                last_name="New",
+                first_name="Customer",
+                middle="T",
+                gender="M",
+                tier=1,
+                dob=date(1980, 1, 1),
+                address_id=1,
+                email1="new@example.com",
+                email2="",
+            ),
         )
 
         self.queries["I2"] = QueryDefinition(
@@ -301,14 +339,14 @@ class QueryDefinitions:
             complexity=ComplexityLevel.SIMPLE,
             description="Insert new customer account",
             method_name="insert_customer_account",
-            params_generator=lambda: {
-                "account_id": 9_000_001,
-                "broker_id": 1,
-                "customer_id": 1,
-                "name": "Test Account",
-                "tax_status": 1,
-                "balance": 10000.0,
-            },
+            params_generator=_static(
+                account_id=9_000_001,
+                broker_id=1,
+                customer_id=1,
+                name="Test Account",
+                tax_status=1,
+                balance=10000.0,
+            ),
         )
 
         self.queries["I3"] = QueryDefinition(
@@ -361,7 +399,7 @@ class QueryDefinitions:
             complexity=ComplexityLevel.SIMPLE,
             description="Insert new watch item",
             method_name="insert_watch_item",
-            params_generator=lambda: {"watchlist_id": 1, "symbol": "S00999"},
+            params_generator=_static(watchlist_id=1, symbol="S00999"),
         )
 
         # --- Medium INSERT (9) ---
@@ -405,12 +443,12 @@ class QueryDefinitions:
             complexity=ComplexityLevel.MEDIUM,
             description="Insert trade_extended record with collections",
             method_name="insert_holding_with_collections",
-            params_generator=lambda: {
-                "trade_id": 9_000_002,
-                "tags": {"equity", "growth"},
-                "notes": ["Bought at market open"],
-                "attributes": {"strategy": "momentum", "sector": "tech"},
-            },
+            params_generator=_static(
+                trade_id=9_000_002,
+                tags={"equity", "growth"},
+                notes=["Bought at market open"],
+                attributes={"strategy": "momentum", "sector": "tech"},
+            ),
         )
 
         self.queries["I9"] = QueryDefinition(
@@ -515,11 +553,7 @@ class QueryDefinitions:
             complexity=ComplexityLevel.MEDIUM,
             description="Insert account activity with JSON",
             method_name="insert_account_activity_json",
-            params_generator=lambda: {
-                "account_id": 1,
-                "activity_type": "trade",
-                "count_increment": 1,
-            },
+            params_generator=_static(account_id=1, activity_type="trade", count_increment=1),
         )
 
         # --- Complex INSERT (6) ---
@@ -556,20 +590,20 @@ class QueryDefinitions:
             complexity=ComplexityLevel.COMPLEX,
             description="Insert customer into multiple denormalized tables",
             method_name="insert_customer_denorm_multi_table",
-            params_generator=lambda: {
-                "customer_id": 9_000_003,
-                "tax_id": "TAXID9003",
-                "status_id": "ACTV",
-                "last_name": "Multi",
-                "first_name": "Table",
-                "middle": "X",
-                "gender": "F",
-                "tier": 2,
-                "dob": date(1990, 6, 15),
-                "address_id": 2,
-                "email1": "multi@example.com",
-                "email2": "multi2@example.com",
-            },
+            params_generator=_static(
+                customer_id=9_000_003,
+                tax_id="TAXID9003",
+                status_id="ACTV",
+                last_name="Multi",
+                first_name="Table",
+                middle="X",
+                gender="F",
+                tier=2,
+                dob=date(1990, 6, 15),
+                address_id=2,
+                email1="multi@example.com",
+                email2="multi2@example.com",
+            ),
         )
 
         self.queries["I17"] = QueryDefinition(
@@ -615,7 +649,7 @@ class QueryDefinitions:
             complexity=ComplexityLevel.COMPLEX,
             description="Insert with IF NOT EXISTS LWT condition",
             method_name="insert_with_lwt_condition",
-            params_generator=lambda: {"watchlist_id": 9_000_001, "customer_id": 1},
+            params_generator=_static(watchlist_id=9_000_001, customer_id=1),
         )
 
         self.queries["I20"] = QueryDefinition(
@@ -656,7 +690,7 @@ class QueryDefinitions:
             complexity=ComplexityLevel.SIMPLE,
             description="Update customer account balance",
             method_name="update_account_balance",
-            params_generator=lambda: {"account_id": 1, "new_balance": 50000.0},
+            params_generator=_static(account_id=1, new_balance=50000.0),
         )
 
         self.queries["U2"] = QueryDefinition(
@@ -666,7 +700,7 @@ class QueryDefinitions:
             complexity=ComplexityLevel.SIMPLE,
             description="Update broker commission total",
             method_name="update_broker_commission",
-            params_generator=lambda: {"broker_id": 1, "new_comm_total": 250000.0},
+            params_generator=_static(broker_id=1, new_comm_total=250000.0),
         )
 
         self.queries["U3"] = QueryDefinition(
@@ -676,7 +710,7 @@ class QueryDefinitions:
             complexity=ComplexityLevel.SIMPLE,
             description="Update holding summary quantity",
             method_name="update_holding_summary_qty",
-            params_generator=lambda: {"account_id": 1, "symbol": "S00001", "new_qty": 500},
+            params_generator=_static(account_id=1, symbol="S00001", new_qty=500),
         )
 
         self.queries["U4"] = QueryDefinition(
@@ -703,11 +737,7 @@ class QueryDefinitions:
             complexity=ComplexityLevel.MEDIUM,
             description="Update account balance with IF condition (LWT)",
             method_name="update_account_balance_conditional",
-            params_generator=lambda: {
-                "account_id": 1,
-                "new_balance": 60000.0,
-                "expected_balance": 50000.0,
-            },
+            params_generator=_static(account_id=1, new_balance=60000.0, expected_balance=50000.0),
         )
 
         self.queries["U6"] = QueryDefinition(
@@ -717,12 +747,12 @@ class QueryDefinitions:
             complexity=ComplexityLevel.MEDIUM,
             description="Batch update multiple holding summary records",
             method_name="update_holdings_batch",
-            params_generator=lambda: {
-                "updates": [
+            params_generator=_static(
+                updates=[
                     {"account_id": 1, "symbol": "S00001", "qty": 200},
                     {"account_id": 1, "symbol": "S00002", "qty": 100},
                 ]
-            },
+            ),
         )
 
         self.queries["U7"] = QueryDefinition(
@@ -732,7 +762,7 @@ class QueryDefinitions:
             complexity=ComplexityLevel.MEDIUM,
             description="Add email to customer_extended email_history list",
             method_name="update_customer_email_collections",
-            params_generator=lambda: {"customer_id": 1, "new_email": "updated@example.com"},
+            params_generator=_static(customer_id=1, new_email="updated@example.com"),
         )
 
         self.queries["U8"] = QueryDefinition(
@@ -742,10 +772,7 @@ class QueryDefinitions:
             complexity=ComplexityLevel.MEDIUM,
             description="Update preferences map in customer_extended",
             method_name="update_customer_preferences_map",
-            params_generator=lambda: {
-                "customer_id": 1,
-                "prefs_update": {"theme": "dark", "lang": "en"},
-            },
+            params_generator=_static(customer_id=1, prefs_update={"theme": "dark", "lang": "en"}),
         )
 
         self.queries["U9"] = QueryDefinition(
@@ -755,11 +782,7 @@ class QueryDefinitions:
             complexity=ComplexityLevel.MEDIUM,
             description="Update trade status with LWT IF condition",
             method_name="update_trade_status_lwt",
-            params_generator=lambda: {
-                "trade_id": 1,
-                "new_status": "COMP",
-                "expected_status": "PNDG",
-            },
+            params_generator=_static(trade_id=1, new_status="COMP", expected_status="PNDG"),
         )
 
         self.queries["U10"] = QueryDefinition(
@@ -769,7 +792,7 @@ class QueryDefinitions:
             complexity=ComplexityLevel.MEDIUM,
             description="Update multiple fields on customer account",
             method_name="update_multiple_account_fields",
-            params_generator=lambda: {"account_id": 1, "name": "Updated Account", "tax_status": 2},
+            params_generator=_static(account_id=1, name="Updated Account", tax_status=2),
         )
 
         self.queries["U11"] = QueryDefinition(
@@ -794,11 +817,7 @@ class QueryDefinitions:
             complexity=ComplexityLevel.MEDIUM,
             description="Increment broker metrics counter",
             method_name="update_broker_stats_counter",
-            params_generator=lambda: {
-                "broker_id": 1,
-                "metric_name": "total_trades",
-                "increment": 1,
-            },
+            params_generator=_static(broker_id=1, metric_name="total_trades", increment=1),
         )
 
         self.queries["U13"] = QueryDefinition(
@@ -808,11 +827,9 @@ class QueryDefinitions:
             complexity=ComplexityLevel.MEDIUM,
             description="Update trade field with USING TIMESTAMP",
             method_name="update_trade_with_timestamp",
-            params_generator=lambda: {
-                "trade_id": 1,
-                "exec_name": "NewExec",
-                "timestamp_micros": 1_700_000_000_000_000,
-            },
+            params_generator=_static(
+                trade_id=1, exec_name="NewExec", timestamp_micros=1_700_000_000_000_000
+            ),
         )
 
         self.queries["U14"] = QueryDefinition(
@@ -822,11 +839,9 @@ class QueryDefinitions:
             complexity=ComplexityLevel.MEDIUM,
             description="Update static column in portfolio_snapshot",
             method_name="update_portfolio_snapshot_static",
-            params_generator=lambda: {
-                "account_id": 1,
-                "account_name": "Premium Portfolio",
-                "account_bal": 130000.0,
-            },
+            params_generator=_static(
+                account_id=1, account_name="Premium Portfolio", account_bal=130000.0
+            ),
         )
 
         # --- Complex UPDATE (6) ---
@@ -837,12 +852,9 @@ class QueryDefinitions:
             complexity=ComplexityLevel.COMPLEX,
             description="Complex LWT update with multiple IF conditions on trade",
             method_name="update_trade_lwt_complex",
-            params_generator=lambda: {
-                "trade_id": 1,
-                "new_status": "COMP",
-                "expected_status": "PNDG",
-                "expected_type": "TMB",
-            },
+            params_generator=_static(
+                trade_id=1, new_status="COMP", expected_status="PNDG", expected_type="TMB"
+            ),
         )
 
         self.queries["U16"] = QueryDefinition(
@@ -852,12 +864,9 @@ class QueryDefinitions:
             complexity=ComplexityLevel.COMPLEX,
             description="LOGGED BATCH update account balance and holding summary",
             method_name="update_account_and_holding_batch",
-            params_generator=lambda: {
-                "account_id": 1,
-                "new_balance": 55000.0,
-                "symbol": "S00001",
-                "new_qty": 150,
-            },
+            params_generator=_static(
+                account_id=1, new_balance=55000.0, symbol="S00001", new_qty=150
+            ),
         )
 
         self.queries["U17"] = QueryDefinition(
@@ -867,7 +876,7 @@ class QueryDefinitions:
             complexity=ComplexityLevel.COMPLEX,
             description="Update set collection with TTL on trade_extended",
             method_name="update_collection_with_ttl",
-            params_generator=lambda: {"trade_id": 1, "tag": "reviewed", "ttl_seconds": 86400},
+            params_generator=_static(trade_id=1, tag="reviewed", ttl_seconds=86400),
         )
 
         self.queries["U18"] = QueryDefinition(
@@ -877,12 +886,9 @@ class QueryDefinitions:
             complexity=ComplexityLevel.COMPLEX,
             description="LWT update with multiple IF conditions on account",
             method_name="update_lwt_multiple_conditions",
-            params_generator=lambda: {
-                "account_id": 1,
-                "new_balance": 70000.0,
-                "expected_balance": 55000.0,
-                "expected_tax_st": 1,
-            },
+            params_generator=_static(
+                account_id=1, new_balance=70000.0, expected_balance=55000.0, expected_tax_st=1
+            ),
         )
 
         self.queries["U19"] = QueryDefinition(
@@ -907,13 +913,13 @@ class QueryDefinitions:
             complexity=ComplexityLevel.COMPLEX,
             description="Update multiple counter columns in account_activity",
             method_name="update_counter_columns",
-            params_generator=lambda: {
-                "account_id": 1,
-                "activity_updates": [
+            params_generator=_static(
+                account_id=1,
+                activity_updates=[
                     {"activity_type": "trade", "increment": 1},
                     {"activity_type": "order", "increment": 1},
                 ],
-            },
+            ),
         )
 
         # ==================================================================
@@ -928,7 +934,7 @@ class QueryDefinitions:
             complexity=ComplexityLevel.SIMPLE,
             description="Delete a single watch item",
             method_name="delete_watch_item",
-            params_generator=lambda: {"watchlist_id": 1, "symbol": "S00999"},
+            params_generator=_static(watchlist_id=1, symbol="S00999"),
         )
 
         self.queries["D2"] = QueryDefinition(
@@ -938,12 +944,9 @@ class QueryDefinitions:
             complexity=ComplexityLevel.SIMPLE,
             description="Delete a holding record",
             method_name="delete_holding",
-            params_generator=lambda: {
-                "account_id": 1,
-                "symbol": "S00001",
-                "dts": datetime(2024, 1, 1),
-                "trade_id": 9_000_001,
-            },
+            params_generator=_static(
+                account_id=1, symbol="S00001", dts=datetime(2024, 1, 1), trade_id=9_000_001
+            ),
         )
 
         self.queries["D3"] = QueryDefinition(
@@ -953,7 +956,7 @@ class QueryDefinitions:
             complexity=ComplexityLevel.SIMPLE,
             description="Delete a specific column value (set to null)",
             method_name="delete_specific_column",
-            params_generator=lambda: {"account_id": 1, "column": "ca_name"},
+            params_generator=_static(account_id=1, column="ca_name"),
         )
 
         # --- Medium DELETE (8) ---
@@ -964,7 +967,7 @@ class QueryDefinitions:
             complexity=ComplexityLevel.MEDIUM,
             description="Delete watch item with IF EXISTS (LWT)",
             method_name="delete_watch_item_conditional",
-            params_generator=lambda: {"watchlist_id": 1, "symbol": "S00998"},
+            params_generator=_static(watchlist_id=1, symbol="S00998"),
         )
 
         self.queries["D5"] = QueryDefinition(
@@ -974,7 +977,7 @@ class QueryDefinitions:
             complexity=ComplexityLevel.MEDIUM,
             description="Delete expired market feed entries for symbol",
             method_name="delete_old_market_feed",
-            params_generator=lambda: {"symbol": "S00001", "cutoff_dts": datetime(2023, 1, 1)},
+            params_generator=_static(symbol="S00001", cutoff_dts=datetime(2023, 1, 1)),
         )
 
         self.queries["D6"] = QueryDefinition(
@@ -984,7 +987,7 @@ class QueryDefinitions:
             complexity=ComplexityLevel.MEDIUM,
             description="Remove an element from a set collection",
             method_name="delete_set_element",
-            params_generator=lambda: {"trade_id": 1, "tag": "reviewed"},
+            params_generator=_static(trade_id=1, tag="reviewed"),
         )
 
         self.queries["D7"] = QueryDefinition(
@@ -994,7 +997,7 @@ class QueryDefinitions:
             complexity=ComplexityLevel.MEDIUM,
             description="Remove a key from a map collection",
             method_name="delete_map_key",
-            params_generator=lambda: {"customer_id": 1, "pref_key": "theme"},
+            params_generator=_static(customer_id=1, pref_key="theme"),
         )
 
         self.queries["D8"] = QueryDefinition(
@@ -1004,7 +1007,7 @@ class QueryDefinitions:
             complexity=ComplexityLevel.MEDIUM,
             description="Remove an element from a list by index",
             method_name="delete_list_index",
-            params_generator=lambda: {"customer_id": 1, "index": 0},
+            params_generator=_static(customer_id=1, index=0),
         )
 
         self.queries["D9"] = QueryDefinition(
@@ -1014,10 +1017,7 @@ class QueryDefinitions:
             complexity=ComplexityLevel.MEDIUM,
             description="Delete trade record with USING TIMESTAMP",
             method_name="delete_with_timestamp",
-            params_generator=lambda: {
-                "trade_id": 9_000_001,
-                "timestamp_micros": 1_700_000_000_000_000,
-            },
+            params_generator=_static(trade_id=9_000_001, timestamp_micros=1_700_000_000_000_000),
         )
 
         self.queries["D10"] = QueryDefinition(
@@ -1027,7 +1027,7 @@ class QueryDefinitions:
             complexity=ComplexityLevel.MEDIUM,
             description="Delete static column from portfolio_snapshot",
             method_name="delete_static_column",
-            params_generator=lambda: {"account_id": 9_000_099},
+            params_generator=_static(account_id=9_000_099),
         )
 
         self.queries["D11"] = QueryDefinition(
@@ -1037,7 +1037,7 @@ class QueryDefinitions:
             complexity=ComplexityLevel.MEDIUM,
             description="Delete all market feed records for a symbol (simulates TTL cleanup)",
             method_name="delete_expired_records_ttl",
-            params_generator=lambda: {"symbol": "S99999"},
+            params_generator=_static(symbol="S99999"),
         )
 
         # --- Complex DELETE (9) ---
@@ -1048,7 +1048,7 @@ class QueryDefinitions:
             complexity=ComplexityLevel.COMPLEX,
             description="Delete all holdings for an account (partition delete)",
             method_name="delete_all_holdings_for_account",
-            params_generator=lambda: {"account_id": 9_000_099},
+            params_generator=_static(account_id=9_000_099),
         )
 
         self.queries["D13"] = QueryDefinition(
@@ -1058,7 +1058,7 @@ class QueryDefinitions:
             complexity=ComplexityLevel.COMPLEX,
             description="LOGGED BATCH delete trade and its history",
             method_name="delete_trade_with_history_batch",
-            params_generator=lambda: {"trade_id": 9_000_001},
+            params_generator=_static(trade_id=9_000_001),
         )
 
         self.queries["D14"] = QueryDefinition(
@@ -1068,7 +1068,7 @@ class QueryDefinitions:
             complexity=ComplexityLevel.COMPLEX,
             description="Batch delete multiple watch items",
             method_name="delete_batch_watch_items",
-            params_generator=lambda: {"watchlist_id": 1, "symbols": ["S09997", "S09998", "S09999"]},
+            params_generator=_static(watchlist_id=1, symbols=["S09997", "S09998", "S09999"]),
         )
 
         self.queries["D15"] = QueryDefinition(
@@ -1078,11 +1078,9 @@ class QueryDefinitions:
             complexity=ComplexityLevel.COMPLEX,
             description="Delete trade history within a time range",
             method_name="delete_clustering_range",
-            params_generator=lambda: {
-                "trade_id": 1,
-                "start_dts": datetime(2023, 1, 1),
-                "end_dts": datetime(2023, 12, 31),
-            },
+            params_generator=_static(
+                trade_id=1, start_dts=datetime(2023, 1, 1), end_dts=datetime(2023, 12, 31)
+            ),
         )
 
         self.queries["D16"] = QueryDefinition(
@@ -1092,7 +1090,7 @@ class QueryDefinitions:
             complexity=ComplexityLevel.COMPLEX,
             description="Delete multiple watch items with IN clause",
             method_name="delete_with_in_clause",
-            params_generator=lambda: {"watchlist_id": 1, "symbols": ["S09991", "S09992", "S09993"]},
+            params_generator=_static(watchlist_id=1, symbols=["S09991", "S09992", "S09993"]),
         )
 
         self.queries["D17"] = QueryDefinition(
@@ -1102,7 +1100,7 @@ class QueryDefinitions:
             complexity=ComplexityLevel.COMPLEX,
             description="Delete watch list with IF EXISTS (LWT)",
             method_name="delete_lwt_condition",
-            params_generator=lambda: {"watchlist_id": 9_000_001},
+            params_generator=_static(watchlist_id=9_000_001),
         )
 
         self.queries["D18"] = QueryDefinition(
@@ -1112,12 +1110,12 @@ class QueryDefinitions:
             complexity=ComplexityLevel.COMPLEX,
             description="LOGGED BATCH delete across multiple tables",
             method_name="delete_batch_logged",
-            params_generator=lambda: {
-                "deletes": [
+            params_generator=_static(
+                deletes=[
                     {"table": "watch_item", "wl_id": 1, "symbol": "S09994"},
                     {"table": "watch_item", "wl_id": 1, "symbol": "S09995"},
                 ]
-            },
+            ),
         )
 
         self.queries["D19"] = QueryDefinition(
@@ -1127,10 +1125,9 @@ class QueryDefinitions:
             complexity=ComplexityLevel.COMPLEX,
             description="UNLOGGED BATCH delete of market feed entries",
             method_name="delete_batch_unlogged",
-            params_generator=lambda: {
-                "symbol": "S99998",
-                "dts_list": [datetime(2023, 6, 1), datetime(2023, 6, 2)],
-            },
+            params_generator=_static(
+                symbol="S99998", dts_list=[datetime(2023, 6, 1), datetime(2023, 6, 2)]
+            ),
         )
 
         self.queries["D20"] = QueryDefinition(
@@ -1140,24 +1137,41 @@ class QueryDefinitions:
             complexity=ComplexityLevel.COMPLEX,
             description="Delete entire partition from trade_by_account",
             method_name="delete_partition",
-            params_generator=lambda: {"account_id": 9_000_099},
+            params_generator=_static(account_id=9_000_099),
         )
 
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
 
+    def bind(
+        self, handlers: Mapping[QueryType, Any]
+    ) -> Tuple[Tuple[str, Callable[..., Any], Callable[[], Dict[str, Any]]], ...]:
+        """
+        Resolve every query's method_name against its handler once.
+
+        Args:
+            handlers: Query handler object for each query type
+
+        Returns:
+            Tuple of (query_id, bound_method, params_generator) in registry order
+        """
+        return tuple(
+            (q.query_id, getattr(handlers[q.query_type], q.method_name), q.params_generator)
+            for q in self.queries.values()
+        )
+
     def get_query(self, query_id: str) -> QueryDefinition:
         """Get query definition by ID."""
         return self.queries.get(query_id)
 
-    def get_queries_by_type(self, query_type: QueryType) -> List[QueryDefinition]:
-        """Get all queries of a specific type."""
-        return [q for q in self.queries.values() if q.query_type == query_type]
+    def get_queries_by_type(self, query_type: QueryType) -> Tuple[QueryDefinition, ...]:
+        """Get all queries of a specific type (a shared tuple; no copy is made)."""
+        return self.by_type.get(query_type, ())
 
-    def get_queries_by_complexity(self, complexity: ComplexityLevel) -> List[QueryDefinition]:
-        """Get all queries of a specific complexity."""
-        return [q for q in self.queries.values() if q.complexity == complexity]
+    def get_queries_by_complexity(self, complexity: ComplexityLevel) -> Tuple[QueryDefinition, ...]:
+        """Get all queries of a specific complexity (a shared tuple; no copy is made)."""
+        return self.by_complexity.get(complexity, ())
 
     def get_all_queries(self) -> List[QueryDefinition]:
         """Get all query definitions."""
@@ -1165,14 +1179,13 @@ class QueryDefinitions:
 
     def get_query_count_by_type(self) -> Dict[str, int]:
         """Get count of queries by type."""
-        counts = {qt.value: 0 for qt in QueryType}
-        for query in self.queries.values():
-            counts[query.query_type.value] += 1
-        return counts
+        return {qt.value: len(self.by_type.get(qt, ())) for qt in _QUERY_TYPES}
 
     def get_query_count_by_complexity(self) -> Dict[str, int]:
         """Get count of queries by complexity."""
-        counts = {cl.value: 0 for cl in ComplexityLevel}
-        for query in self.queries.values():
-            counts[query.complexity.value] += 1
-        return counts
+        return {cl.value: len(self.by_complexity.get(cl, ())) for cl in _COMPLEXITY_LEVELS}
+
+
+# Process-wide registry built once at import; share it rather than constructing
+# QueryDefinitions per runner or worker
+QUERY_REGISTRY = QueryDefinitions()
@@ -6,9 +6,9 @@ Handles query execution with metrics collection.
 import logging
 import time
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
-from benchmarks.query_definitions import QueryDefinition, QueryType
+from benchmarks.query_definitions import QueryDefinition, QueryDefinitions, QueryType
 from cassandra.cluster import Session
 from queries.delete_queries import DeleteQueries
 from queries.insert_queries import InsertQueries
@@ -33,6 +33,14 @@ class QueryExecutor:
         self.insert_queries = InsertQueries(session)
         self.update_queries = UpdateQueries(session)
         self.delete_queries = DeleteQueries(session)
+        self._handlers = {
+            QueryType.SELECT: self.select_queries,
+            QueryType.INSERT: self.insert_queries,
+            QueryType.UPDATE: self.update_queries,
+            QueryType.DELETE: self.delete_queries,
+        }
+        # Bound handler methods resolved on first use, keyed by query ID
+        self._methods: Dict[str, Callable[..., Any]] = {}
 
         self.execution_count = 0
         self.success_count = 0
@@ -61,8 +69,11 @@ class QueryExecutor:
         result = None
 
         try:
-            handler = self._get_query_handler(query_def.query_type)
-            method = getattr(handler, query_def.method_name)
+            method = self._methods.get(query_def.query_id)
+            if method is None:
+                handler = self._get_query_handler(query_def.query_type)
+                method = getattr(handler, query_def.method_name)
+                self._methods[query_def.query_id] = method
             result = method(**params)
             success = True
         except AttributeError as e:
@@ -85,8 +96,8 @@ class QueryExecutor:
         return {
             "query_id": query_def.query_id,
             "query_name": query_def.name,
-            "query_type": query_def.query_type.value,
-            "complexity": query_def.complexity.value,
+            "query_type": query_def.query_type_value,
+            "complexity": query_def.complexity_value,
             "success": success,
             "latency_ms": latency,
             "timestamp": datetime.now().isoformat(),
@@ -96,13 +107,21 @@ class QueryExecutor:
 
     def _get_query_handler(self, query_type: QueryType):
         """Get the appropriate query handler based on query type."""
-        handlers = {
-            QueryType.SELECT: self.select_queries,
-            QueryType.INSERT: self.insert_queries,
-            QueryType.UPDATE: self.update_queries,
-            QueryType.DELETE: self.delete_queries,
-        }
-        return handlers[query_type]
+        return self._handlers[query_type]
+
+    def bind(
+        self, query_defs: QueryDefinitions
+    ) -> Tuple[Tuple[str, Callable[..., Any], Callable[[], Dict[str, Any]]], ...]:
+        """
+        Pre-resolve every registered query to a bound handler method.
+
+        Args:
+            query_defs: Query registry
+
+        Returns:
+            Tuple of (query_id, bound_method, params_generator); call as fn(**gen())
+        """
+        return query_defs.bind(self._handlers)
 
     def execute_queries_batch(
         self, query_defs: List[QueryDefinition], iterations: int = 1
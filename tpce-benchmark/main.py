@@ -197,9 +197,8 @@ def run_benchmark(cassandra_config, benchmark_config, dry_run):
 @cli.command()
 def info():
     """Display TPC-E benchmark information."""
-    from benchmarks.query_definitions import QueryDefinitions
+    from benchmarks.query_definitions import QUERY_REGISTRY as query_defs
 
-    query_defs = QueryDefinitions()
     type_counts = query_defs.get_query_count_by_type()
     complexity_counts = query_defs.get_query_count_by_complexity()
 
@@ -24,6 +24,13 @@ class DeleteQueries:
     def _prep(self, key: str, cql: str):
         self._prepared[key] = self.session.prepare(cql)
 
+    def _prepared_for(self, key: str, cql: str):
+        """Return the statement prepared under key, preparing it on first use."""
+        stmt = self._prepared.get(key)
+        if stmt is None:
+            stmt = self._prepared[key] = self.session.prepare(cql)
+        return stmt
+
     def _prepare_statements(self) -> None:
         """Prepare all DELETE statements."""
         self._prep(
@@ -116,7 +123,7 @@ class DeleteQueries:
         cql = "UPDATE customer_extended SET c_email_history = c_email_history - ? " "WHERE c_id = ?"
         # We remove by specifying a dummy value; real removal requires knowing the value.
         # This demonstrates the pattern; in practice you'd need the actual value.
-        stmt = self.session.prepare(cql)
+        stmt = self._prepared_for("delete_list_index", cql)
         self.session.execute(stmt, [[""], customer_id])
 
     def delete_with_timestamp(self, trade_id: int, timestamp_micros: int) -> None:
@@ -156,7 +163,7 @@ class DeleteQueries:
         """Delete multiple watch items using IN on clustering key."""
         placeholders = ", ".join(["?" for _ in symbols])
         cql = f"DELETE FROM watch_item WHERE wi_wl_id = ? " f"AND wi_s_symb IN ({placeholders})"
-        stmt = self.session.prepare(cql)
+        stmt = self._prepared_for(f"delete_with_in_clause:{len(symbols)}", cql)
         self.session.execute(stmt, [watchlist_id] + symbols)
 
     def delete_lwt_condition(self, watchlist_id: int) -> Any:
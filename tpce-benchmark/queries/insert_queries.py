@@ -24,6 +24,13 @@ class InsertQueries:
     def _prep(self, key: str, cql: str):
         self._prepared[key] = self.session.prepare(cql)
 
+    def _prepared_for(self, key: str, cql: str):
+        """Return the statement prepared under key, preparing it on first use."""
+        stmt = self._prepared.get(key)
+        if stmt is None:
+            stmt = self._prepared[key] = self.session.prepare(cql)
+        return stmt
+
     def _prepare_statements(self) -> None:
         """Prepare all INSERT statements."""
         self._prep(
@@ -314,7 +321,7 @@ class InsertQueries:
             "INSERT INTO market_feed (mf_s_symb, mf_dts, mf_price, mf_vol) "
             "VALUES (?, ?, ?, ?) USING TIMESTAMP ?"
         )
-        stmt = self.session.prepare(cql)
+        stmt = self._prepared_for("insert_with_timestamp", cql)
         self.session.execute(stmt, [symbol, dts, price, vol, timestamp_micros])
 
     def insert_account_activity_json(
@@ -443,7 +450,7 @@ class InsertQueries:
             "(t_id, t_tags, t_notes, t_attributes, t_created, t_updated) "
             "VALUES (?, ?, ?, ?, ?, ?)"
         )
-        stmt = self.session.prepare(cql)
+        stmt = self._prepared_for("insert_trade_all_collections", cql)
         self.session.execute(stmt, [trade_id, tags, notes, attributes, created, updated])
 
     def insert_with_lwt_condition(self, watchlist_id: int, customer_id: int) -> Any:
@@ -23,6 +23,13 @@ class SelectQueries:
     def _prep(self, key: str, cql: str):
         self._prepared[key] = self.session.prepare(cql)
 
+    def _prepared_for(self, key: str, cql: str):
+        """Return the statement prepared under key, preparing it on first use."""
+        stmt = self._prepared.get(key)
+        if stmt is None:
+            stmt = self._prepared[key] = self.session.prepare(cql)
+        return stmt
+
     def _prepare_statements(self) -> None:
         """Prepare all SELECT statements."""
         self._prep("customer_by_id", "SELECT * FROM customer WHERE c_id = ?")
@@ -138,7 +145,7 @@ class SelectQueries:
     def select_customer_by_name(self, last_name: str, limit: int = 20) -> List[Any]:
         """Scan customer table filtering by last name (ALLOW FILTERING)."""
         cql = "SELECT * FROM customer WHERE c_l_name = ? LIMIT ? ALLOW FILTERING"
-        stmt = self.session.prepare(cql)
+        stmt = self._prepared_for("customer_by_name", cql)
         result = self.session.execute(stmt, [last_name, limit])
         return list(result)
 
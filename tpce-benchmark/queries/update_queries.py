@@ -24,6 +24,13 @@ class UpdateQueries:
     def _prep(self, key: str, cql: str):
         self._prepared[key] = self.session.prepare(cql)
 
+    def _prepared_for(self, key: str, cql: str):
+        """Return the statement prepared under key, preparing it on first use."""
+        stmt = self._prepared.get(key)
+        if stmt is None:
+            stmt = self._prepared[key] = self.session.prepare(cql)
+        return stmt
+
     def _prepare_statements(self) -> None:
         """Prepare all UPDATE statements."""
         self._prep(
@@ -194,7 +201,7 @@ class UpdateQueries:
         self, trade_id: int, exec_name: str, timestamp_micros: int
     ) -> None:
         cql = "UPDATE trade USING TIMESTAMP ? SET t_exec_name = ? WHERE t_id = ?"
-        stmt = self.session.prepare(cql)
+        stmt = self._prepared_for("update_trade_with_timestamp", cql)
         self.session.execute(stmt, [timestamp_micros, exec_name, trade_id])
 
     def update_portfolio_snapshot_static(
@@ -225,7 +232,7 @@ class UpdateQueries:
 
     def update_collection_with_ttl(self, trade_id: int, tag: str, ttl_seconds: int) -> None:
         cql = "UPDATE trade_extended USING TTL ? " "SET t_tags = t_tags + ? WHERE t_id = ?"
-        stmt = self.session.prepare(cql)
+        stmt = self._prepared_for("update_collection_with_ttl", cql)
         self.session.execute(stmt, [ttl_seconds, {tag}, trade_id])
 
     def update_lwt_multiple_conditions(
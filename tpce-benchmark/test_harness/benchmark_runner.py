@@ -10,7 +10,7 @@ import time
 from typing import Any, Dict, List, Optional
 
 import yaml
-from benchmarks.query_definitions import ComplexityLevel, QueryDefinitions, QueryType
+from benchmarks.query_definitions import QUERY_REGISTRY, ComplexityLevel, QueryType
 from benchmarks.query_executor import QueryExecutor
 from cassandra.auth import PlainTextAuthProvider
 from cassandra.cluster import Cluster, Session
@@ -40,7 +40,7 @@ class BenchmarkRunner:
 
         self.cluster: Optional[Cluster] = None
         self.session: Optional[Session] = None
-        self.query_definitions = QueryDefinitions()
+        self.query_definitions = QUERY_REGISTRY
         self.query_executor: Optional[QueryExecutor] = None
         self.concurrency_manager: Optional[ConcurrencyManager] = None
         self.metrics_collector: Optional[MetricsCollector] = None
@@ -3,6 +3,7 @@ Validation tests for Cassandra TPC-E Benchmark Framework.
 Tests all components without requiring a running Cassandra instance.
 """
 
+import dataclasses
 import sys
 import unittest
 from pathlib import Path
@@ -30,6 +31,13 @@ class TestQueryDefinitions(unittest.TestCase):
         queries = self.query_defs.get_all_queries()
         self.assertEqual(len(queries), 80, f"Expected 80 queries (20 per type), got {len(queries)}")
 
+    def test_module_registry(self):
+        """Test that the import-time QUERY_REGISTRY holds the full catalog."""
+        from benchmarks.query_definitions import QUERY_REGISTRY
+
+        self.assertIsInstance(QUERY_REGISTRY, QueryDefinitions)
+        self.assertEqual(QUERY_REGISTRY.queries.keys(), self.query_defs.queries.keys())
+
     def test_query_types(self):
         """Test that all query types have exactly 20 queries."""
         for query_type in QueryType:
@@ -85,6 +93,8 @@ class TestQueryDefinitions(unittest.TestCase):
             self.assertTrue(query.description)
             self.assertTrue(query.method_name)
             self.assertIsNotNone(query.params_generator)
+            self.assertEqual(query.query_type_value, query.query_type.value)
+            self.assertEqual(query.complexity_value, query.complexity.value)
 
     def test_params_generator_callable(self):
         """Test that all params_generators are callable and return dicts."""
@@ -95,6 +105,44 @@ class TestQueryDefinitions(unittest.TestCase):
                 params, dict, f"Query {query.query_id} params_generator should return a dict"
             )
 
+    def test_grouped_views(self):
+        """Test the cached, read-only by_type and by_complexity views."""
+        selects = self.query_defs.by_type[QueryType.SELECT]
+        self.assertEqual(len(selects), 20)
+        self.assertIs(self.query_defs.by_type, self.query_defs.by_type)
+        self.assertIs(selects, self.query_defs.get_queries_by_type(QueryType.SELECT))
+        self.assertTrue(
+            all(
+                q.complexity == ComplexityLevel.SIMPLE
+                for q in self.query_defs.by_complexity[ComplexityLevel.SIMPLE]
+            )
+        )
+        with self.assertRaises(TypeError):
+            self.query_defs.by_type[QueryType.SELECT] = ()
+
+    def test_bind_resolves_methods(self):
+        """Test that bind() pre-resolves method names against the handlers."""
+
+        class Handler:
+            def __getattr__(self, name):
+                return name
+
+        handlers = {query_type: Handler() for query_type in QueryType}
+        bound = self.query_defs.bind(handlers)
+
+        self.assertEqual(len(bound), 80)
+        query_id, method, params_generator = bound[0]
+        query = self.query_defs.get_query(query_id)
+        self.assertEqual(method, query.method_name)
+        self.assertIs(params_generator, query.params_generator)
+
+    def test_query_definition_immutable(self):
+        """Test that query definitions are frozen and slotted."""
+        query = self.query_defs.get_query("S1")
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            query.name = "changed"
+        self.assertFalse(hasattr(query, "__dict__"))
+
 
 class TestTPCEDataGenerator(unittest.TestCase):
     """Test TPC-E data generator."""